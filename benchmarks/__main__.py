@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, List
+
+from . import bench_commands, bench_crypto, bench_imports, bench_messages, bench_server
+from .runner import (
+    DEFAULT_THRESHOLD,
+    compare,
+    default_baseline,
+    format_time,
+    load_results,
+    measure,
+    regressions,
+    save_results,
+)
+
+SUITES: Dict[str, ModuleType] = {
+    "crypto": bench_crypto,
+    "messages": bench_messages,
+    "commands": bench_commands,
+    "server": bench_server,
+    "imports": bench_imports,
+}
+
+
+def get_input_arguments():
+    parser = ArgumentParser(
+        prog="python -m benchmarks",
+        description="Time the TVL and compare the timings with a baseline "
+        "stored for this machine.",
+    )
+    parser.add_argument(
+        "suites",
+        nargs="*",
+        choices=list(SUITES),
+        default=list(SUITES),
+        help="Suites to run. Defaults to all of them.",
+        metavar="SUITE",
+    )
+    parser.add_argument(
+        "-k",
+        "--keyword",
+        default="",
+        help="Only run the benchmarks whose name contains this string",
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        type=Path,
+        default=default_baseline(),
+        help="JSON file with the baseline timings. Defaults to %(default)s.",
+        metavar="FILE",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative slowdown above which a benchmark fails. "
+        "Defaults to %(default)s.",
+    )
+    parser.add_argument(
+        "-s",
+        "--save",
+        action="store_true",
+        help="Store the timings in the baseline file instead of comparing them",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of measurements of each benchmark. Defaults to %(default)s.",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="Minimum duration of a measurement, in seconds. "
+        "Defaults to %(default)s.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = get_input_arguments()
+
+    results: Dict[str, float] = {}
+    for suite in dict.fromkeys(args.suites):
+        for benchmark in SUITES[suite].benchmarks():
+            if args.keyword not in (name := f"{suite}.{benchmark.name}"):
+                continue
+            results[name] = measure(
+                benchmark, repeat=args.repeat, min_time=args.min_time
+            )
+            print(f"{name:<60} {format_time(results[name]):>10}")
+
+    if args.save:
+        save_results(args.baseline, {**load_results(args.baseline), **results})
+        print(f"Baseline saved to {args.baseline}.")
+        return 0
+
+    if not (baseline := load_results(args.baseline)):
+        print(f"No baseline found at {args.baseline}: run with --save first.")
+        return 0
+
+    print(f"\nComparison with {args.baseline}:")
+    comparisons = compare(baseline, results)
+    for comparison in comparisons:
+        print(
+            f"{comparison.name:<60} {format_time(comparison.baseline):>10} "
+            f"-> {format_time(comparison.current):>10} "
+            f"({comparison.ratio - 1:+.1%})"
+        )
+    failed: List[str] = [c.name for c in regressions(comparisons, args.threshold)]
+    if failed:
+        print(f"\n{len(failed)} benchmark(s) slower by more than {args.threshold:.0%}:")
+        print("\n".join(f"  {name}" for name in failed))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""L3 commands sent by the `Host` to the `Tropic01Model` through the secure
+channel, from encryption on the host side to decryption of the result."""
+
+from copy import copy
+from pathlib import Path
+from typing import Iterator, List
+
+from tvl.api.l3_api import (
+    TsL3EccKeyEraseCommand,
+    TsL3EccKeyGenerateCommand,
+    TsL3EccKeyReadCommand,
+    TsL3EccKeyStoreCommand,
+    TsL3EcdsaSignCommand,
+    TsL3EddsaSignCommand,
+    TsL3IConfigReadCommand,
+    TsL3IConfigWriteCommand,
+    TsL3MacAndDestroyCommand,
+    TsL3McounterGetCommand,
+    TsL3McounterInitCommand,
+    TsL3McounterUpdateCommand,
+    TsL3PairingKeyInvalidateCommand,
+    TsL3PairingKeyReadCommand,
+    TsL3PairingKeyWriteCommand,
+    TsL3PingCommand,
+    TsL3RandomValueGetCommand,
+    TsL3RConfigEraseCommand,
+    TsL3RConfigReadCommand,
+    TsL3RConfigWriteCommand,
+    TsL3RMemDataEraseCommand,
+    TsL3RMemDataReadCommand,
+    TsL3RMemDataWriteCommand,
+)
+from tvl.configuration_file_model import load_configuration_file
+from tvl.host.host import Host, establish_secure_channel
+from tvl.messages.l3_messages import L3Command
+from tvl.targets.model.tropic01_model import Tropic01Model
+
+from .runner import Benchmark
+
+CONFIGURATION = Path(__file__).parent.parent / "examples" / "conf.yml"
+
+_P256 = TsL3EccKeyGenerateCommand.CurveEnum.P256
+_ED25519 = TsL3EccKeyGenerateCommand.CurveEnum.ED25519
+
+SETUP_COMMANDS: List[L3Command] = [
+    TsL3PairingKeyWriteCommand(slot=3, s_hipub=b"\x01" * 32),
+    TsL3EccKeyGenerateCommand(slot=0, curve=_P256),
+    TsL3EccKeyGenerateCommand(slot=1, curve=_ED25519),
+    TsL3RMemDataWriteCommand(udata_slot=1, data=b"\x01" * 444),
+    TsL3McounterInitCommand(mcounter_index=1, mcounter_val=1000),
+]
+"""Commands sent once so that the benchmarked commands succeed"""
+
+COMMANDS: List[L3Command] = [
+    TsL3PingCommand(data_in=b"\x01" * 1024),
+    TsL3PairingKeyWriteCommand(slot=1, s_hipub=b"\x01" * 32),
+    TsL3PairingKeyReadCommand(slot=0),
+    TsL3PairingKeyInvalidateCommand(slot=3),
+    TsL3RConfigWriteCommand(address=0, value=0),
+    TsL3RConfigReadCommand(address=0),
+    TsL3RConfigEraseCommand(),
+    TsL3IConfigWriteCommand(address=0, bit_index=0),
+    TsL3IConfigReadCommand(address=0),
+    TsL3RMemDataWriteCommand(udata_slot=2, data=b"\x01" * 444),
+    TsL3RMemDataReadCommand(udata_slot=1),
+    TsL3RMemDataEraseCommand(udata_slot=1),
+    TsL3RandomValueGetCommand(n_bytes=255),
+    TsL3EccKeyGenerateCommand(slot=2, curve=_P256),
+    TsL3EccKeyStoreCommand(slot=3, curve=_ED25519, k=b"\x01" * 32),
+    TsL3EccKeyReadCommand(slot=0),
+    TsL3EccKeyEraseCommand(slot=0),
+    TsL3EcdsaSignCommand(slot=0, msg_hash=b"\x01" * 32),
+    TsL3EddsaSignCommand(slot=1, msg=b"\x01" * 1024),
+    TsL3McounterInitCommand(mcounter_index=2, mcounter_val=1000),
+    TsL3McounterUpdateCommand(mcounter_index=1),
+    TsL3McounterGetCommand(mcounter_index=1),
+    TsL3MacAndDestroyCommand(slot=0, data_in=b"\x01" * 32),
+]
+"""One command of each type, sent on the prepared model"""
+
+
+def benchmarks() -> Iterator[Benchmark]:
+    configuration = load_configuration_file(CONFIGURATION)
+    model = Tropic01Model.from_dict(configuration["model"])
+    host = Host.from_dict(configuration["host"]).set_target(model)
+    establish_secure_channel(host)
+    for command in SETUP_COMMANDS:
+        host.send_command(command)
+
+    # Each command is sent on the same state of the model and of the session
+    checkpoint = model.checkpoint()
+    session = copy(host.session)
+
+    def _setup() -> None:
+        model.restore(checkpoint)
+        host.session = copy(session)
+
+    for command in COMMANDS:
+        yield Benchmark(
+            type(command).__name__,
+            lambda c=command: host.send_command(c),
+            _setup,
+        )
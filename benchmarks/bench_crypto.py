@@ -0,0 +1,53 @@
+"""Cryptographic primitives of the model and of the secure channel."""
+
+from typing import Iterator
+
+from tvl.crypto.conversion import ints_to_bitlist
+from tvl.crypto.ecdsa import ecdsa_key_setup, ecdsa_sign
+from tvl.crypto.eddsa import eddsa_key_setup, eddsa_sign
+from tvl.crypto.encrypted_session import decrypt, encrypt
+from tvl.crypto.keccak import keccak_f, shake256
+from tvl.crypto.kmac import kmac256
+from tvl.crypto.tmac import tmac
+
+from .runner import Benchmark
+
+_KEY = bytes(range(32))
+_NONCE = bytes(12)
+_HANDSHAKE_HASH = bytes(range(32, 64))
+_MESSAGE = bytes(range(256)) * 4
+
+
+def benchmarks() -> Iterator[Benchmark]:
+    state = [[0] * 5 for _ in range(5)]
+    keccak_f1600 = keccak_f(1600)
+    yield Benchmark("keccak_f1600", lambda: keccak_f1600(state))
+
+    message_bits = ints_to_bitlist(_MESSAGE[:64])
+    key_bits = ints_to_bitlist(_KEY)
+    yield Benchmark("shake256", lambda: shake256(message_bits, 256))
+    yield Benchmark("kmac256", lambda: kmac256(key_bits, message_bits, 256, []))
+    yield Benchmark("tmac", lambda: tmac(_KEY, _MESSAGE[:64], b"\x0a"))
+
+    d, w, _ = ecdsa_key_setup(_KEY)
+    yield Benchmark("ecdsa_key_setup", lambda: ecdsa_key_setup(_KEY))
+    yield Benchmark(
+        "ecdsa_sign", lambda: ecdsa_sign(d, w, _KEY, _HANDSHAKE_HASH, b"\x00" * 4)
+    )
+
+    s, prefix, a = eddsa_key_setup(_KEY)
+    yield Benchmark("eddsa_key_setup", lambda: eddsa_key_setup(_KEY))
+    yield Benchmark(
+        "eddsa_sign",
+        lambda: eddsa_sign(s, prefix, a, _MESSAGE, _HANDSHAKE_HASH, b"\x00" * 4),
+    )
+
+    for size in (16, 256, 4096):
+        plaintext = (_MESSAGE * 4)[:size]
+        ciphertext = encrypt(_KEY, _NONCE, plaintext)
+        yield Benchmark(
+            f"aes_gcm_encrypt[{size}]", lambda p=plaintext: encrypt(_KEY, _NONCE, p)
+        )
+        yield Benchmark(
+            f"aes_gcm_decrypt[{size}]", lambda c=ciphertext: decrypt(_KEY, _NONCE, c)
+        )
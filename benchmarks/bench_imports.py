@@ -0,0 +1,63 @@
+"""Cold import of the TVL modules and cold start of the model server.
+
+Each benchmark runs a new Python interpreter, so that no module is cached.
+"""
+
+import socket
+import subprocess
+import sys
+import time
+from typing import Iterator
+
+from tvl.server.tcp_connection import TCP_DEFAULT_ADDRESS
+
+from .runner import Benchmark
+
+MODULES = (
+    "tvl.targets.model.tropic01_model",
+    "tvl.host.host",
+    "tvl.server.server",
+)
+
+SERVER_START_TIMEOUT = 10.0
+"""Maximum time for the model server to accept connections, in seconds"""
+
+
+def _import(module: str) -> None:
+    subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((TCP_DEFAULT_ADDRESS, 0))
+        return sock.getsockname()[1]
+
+
+def _start_server() -> None:
+    """Start `model_server tcp` and wait until it accepts a connection."""
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "tvl.server.server", "tcp", "-p", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    try:
+        while True:
+            try:
+                socket.create_connection((TCP_DEFAULT_ADDRESS, port)).close()
+                return
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("The model server did not start.")
+                time.sleep(0.001)
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def benchmarks() -> Iterator[Benchmark]:
+    yield Benchmark("python", lambda: _import("sys"))
+    for module in MODULES:
+        yield Benchmark(f"import[{module}]", lambda m=module: _import(m))
+    yield Benchmark("model_server_tcp_start", _start_server)
@@ -0,0 +1,44 @@
+"""Serialization of the messages of the L2 and L3 APIs."""
+
+import inspect
+from types import ModuleType
+from typing import Iterator, Type
+
+from tvl.api import l2_api, l3_api
+from tvl.messages.datafield import AUTO
+from tvl.messages.message import Message
+
+from .runner import Benchmark
+
+
+def _message_classes(module: ModuleType) -> Iterator[Type[Message]]:
+    for name, obj in vars(module).items():
+        if (
+            name.startswith("Ts")
+            and inspect.isclass(obj)
+            and issubclass(obj, Message)
+            and obj.__module__ == module.__name__
+        ):
+            yield obj
+
+
+def _largest_instance(cls: Type[Message]) -> Message:
+    """Instantiate a message with all its fields at their maximum size."""
+    return cls(
+        **{
+            name: [1] * params.max_size
+            for name, _, params in cls.specs()
+            if params.default is not AUTO
+        }
+    )
+
+
+def benchmarks() -> Iterator[Benchmark]:
+    for module in (l2_api, l3_api):
+        for cls in _message_classes(module):
+            message = _largest_instance(cls)
+            data = message.to_bytes()
+            yield Benchmark(f"{cls.__name__}.to_bytes", message.to_bytes)
+            yield Benchmark(
+                f"{cls.__name__}.from_bytes", lambda c=cls, d=data: c.from_bytes(d)
+            )
@@ -0,0 +1,62 @@
+"""Round trips to the model server over a loopback TCP connection."""
+
+import logging
+import socket
+from threading import Thread
+from typing import Iterator
+
+from tvl.api.l2_api import TsL2GetInfoRequest
+from tvl.server.internal import Buffer, TagEnum, run_server
+from tvl.server.tcp_connection import TCP_DEFAULT_ADDRESS, TCPConnection
+from tvl.targets.model.tropic01_model import Tropic01Model
+
+from .runner import Benchmark
+
+_HEADER_SIZE = Buffer.TAG_SIZE + Buffer.LENGTH_SIZE
+
+
+def _start_server(logger: logging.Logger) -> int:
+    """Serve a model in a background thread and return the listening port."""
+    connection = TCPConnection(TCP_DEFAULT_ADDRESS, 0, logger)
+    Thread(
+        target=run_server,
+        args=(connection, None, None, logger),
+        kwargs={"get_target_fn": lambda *_: (Tropic01Model(), lambda: None)},
+        daemon=True,
+    ).start()
+    return connection.server.getsockname()[1]
+
+
+def _receive_exactly(client: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        if not (chunk := client.recv(size - len(data))):
+            raise ConnectionError("Server closed the connection.")
+        data += chunk
+    return bytes(data)
+
+
+def benchmarks() -> Iterator[Benchmark]:
+    logger = logging.getLogger("benchmarks.server")
+    logger.setLevel(logging.WARNING)
+    client = socket.create_connection((TCP_DEFAULT_ADDRESS, _start_server(logger)))
+    client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _round_trip(frame: bytes) -> Buffer:
+        client.sendall(frame)
+        header = Buffer.from_bytes(_receive_exactly(client, _HEADER_SIZE))
+        header.payload = _receive_exactly(client, header.length)
+        return header
+
+    get_info = TsL2GetInfoRequest(object_id=1, block_index=0).to_bytes()
+    # Reading the empty response buffer leaves the model in the same state
+    get_response = b"\xaa" + bytes(3)
+    frames = {
+        "power_on": Buffer(TagEnum.POWER_ON),
+        "spi_transaction[get_response]": Buffer(
+            TagEnum.SPI_TRANSACTION, len(get_response), get_response
+        ),
+        "l2_request[get_info]": Buffer(TagEnum.L2_REQUEST, len(get_info), get_info),
+    }
+    for name, buffer in frames.items():
+        yield Benchmark(name, lambda f=buffer.to_bytes(): _round_trip(f))
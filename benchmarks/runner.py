@@ -0,0 +1,130 @@
+"""Measurement, storage and comparison of the benchmark timings."""
+
+import json
+import platform
+import re
+import sys
+from pathlib import Path
+from timeit import Timer
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+BASELINES_DIRECTORY = Path(__file__).parent / "baselines"
+
+DEFAULT_THRESHOLD = 0.1
+"""Relative slowdown above which a benchmark is reported as a regression"""
+
+
+class Benchmark(NamedTuple):
+    name: str
+    fn: Callable[[], Any]
+    """Statement to time"""
+    setup: Optional[Callable[[], Any]] = None
+    """Called, untimed, before each call to `fn` if set"""
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+    def is_regression(self, threshold: float) -> bool:
+        return self.ratio > 1 + threshold
+
+
+def measure(benchmark: Benchmark, *, repeat: int = 5, min_time: float = 0.05) -> float:
+    """Time a benchmark.
+
+    Without setup, the statement is called in loops long enough to last at
+    least `min_time` seconds each. With a setup, the statement is called once
+    per loop, after the setup, and the number of loops is multiplied by ten.
+
+    Args:
+        benchmark (Benchmark): the benchmark
+        repeat (int, optional): number of loops. Defaults to 5.
+        min_time (float, optional): minimum duration of a loop, in seconds.
+            Defaults to 0.05.
+
+    Returns:
+        the best time of a call to the statement, in seconds
+    """
+    if benchmark.setup is not None:
+        timer = Timer(benchmark.fn, benchmark.setup)
+        return min(timer.repeat(repeat=10 * repeat, number=1))
+
+    timer = Timer(benchmark.fn)
+    number = 1
+    while (elapsed := timer.timeit(number)) < min_time:
+        number *= 10 if elapsed < min_time / 10 else 2
+    return min([elapsed, *timer.repeat(repeat=repeat - 1, number=number)]) / number
+
+
+def machine_id() -> str:
+    """Identify the machine and Python version the baselines are valid for."""
+    version = ".".join(map(str, sys.version_info[:2]))
+    name = f"{platform.node()}-{platform.machine()}-py{version}"
+    return re.sub(r"[^\w.-]", "_", name)
+
+
+def default_baseline() -> Path:
+    return BASELINES_DIRECTORY / f"{machine_id()}.json"
+
+
+def load_results(path: Path) -> Dict[str, float]:
+    """Load the timings stored in a JSON file, empty if it does not exist."""
+    if not path.is_file():
+        return {}
+    return json.loads(path.read_text())["results"]
+
+
+def save_results(path: Path, results: Dict[str, float]) -> None:
+    """Store timings in a JSON file, along with a description of the machine.
+
+    Args:
+        path (Path): the JSON file
+        results (Dict[str, float]): timings in seconds, by benchmark name
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    content = {
+        "machine": {
+            "id": machine_id(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+        },
+        "results": dict(sorted(results.items())),
+    }
+    path.write_text(json.dumps(content, indent=2) + "\n")
+
+
+def compare(baseline: Dict[str, float], results: Dict[str, float]) -> List[Comparison]:
+    """Match the timings of the benchmarks present in both sets.
+
+    Args:
+        baseline (Dict[str, float]): reference timings
+        results (Dict[str, float]): new timings
+
+    Returns:
+        the comparisons, sorted by benchmark name
+    """
+    return [
+        Comparison(name, baseline[name], results[name])
+        for name in sorted(baseline.keys() & results.keys())
+    ]
+
+
+def regressions(
+    comparisons: Iterable[Comparison], threshold: float = DEFAULT_THRESHOLD
+) -> List[Comparison]:
+    return [c for c in comparisons if c.is_regression(threshold)]
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
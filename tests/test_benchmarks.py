@@ -0,0 +1,57 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from benchmarks.__main__ import SUITES
+from benchmarks.runner import (
+    Benchmark,
+    compare,
+    load_results,
+    measure,
+    regressions,
+    save_results,
+)
+
+
+@pytest.mark.parametrize("suite", SUITES)
+def test_suite(suite: str):
+    names: List[str] = []
+    for benchmark in SUITES[suite].benchmarks():
+        if benchmark.setup is not None:
+            benchmark.setup()
+        benchmark.fn()
+        names.append(benchmark.name)
+    assert names
+    assert len(set(names)) == len(names)
+
+
+def test_measure_with_setup():
+    calls: List[str] = []
+    benchmark = Benchmark(
+        "bench", lambda: calls.append("fn"), lambda: calls.append("setup")
+    )
+    assert measure(benchmark, repeat=2) >= 0
+    assert calls == ["setup", "fn"] * 20
+
+
+def test_measure_min_time():
+    calls: List[None] = []
+    measure(Benchmark("bench", lambda: calls.append(None)), repeat=3, min_time=0.001)
+    assert len(calls) >= 3
+
+
+def test_save_and_load(tmp_path: Path):
+    assert load_results(path := tmp_path / "baselines" / "machine.json") == {}
+    save_results(path, results := {"b": 2.0, "a": 1.0})
+    assert load_results(path) == results
+
+
+def test_regressions():
+    comparisons = compare(
+        {"a": 1.0, "b": 1.0, "c": 1.0, "removed": 1.0},
+        {"a": 1.05, "b": 1.2, "c": 0.5, "added": 1.0},
+    )
+    assert [c.name for c in comparisons] == ["a", "b", "c"]
+    assert [c.name for c in regressions(comparisons, 0.1)] == ["b"]
+    assert [c.name for c in regressions(comparisons, 0.01)] == ["a", "b"]
@@ -0,0 +1,139 @@
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from tvl.api_generator import internal as api_internal
+from tvl.api_generator.internal import (
+    compute_cache_key,
+    create_param_list,
+    generate_api_files,
+)
+from tvl.configuration_object_generator.internal import TEMPLATE_DIR as CO_TEMPLATE_DIR
+from tvl.configuration_object_generator.internal import generate_configuration_object
+from tvl.generation_cache import (
+    CACHE_FILENAME,
+    GenerationCache,
+    generator_files,
+    hash_content,
+)
+
+API_DESCRIPTION = """
+commands:
+  - name: PING
+    description: Ping
+    message_id: 0x01
+    function:
+      input:
+        - name: data_in
+          type: u8
+          min_size: 0
+          max_size: 4096
+      output:
+        - name: data_out
+          type: u8
+          min_size: 0
+          max_size: 4096
+"""
+
+CO_DESCRIPTION = """<root>
+  <reg>
+    <shorttext>CFG_START_UP</shorttext>
+    <baseaddr>0x0</baseaddr>
+    <field>
+      <shorttext>MBIST_DIS</shorttext>
+      <lowidx>1</lowidx>
+      <width>1</width>
+      <longtext>Disable MBIST</longtext>
+    </field>
+  </reg>
+</root>
+"""
+
+
+def _mtimes(*paths: Path) -> Dict[Path, int]:
+    return {path: path.stat().st_mtime_ns for path in paths}
+
+
+def test_hash_content(tmp_path: Path):
+    (path := tmp_path / "file").write_bytes(b"content")
+    assert hash_content(path) == hash_content(b"content") == hash_content("content")
+    assert hash_content("ab", "c") != hash_content("a", "bc")
+
+
+def test_cache(tmp_path: Path):
+    cache = GenerationCache()
+    output_file = tmp_path / "output"
+    assert not cache.is_up_to_date(output_file, "key")
+
+    output_file.write_text("generated")
+    cache.update(output_file, "key")
+    cache.save()
+    assert (tmp_path / CACHE_FILENAME).is_file()
+
+    cache = GenerationCache()
+    assert cache.is_up_to_date(output_file, "key")
+    assert not cache.is_up_to_date(output_file, "other key")
+    output_file.write_text("modified")
+    assert not cache.is_up_to_date(output_file, "key")
+
+
+def test_generator_sources_in_key(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    (input_file := tmp_path / "api.yml").write_text(API_DESCRIPTION)
+    (params,) = create_param_list([tmp_path / "api.py"])
+    key = compute_cache_key(input_file, params)
+    assert {"grammar.py", "internal.py"} <= {
+        path.name for path in generator_files(api_internal.TOOL)
+    }
+
+    (tool := tmp_path / "tool").mkdir()
+    (source := tool / "internal.py").write_text("# generator")
+    monkeypatch.setattr(api_internal, "TOOL", tool)
+    other_key = compute_cache_key(input_file, params)
+    assert other_key != key
+    source.write_text("# modified generator")
+    assert compute_cache_key(input_file, params) != other_key
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_api_generator(tmp_path: Path, jobs: int):
+    (input_file := tmp_path / "api.yml").write_text(API_DESCRIPTION)
+    output_files = [tmp_path / f"api{ext}" for ext in (".py", ".h", ".tex")]
+
+    generate_api_files(input_file, output_files, jobs=jobs)
+    assert "TsL2PingRequest" in output_files[0].read_text()
+    mtimes = _mtimes(*output_files)
+
+    generate_api_files(input_file, output_files, jobs=jobs)
+    assert _mtimes(*output_files) == mtimes
+
+    output_files[1].unlink()
+    generate_api_files(input_file, output_files, jobs=jobs)
+    assert output_files[1].is_file()
+    assert _mtimes(output_files[0], output_files[2]) == {
+        path: mtimes[path] for path in (output_files[0], output_files[2])
+    }
+
+    input_file.write_text(API_DESCRIPTION.replace("4096", "1024"))
+    generate_api_files(input_file, output_files, jobs=jobs)
+    assert all(
+        path.stat().st_mtime_ns != mtime
+        for path, mtime in mtimes.items()
+        if path != output_files[1]
+    )
+
+
+def test_co_generator(tmp_path: Path):
+    (input_file := tmp_path / "co.xml").write_text(CO_DESCRIPTION)
+    output_file = tmp_path / "co.py"
+    template = CO_TEMPLATE_DIR / "configuration_object_impl.py.j2"
+
+    generate_configuration_object(input_file, output_file, template)
+    assert "class CfgStartUp" in output_file.read_text()
+    mtime = output_file.stat().st_mtime_ns
+
+    generate_configuration_object(input_file, output_file, template)
+    assert output_file.stat().st_mtime_ns == mtime
+
+    generate_configuration_object(input_file, output_file, template, force=True)
+    assert output_file.stat().st_mtime_ns != mtime
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+
+import pytest
+
+from tvl.lazy_import import lazy_import
+
+HEAVY_MODULES = (
+    "asyncio",
+    "concurrent.futures.process",
+    "Crypto",
+    "cryptography.x509",
+    "http.server",
+    "serial",
+    "yaml",
+)
+
+
+@pytest.mark.parametrize(
+    "module", ["tvl.targets.model.tropic01_model", "tvl.host.host", "tvl.server.server"]
+)
+def test_heavy_modules_not_loaded(module: str):
+    # Lazy modules are registered in sys.modules but not executed yet
+    code = (
+        "import sys, types\n"
+        f"import {module}\n"
+        "print(*(m for m in sys.argv[1:]\n"
+        "    if type(sys.modules.get(m)) is types.ModuleType))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code, *HEAVY_MODULES],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    assert output.split() == []
+
+
+def test_lazy_import():
+    module = lazy_import("tvl.lazy_import")
+    assert module is sys.modules["tvl.lazy_import"]
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import("tvl.no_such_module")
+
+
+def test_base_points():
+    from tvl.crypto.ecdsa import ECDSA_G
+    from tvl.crypto.eddsa import EDDSA_B
+
+    assert ECDSA_G.x and EDDSA_B.x
@@ -1,4 +1,6 @@
 import importlib
+import subprocess
+import sys
 from typing import Any, ContextManager, Type, Union
 
 from tvl.messages import l2_messages
@@ -9,7 +11,16 @@ from contextlib import nullcontext
 
 import pytest
 
-from tvl.messages.datafield import AUTO, U16Scalar, U32Array, U64Scalar, datafield
+from tvl.messages.datafield import (
+    AUTO,
+    ArrayDataField,
+    Dtype,
+    Params,
+    U16Scalar,
+    U32Array,
+    U64Scalar,
+    datafield,
+)
 from tvl.messages.exceptions import (
     DataValueError,
     FieldAlreadyExistsError,
@@ -189,3 +200,41 @@ def test_equalities():
     assert (same := RequestTest1(f1=0x99, crc=0x1234)) == same
 
     assert RequestTest1() != "dummy"
+
+
+def test_precomputed_specs():
+    params = Params(dtype=Dtype.UINT8, min_size=0, max_size=4)
+    request_type = type(
+        "RequestTest3",
+        (L2Request,),
+        {
+            "__annotations__": {"f1": U32Array},
+            "f1": datafield(size=3),
+            "__specs__": (("f1", ArrayDataField, params),),
+        },
+        id=0x14,
+    )
+    assert not hasattr(request_type, "__specs__")
+    assert [name for name, *_ in request_type.specs()] == ["id", "length", "f1", "crc"]
+    assert request_type.specs()[2] == ("f1", ArrayDataField, params)
+    request = request_type.from_bytes(request_type(f1=[1, 2]).to_bytes())
+    assert request.f1.value == [1, 2]
+
+
+@pytest.mark.parametrize("module", ["tvl.api.l2_api", "tvl.api.l3_api"])
+def test_api_specs(module: str):
+    # The APIs are executed again without their precomputed specifications,
+    # in a new interpreter so that the messages are not registered twice.
+    code = f"""
+import re, sys, types
+import {module} as api
+
+source = re.sub(r"\\n    __specs__ = \\(\\n.*?\\n    \\)", "", open(api.__file__).read(), flags=re.S)
+assert "__specs__" not in source
+parsed = types.ModuleType("parsed")
+exec(compile(source, api.__file__, "exec"), vars(parsed))
+for name, cls in vars(api).items():
+    if hasattr(cls, "_own_specs") and cls.__module__ == api.__name__:
+        assert cls._own_specs == getattr(parsed, name)._own_specs, name
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
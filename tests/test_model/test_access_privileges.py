@@ -0,0 +1,54 @@
+import pytest
+
+from tvl.targets.model.configuration_object_impl import (
+    ConfigObjectRegisterAddressEnum,
+    ConfigurationObjectImpl,
+)
+from tvl.targets.model.internal.access_privileges import UAP_FIELDS, AccessTable
+from tvl.targets.model.tropic01_model import Tropic01Model
+
+
+@pytest.mark.parametrize(
+    "regname, index, expected",
+    [
+        pytest.param("cfg_uap_ping", None, "ping", id="command"),
+        pytest.param("cfg_uap_pairing_key_read", 2, "read_pkey_slot_2", id="pkey"),
+        pytest.param("cfg_uap_pairing_key_read", 4, None, id="pkey_out_of_range"),
+        pytest.param(
+            "cfg_uap_r_mem_data_write", 300, "write_udata_slot_256_383", id="slot"
+        ),
+        pytest.param("cfg_uap_r_mem_data_write", 512, None, id="slot_out_of_range"),
+        pytest.param("cfg_uap_r_config_read", 0x104, "r_config_read_func", id="func"),
+        pytest.param("cfg_uap_r_config_read", 0x10, "r_config_read_cfg", id="cfg"),
+        pytest.param("cfg_uap_r_config_read", 0x11, None, id="not_aligned"),
+    ],
+)
+def test_access_table(regname: str, index: int, expected: str):
+    config = ConfigurationObjectImpl(
+        **{name: i for i, name in enumerate(UAP_FIELDS, start=1)}
+    )
+    access_privileges = AccessTable(config).get(regname, index)
+
+    if expected is None:
+        assert access_privileges is None
+    else:
+        register = getattr(config, regname)
+        assert access_privileges == (expected, getattr(register, expected))
+
+
+def test_config_reused_until_modified(model: Tropic01Model):
+    access_table = model.access_table
+    config = model.config
+
+    model.power_off()
+    assert model.access_table is access_table
+    assert model.config is config
+
+    # Modifications are only taken into account after a power cycle
+    model.r_config.write(ConfigObjectRegisterAddressEnum.CFG_UAP_PING, 0x1, check=False)
+    assert model.access_table is access_table
+
+    model.power_off()
+    assert model.access_table is not access_table
+    assert model.config is not config
+    assert model.access_table.get("cfg_uap_ping") == ("ping", 0x1)
@@ -0,0 +1,107 @@
+import pytest
+
+from tvl.api.l2_api import TsL2GetInfoRequest, TsL2GetInfoResponse
+from tvl.api.l3_api import TsL3PingCommand, TsL3PingResult
+from tvl.host.adaptive_polling import AdaptivePolling
+from tvl.host.host import Host
+from tvl.host.low_level_communication import LowLevelFunctionFactory, TargetTimeoutError
+from tvl.targets.model.internal.timing import LatencyTable
+from tvl.targets.model.tropic01_model import Tropic01Model
+
+LATENCY = 1000
+
+
+@pytest.fixture()
+def model():
+    yield Tropic01Model(
+        activate_encryption=False,
+        latencies=LatencyTable(
+            {"TsL2GetInfoRequest": LATENCY}, {"TsL3PingCommand": 3 * LATENCY}
+        ),
+    )
+
+
+def test_schedule():
+    tracker = AdaptivePolling(min_retry_wait=10, max_retry_wait=50).tracker("name")
+    assert tracker.estimate() is None
+    assert tracker.schedule(5, 100, 0) == [100, 10, 20, 40, 50]
+    assert tracker.schedule(3, 100, 30) == [100, 30, 50]
+
+    tracker.record([100, 10, 20], 3)
+    assert tracker.estimate() == 120
+    assert tracker.schedule(2, 0, 0) == [120, 10]
+
+    tracker.record_timeout([100, 10, 20])
+    tracker.record([200], 1)
+    assert tracker.estimate() == 120
+    assert sorted(tracker.latencies) == [100, 120, 130]
+
+
+def test_window():
+    polling = AdaptivePolling(window=2, percentile=100)
+    tracker = polling.tracker("name")
+    for wait in (400, 200, 100):
+        tracker.record([wait], 1)
+    assert polling.estimates() == {"name": 100}
+
+
+@pytest.mark.parametrize("percentile", [-1, 101])
+def test_invalid_percentile(percentile: float):
+    with pytest.raises(ValueError):
+        AdaptivePolling(percentile=percentile)
+
+
+@pytest.mark.parametrize("use_irq", [False, True])
+def test_converges_to_latency(model: Tropic01Model, use_irq: bool):
+    polling = AdaptivePolling()
+    host = Host(
+        target=model,
+        activate_encryption=False,
+        function_factory=LowLevelFunctionFactory(
+            {TsL2GetInfoResponse: {"max_polling": 20}},
+            use_irq=use_irq,
+            polling=polling,
+        ),
+    )
+    durations = []
+    for _ in range(10):
+        start = model.clock.now
+        assert isinstance(
+            host.send_request(TsL2GetInfoRequest(object_id=1, block_index=0)),
+            TsL2GetInfoResponse,
+        )
+        durations.append(model.clock.now - start)
+
+    assert max(durations[5:]) < LATENCY * 1.05 < durations[0]
+    assert LATENCY * 0.9 < polling.estimates()["TsL2GetInfoRequest"] <= LATENCY
+
+
+def test_l3_command(model: Tropic01Model):
+    polling = AdaptivePolling()
+    host = Host(
+        target=model,
+        activate_encryption=False,
+        function_factory=LowLevelFunctionFactory(
+            {TsL3PingResult: {"max_polling": 20}}, polling=polling
+        ),
+    )
+    for _ in range(5):
+        assert isinstance(
+            host.send_command(TsL3PingCommand(data_in=b"")), TsL3PingResult
+        )
+    assert polling.estimates()["TsL3PingCommand"] > 2 * LATENCY
+
+
+def test_timeout_recorded(model: Tropic01Model):
+    polling = AdaptivePolling(min_retry_wait=10)
+    host = Host(
+        target=model,
+        activate_encryption=False,
+        function_factory=LowLevelFunctionFactory(
+            {TsL2GetInfoResponse: {"max_polling": 3}}, polling=polling
+        ),
+    )
+    request = TsL2GetInfoRequest(object_id=1, block_index=0)
+    with pytest.raises(TargetTimeoutError):
+        host.send_request(request)
+    assert polling.estimates() == {"TsL2GetInfoRequest": 30}
@@ -0,0 +1,61 @@
+import os
+
+from tvl.api.l2_api import TsL2HandshakeRequest
+from tvl.api.l3_api import TsL3PingCommand, TsL3RMemDataWriteCommand
+from tvl.constants import L3ResultFieldEnum
+from tvl.host.host import Host
+from tvl.targets.model.tropic01_model import Tropic01Model
+
+
+def test_restore_partitions(model: Tropic01Model):
+    model.r_user_data[1].write(value := os.urandom(10))
+    checkpoint = model.checkpoint()
+    before = model.to_dict()
+
+    model.r_user_data[1].erase()
+    model.r_user_data[2].write(os.urandom(10))
+    model.r_mcounters[0].init(10)
+    model.r_config.erase()
+    model.restore(checkpoint)
+    assert model.to_dict() == before
+    assert model.r_user_data[1].read() == value
+
+    # A checkpoint can be restored several times
+    model.r_user_data[1].erase()
+    model.restore(checkpoint)
+    assert model.to_dict() == before
+
+
+def test_unmodified_partitions_kept(model: Tropic01Model):
+    checkpoint = model.checkpoint()
+    partitions = model.partitions()
+
+    model.r_mcounters[0].init(10)
+    model.restore(checkpoint)
+
+    restored = model.partitions()
+    assert restored.pop("r_mcounters") is not partitions.pop("r_mcounters")
+    assert all(restored[name] is partitions[name] for name in restored)
+
+
+def test_restore_session(host: Host, model: Tropic01Model):
+    checkpoint = model.checkpoint()
+    host.send_request(
+        TsL2HandshakeRequest(
+            e_hpub=host.session.create_handshake_request(),
+            pkey_index=host.pairing_key_index,
+        )
+    )
+    session_checkpoint = model.checkpoint()
+    result = host.send_command(TsL3PingCommand(data=b"ping"))
+    assert result.result.value == L3ResultFieldEnum.OK
+
+    model.restore(checkpoint)
+    assert not model.session.is_session_valid()
+
+    # Nonces are back to their value right after the handshake
+    model.restore(session_checkpoint)
+    host.session.nonce_cmd = host.session.nonce_resp = 0
+    result = host.send_command(TsL3RMemDataWriteCommand(udata_slot=0, data=b"data"))
+    assert result.result.value == L3ResultFieldEnum.OK
+    assert model.r_user_data[0].read() == b"data"
@@ -0,0 +1,76 @@
+from typing import List, Tuple
+
+import pytest
+
+from tvl.api.l2_api import TsL2GetInfoRequest
+from tvl.api.l3_api import L3Enum, TsL3PingCommand, TsL3RandomValueGetCommand
+from tvl.host.host import Host, establish_secure_channel
+from tvl.targets.model.internal.instrumentation import Stage, Timings
+from tvl.targets.model.tropic01_model import Tropic01Model
+
+
+@pytest.fixture()
+def host(host: Host):
+    establish_secure_channel(host)
+    yield host
+
+
+def test_timings(host: Host, model: Tropic01Model):
+    model.instrumentation.add_hooks(post=(timings := Timings()))
+
+    host.send_command(TsL3PingCommand(data_in=b"\x01" * 10))
+    host.send_request(TsL2GetInfoRequest(object_id=1, block_index=0))
+
+    histograms = timings.histograms
+    assert histograms[Stage.L3_COMMAND]["TsL3PingCommand"].count == 1
+    assert histograms[Stage.L2_REQUEST]["TsL2GetInfoRequest"].count == 1
+    assert histograms[Stage.L2_REQUEST]["TsL2EncryptedCmdRequest"].count == 1
+    assert histograms[Stage.DECRYPT]["decrypt_command"].count == 1
+    assert histograms[Stage.ENCRYPT]["encrypt_result"].count == 1
+    assert histograms[Stage.PROCESS_INPUT]["process_input"].count == 2
+    assert histograms[Stage.SPI]
+    assert set(timings.to_dict()) == {str(stage) for stage in Stage}
+
+
+def test_hooks_order(host: Host, model: Tropic01Model):
+    calls: List[Tuple[str, str]] = []
+    pre = lambda stage, name: calls.append(("pre", name))
+    post = lambda stage, name, duration: calls.append(("post", name))
+    model.instrumentation.add_hooks(pre, post)
+
+    host.send_request(TsL2GetInfoRequest(object_id=1, block_index=0))
+    i = calls.index(("pre", "process_input"))
+    assert calls[i - 1 : i + 5] == [
+        ("pre", "csn_falling_edge_state"),
+        ("pre", "process_input"),
+        ("pre", "TsL2GetInfoRequest"),
+        ("post", "TsL2GetInfoRequest"),
+        ("post", "process_input"),
+        ("post", "csn_falling_edge_state"),
+    ]
+
+    model.instrumentation.remove_hooks(pre, post)
+    assert not model.instrumentation
+    nb_calls = len(calls)
+    host.send_request(TsL2GetInfoRequest(object_id=1, block_index=0))
+    assert len(calls) == nb_calls
+
+
+def test_profile_command(host: Host, model: Tropic01Model):
+    profiler = model.profile_command(L3Enum.PING, trace_memory=True)
+
+    host.send_command(TsL3RandomValueGetCommand(n_bytes=10))
+    host.send_command(TsL3PingCommand(data_in=b"\x01" * 10))
+    host.send_command(TsL3PingCommand(data_in=b"\x01" * 10))
+    profiler.detach(model.instrumentation)
+    host.send_command(TsL3PingCommand(data_in=b"\x01" * 10))
+
+    assert len(profiler.memory_diffs) == 2
+    functions = {function for _, _, function in profiler.stats().stats}  # type: ignore
+    assert "ts_l3_ping" in functions
+    assert "ts_l3_random_value_get" not in functions
+
+
+def test_profile_unknown_command(model: Tropic01Model):
+    with pytest.raises(ValueError):
+        model.profile_command(0xFF)
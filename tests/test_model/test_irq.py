@@ -0,0 +1,87 @@
+from typing import List
+
+import pytest
+
+from tvl.api.l2_api import TsL2GetInfoRequest, TsL2GetInfoResponse
+from tvl.constants import L2IdFieldEnum, L2StatusEnum
+from tvl.host.host import Host
+from tvl.host.low_level_communication import LowLevelFunctionFactory, TargetTimeoutError
+from tvl.targets.model.internal.timing import LatencyTable
+from tvl.targets.model.tropic01_model import Tropic01Model
+
+_GET_RESP = bytes([L2IdFieldEnum.GET_RESP])
+
+
+@pytest.fixture()
+def model():
+    yield Tropic01Model(
+        activate_encryption=False, latencies=LatencyTable(default_l2=100)
+    )
+
+
+def _send_request(model: Tropic01Model) -> None:
+    model.spi_drive_csn_low()
+    model.spi_send(TsL2GetInfoRequest(object_id=1, block_index=0).to_bytes())
+    assert not model.irq_state()
+    model.spi_drive_csn_high()
+
+
+def _get_resp(model: Tropic01Model) -> bytes:
+    model.spi_drive_csn_low()
+    response = model.spi_send(_GET_RESP + bytes(2 + 128 + 2))
+    model.spi_drive_csn_high()
+    return response
+
+
+def test_irq_state(model: Tropic01Model):
+    assert not model.irq_state()
+    _send_request(model)
+    assert not model.irq_state()
+    model.wait(100)
+    assert model.irq_state()
+
+    response = _get_resp(model)
+    assert response[1] == L2StatusEnum.REQ_OK
+    assert not model.irq_state()
+
+
+def _statuses(model: Tropic01Model, nb_irq_checks: int) -> List[int]:
+    _send_request(model)
+    statuses = []
+    for _ in range(3):
+        for _ in range(nb_irq_checks):
+            model.irq_state()
+        statuses.append(_get_resp(model)[1])
+    return statuses
+
+
+def test_irq_state_does_not_change_busy_sequence():
+    def _model() -> Tropic01Model:
+        return Tropic01Model(activate_encryption=False, busy_iter=[True, True, False])
+
+    statuses = _statuses(_model(), 0)
+    assert statuses == [L2StatusEnum.NO_RESP] * 2 + [L2StatusEnum.REQ_OK]
+    assert _statuses(_model(), 5) == statuses
+
+
+@pytest.mark.parametrize("use_irq", [False, True])
+def test_host_use_irq(use_irq: bool):
+    model = Tropic01Model(activate_encryption=False, busy_iter=[True, False])
+    host = Host(
+        target=model,
+        activate_encryption=False,
+        function_factory=LowLevelFunctionFactory(use_irq=use_irq),
+    )
+    response = host.send_request(TsL2GetInfoRequest(object_id=1, block_index=0))
+    assert isinstance(response, TsL2GetInfoResponse)
+    assert response.status.value == L2StatusEnum.REQ_OK
+
+
+def test_host_irq_timeout(model: Tropic01Model):
+    host = Host(
+        target=model,
+        activate_encryption=False,
+        function_factory=LowLevelFunctionFactory(use_irq=True),
+    )
+    with pytest.raises(TargetTimeoutError):
+        host.send_request(TsL2GetInfoRequest(object_id=1, block_index=0))
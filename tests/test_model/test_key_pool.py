@@ -0,0 +1,67 @@
+import time
+from typing import Any, Dict, Optional
+
+import pytest
+
+from tvl.api.l3_api import TsL3PingCommand, TsL3PingResult
+from tvl.crypto.encrypted_session import EphemeralKeyPool
+from tvl.host.host import Host, establish_secure_channel
+from tvl.targets.model.tropic01_model import Tropic01Model
+
+
+def _wait_full(pool: EphemeralKeyPool) -> None:
+    deadline = time.monotonic() + 5
+    while not pool.keys.full():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_key_pairs():
+    pool = EphemeralKeyPool(size=4)
+    key_pair = pool.get()
+    assert key_pair.private_key.public_key().public_bytes_raw() == key_pair.public_key
+    _wait_full(pool)
+    assert len({pool.get().public_key for _ in range(8)}) == 8
+    assert pool.nb_misses <= 5
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        EphemeralKeyPool(size=0)
+
+
+def test_handshakes_use_pool(model: Tropic01Model, host: Host):
+    pool = EphemeralKeyPool(size=4)
+    model.session.key_pool = host.session.key_pool = pool
+    pool.get()
+    _wait_full(pool)
+    establish_secure_channel(host)
+    assert pool.keys.qsize() == 2
+    result = host.send_command(TsL3PingCommand(data_in=b"ping"))
+    assert isinstance(result, TsL3PingResult)
+    assert result.data_out.to_bytes() == b"ping"
+
+
+def _seeded_handshake(
+    model_configuration: Dict[str, Any],
+    host_configuration: Dict[str, Any],
+    pool: Optional[EphemeralKeyPool],
+) -> bytes:
+    model = Tropic01Model.from_dict({**model_configuration, "rng_seed": 1})
+    model.session.key_pool = pool
+    with Host.from_dict({**host_configuration, "rng_seed": 2}).set_target(
+        model
+    ) as host:
+        host.session.key_pool = pool
+        establish_secure_channel(host)
+    return model.session.handshake_hash
+
+
+def test_deterministic_rng_bypasses_pool(
+    model_configuration: Dict[str, Any], host_configuration: Dict[str, Any]
+):
+    pool = EphemeralKeyPool(size=4)
+    assert _seeded_handshake(
+        model_configuration, host_configuration, pool
+    ) == _seeded_handshake(model_configuration, host_configuration, None)
+    assert pool.thread is None
@@ -0,0 +1,117 @@
+from typing import Any, Dict
+
+import pytest
+
+from tvl.api.l2_api import (
+    TsL2EncryptedCmdRequest,
+    TsL2GetInfoRequest,
+    TsL2GetInfoResponse,
+)
+from tvl.api.l3_api import TsL3PingCommand, TsL3PingResult
+from tvl.constants import L1ChipStatusFlag, L2IdFieldEnum, L2StatusEnum
+from tvl.host.host import Host, establish_secure_channel
+from tvl.host.low_level_communication import (
+    InvalidFrameError,
+    LowLevelFunctionFactory,
+    is_valid_frame,
+)
+from tvl.targets.model.tropic01_model import Tropic01Model
+
+
+class _NoisyTarget:
+    """Target garbling the responses whose index is in `errors`"""
+
+    def __init__(self, model: Tropic01Model, *errors: int) -> None:
+        self.model = model
+        self.errors = set(errors)
+        self.nb_responses = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.model, name)
+
+    def spi_send(self, data: bytes) -> bytes:
+        response = self.model.spi_send(data)
+        if (
+            data[0] == L2IdFieldEnum.GET_RESP
+            and response[0] & L1ChipStatusFlag.READY
+            and response[1] != L2StatusEnum.NO_RESP
+        ):
+            if self.nb_responses in self.errors:
+                response = response[:3] + bytes([response[3] ^ 0xFF]) + response[4:]
+            self.nb_responses += 1
+        return response
+
+
+def _host(target: _NoisyTarget, max_resend: int) -> Host:
+    return Host(
+        target=target,
+        activate_encryption=False,
+        function_factory=LowLevelFunctionFactory(
+            {TsL2GetInfoRequest: {"max_resend": max_resend}}
+        ),
+    )
+
+
+def test_is_valid_frame():
+    frame = TsL2GetInfoResponse(status=L2StatusEnum.REQ_OK, object=b"1234").to_bytes()
+    assert is_valid_frame(frame)
+    assert not is_valid_frame(frame[:-1])
+    assert not is_valid_frame(frame[:2] + b"\x00" + frame[3:])
+    assert not is_valid_frame(b"\x01\x00\x00")
+
+
+@pytest.mark.parametrize("nb_errors", [1, 2])
+def test_l2_request_resent(nb_errors: int):
+    target = _NoisyTarget(
+        Tropic01Model(activate_encryption=False, busy_iter=[False]),
+        *range(nb_errors),
+    )
+    response = _host(target, 2).send_request(
+        TsL2GetInfoRequest(object_id=1, block_index=0)
+    )
+    assert isinstance(response, TsL2GetInfoResponse)
+    assert response.has_valid_crc()
+    assert target.nb_responses == nb_errors + 1
+
+
+def test_too_many_errors():
+    target = _NoisyTarget(
+        Tropic01Model(activate_encryption=False, busy_iter=[False]), 0, 1, 2
+    )
+    with pytest.raises(InvalidFrameError):
+        _host(target, 2).send_request(TsL2GetInfoRequest(object_id=1, block_index=0))
+
+
+def test_not_checked_by_default():
+    target = _NoisyTarget(
+        Tropic01Model(activate_encryption=False, busy_iter=[False]), 0
+    )
+    response = _host(target, 0).send_request(
+        TsL2GetInfoRequest(object_id=1, block_index=0)
+    )
+    assert not response.has_valid_crc()
+    assert target.nb_responses == 1
+
+
+def test_l3_command_resent(
+    model_configuration: Dict[str, Any], host_configuration: Dict[str, Any]
+):
+    model = Tropic01Model.from_dict({**model_configuration, "busy_iter": [False]})
+    target = _NoisyTarget(model)
+    with Host.from_dict(host_configuration).set_target(target) as host:
+        establish_secure_channel(host)
+        host.function_factory = LowLevelFunctionFactory(
+            {
+                TsL2EncryptedCmdRequest: {"max_resend": 1},
+                TsL3PingCommand: {"max_resend": 1},
+            }
+        )
+        # garble the acknowledgment of the third command chunk,
+        # then the second and fourth of the five result chunks
+        start = target.nb_responses
+        target.errors = {start + 2, start + 5, start + 8}
+        data = bytes(range(256)) * 2
+        result = host.send_command(TsL3PingCommand(data_in=data))
+        assert isinstance(result, TsL3PingResult)
+        assert result.data_out.to_bytes() == data
+        assert target.nb_responses == start + 11
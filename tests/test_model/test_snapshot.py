@@ -0,0 +1,92 @@
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from tvl.api.l2_api import TsL2HandshakeRequest
+from tvl.api.l3_api import TsL3RMemDataReadCommand
+from tvl.constants import L3ResultFieldEnum
+from tvl.host.host import Host
+from tvl.targets.model.internal.snapshot import (
+    SNAPSHOT_VERSION,
+    SnapshotChecksumError,
+    SnapshotFormatError,
+    SnapshotVersionError,
+)
+from tvl.targets.model.tropic01_model import Tropic01Model
+
+
+@pytest.fixture()
+def snapshot(tmp_path: Path, model: Tropic01Model):
+    model.r_user_data[3].write(os.urandom(100))
+    model.r_mcounters[1].init(1000)
+    model.r_macandd_data.write_slot(2, os.urandom(32))
+    model.r_config.write(0, 0x12345678, check=False)
+    model.save_snapshot(path := tmp_path / "model.snap")
+    yield path
+
+
+def test_snapshot_round_trip(snapshot: Path, model: Tropic01Model):
+    loaded = Tropic01Model.load_snapshot(snapshot)
+    assert loaded.to_dict() == model.to_dict()
+
+
+def test_partitions_loaded_lazily(snapshot: Path):
+    loaded = Tropic01Model.load_snapshot(snapshot)
+    assert "r_user_data" not in vars(loaded)
+
+    assert loaded.r_user_data[3].read() != b""
+    assert "r_user_data" in vars(loaded)
+    assert "r_ecc_keys" not in vars(loaded)
+
+
+def test_loaded_model_is_functional(
+    snapshot: Path, model: Tropic01Model, host_configuration: Dict[str, Any]
+):
+    loaded = Tropic01Model.load_snapshot(snapshot)
+    with Host.from_dict(host_configuration).set_target(loaded) as host:
+        host.send_request(
+            TsL2HandshakeRequest(
+                e_hpub=host.session.create_handshake_request(),
+                pkey_index=host.pairing_key_index,
+            )
+        )
+        result = host.send_command(TsL3RMemDataReadCommand(udata_slot=3))
+
+    assert result.result.value == L3ResultFieldEnum.OK
+    assert result.data.to_bytes() == model.r_user_data[3].read()
+
+
+def test_corrupted_entry(snapshot: Path):
+    data = bytearray(snapshot.read_bytes())
+    data[-1] ^= 0xFF
+    snapshot.write_bytes(data)
+
+    with pytest.raises(SnapshotChecksumError):
+        Tropic01Model.load_snapshot(snapshot)
+
+
+@pytest.mark.parametrize(
+    "offset, value, exception",
+    [
+        pytest.param(0, b"X", SnapshotFormatError, id="magic"),
+        pytest.param(
+            8, bytes([SNAPSHOT_VERSION + 1]), SnapshotVersionError, id="version"
+        ),
+        pytest.param(20, b"X", SnapshotChecksumError, id="toc"),
+    ],
+)
+def test_invalid_snapshot(snapshot: Path, offset: int, value: bytes, exception: type):
+    data = bytearray(snapshot.read_bytes())
+    data[offset : offset + len(value)] = value
+    snapshot.write_bytes(data)
+
+    with pytest.raises(exception):
+        Tropic01Model.load_snapshot(snapshot)
+
+
+def test_not_a_snapshot(tmp_path: Path):
+    (path := tmp_path / "empty.snap").touch()
+    with pytest.raises(SnapshotFormatError):
+        Tropic01Model.load_snapshot(path)
@@ -0,0 +1,95 @@
+import pytest
+
+from tvl.api.l2_api import TsL2GetInfoRequest, TsL2GetInfoResponse
+from tvl.configuration_file_model import ModelConfigurationModel
+from tvl.constants import L2IdFieldEnum
+from tvl.host.host import Host
+from tvl.host.low_level_communication import LowLevelFunctionFactory, TargetTimeoutError
+from tvl.targets.model.internal.timing import LatencyTable
+from tvl.targets.model.tropic01_model import Tropic01Model
+
+_GET_RESP = bytes([L2IdFieldEnum.GET_RESP])
+
+
+@pytest.fixture()
+def model():
+    yield Tropic01Model(
+        activate_encryption=False,
+        latencies=LatencyTable({"TsL2GetInfoRequest": 100}, spi_byte=0.5),
+    )
+
+
+def _transfer(model: Tropic01Model, data: bytes) -> bytes:
+    model.spi_drive_csn_low()
+    response = model.spi_send(data)
+    model.spi_drive_csn_high()
+    return response
+
+
+def test_busy_until_processed(model: Tropic01Model):
+    request = TsL2GetInfoRequest(object_id=1, block_index=0).to_bytes()
+    _transfer(model, request)
+    assert model.clock.now == len(request) * 0.5
+    assert model.clock.ready_at == model.clock.now + 100
+
+    assert _transfer(model, _GET_RESP) == b"\x00"
+    assert not model.irq_state()
+
+    model.wait(100)
+    assert model.irq_state()
+    assert _transfer(model, _GET_RESP) == b"\x01"
+
+
+def test_default_latencies():
+    model = Tropic01Model(
+        activate_encryption=False, latencies=LatencyTable(default_l2=10)
+    )
+    _transfer(model, TsL2GetInfoRequest(object_id=1, block_index=0).to_bytes())
+    assert model.clock.ready_at == 10
+
+
+def test_without_latencies():
+    model = Tropic01Model(activate_encryption=False, busy_iter=[False])
+    model.wait(10)
+    assert model.clock.now == 10
+    _transfer(model, TsL2GetInfoRequest(object_id=1, block_index=0).to_bytes())
+    assert model.clock.now == 10
+    assert model.irq_state()
+    assert not model.instrumentation
+
+
+@pytest.mark.parametrize("retry_wait", [10, 50])
+def test_host_polling(model: Tropic01Model, retry_wait: int):
+    host = Host(
+        target=model,
+        activate_encryption=False,
+        function_factory=LowLevelFunctionFactory(
+            {TsL2GetInfoResponse: {"max_polling": 5, "retry_wait": retry_wait}}
+        ),
+    )
+    request = TsL2GetInfoRequest(object_id=1, block_index=0)
+    if retry_wait * 4 < 100:
+        with pytest.raises(TargetTimeoutError):
+            host.send_request(request)
+        return
+    assert isinstance(host.send_request(request), TsL2GetInfoResponse)
+
+
+def test_to_dict(model: Tropic01Model):
+    configuration = model.to_dict()
+    latencies = configuration["latencies"]
+    assert latencies["l2"] == {"TsL2GetInfoRequest": 100}
+    ModelConfigurationModel.parse_obj(
+        {"s_t_priv": bytes(32), "s_t_pub": bytes(32), "latencies": latencies}
+    )
+
+    model = Tropic01Model.from_dict(configuration)
+    assert model.clock.latencies is not None
+    assert model.clock.latencies.to_dict() == latencies
+
+
+def test_checkpoint(model: Tropic01Model):
+    checkpoint = model.checkpoint()
+    model.wait(100)
+    model.restore(checkpoint)
+    assert model.clock.now == 0
@@ -29,6 +29,8 @@ def test_configuration_register(iteration: int):
         x = ConfigObjectField(offset, width)
 
     class _ConfigObject(ConfigurationObject):
+        REGISTERS = {"reg": 0}
+
         def __init__(self, **kwargs: int) -> None:
             self.reg = _Register(self, 0)
             super().__init__(**kwargs)
@@ -137,3 +139,26 @@ def test_configuration_object_bytes():
     c2 = ConfigurationObjectImpl.from_bytes(c1b2)
     assert c2 == c1
     assert c2.to_bytes() == c1b2
+
+
+def test_configuration_object_modifications():
+    c1 = ConfigurationObjectImpl.from_dict({"cfg_uap_pairing_key_write": 0})
+    assert c1.modifications == 0
+
+    c1.write_bit(ConfigObjectRegisterAddressEnum.CFG_UAP_PAIRING_KEY_READ, 0)
+    assert c1.modifications == 1
+
+    c1.erase()
+    assert c1.modifications == 2
+
+
+def test_configuration_object_layout():
+    c1 = ConfigurationObjectImpl()
+    c1.write(ConfigObjectRegisterAddressEnum.CFG_UAP_PING, 0x01020304)
+
+    address = ConfigObjectRegisterAddressEnum.CFG_UAP_PING
+    assert c1.to_bytes()[address : address + REGISTER_SIZE_BYTES] == b"\x01\x02\x03\x04"
+    assert set(ConfigurationObjectImpl.REGISTERS) == {
+        name for name, _ in c1.registers()
+    }
+    assert not hasattr(c1, "__dict__")
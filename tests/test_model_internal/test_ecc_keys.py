@@ -184,3 +184,17 @@ def test_dict():
 
     assert ecc.slots[slot].to_dict() == key_init_dict  # type: ignore
     assert ecc.to_dict() == ecc_init_dict
+
+
+def test_modifications():
+    ecc = EccKeys()
+    assert ecc.modifications == 0
+
+    ecc.store(slot := _get_int(), EdDSAKeyMemLayout.CURVE, _gen_key())
+    assert ecc.modifications == 1
+
+    ecc.read(slot)
+    assert ecc.modifications == 1
+
+    ecc.erase(slot)
+    assert ecc.modifications == 2
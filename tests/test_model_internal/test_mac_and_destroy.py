@@ -26,6 +26,10 @@ def test_slot_read():
 
     value = macandd_data.read_slot(slot)
     assert len(value) == MACANDD_KMAC_OUTPUT_LEN
+    # Reading a slot does not store it
+    assert not macandd_data.slots.items()
+
+    macandd_data.write_slot(slot, value)
     assert macandd_data.slots.items()
 
     value = macandd_data.read_slot(slot, erase=True)
@@ -39,7 +43,7 @@ def test_key_read():
 
     value = macandd_data.read_key(slot)
     assert len(value) == MACANDD_KEY_LEN
-    assert macandd_data.keys.items()
+    assert not macandd_data.keys.items()
 
 
 def test_slot_write():
@@ -83,3 +83,35 @@ def test_dict():
     mcounters = UserDataPartition.from_dict(user_data_dict)
     assert mcounters.to_dict() == user_data_dict
     assert mcounters[slot].to_dict() == user_data_slot_dict
+
+
+def test_modifications():
+    partition = UserDataPartition.from_dict({0: {"free": False, "value": b"1"}})
+    assert partition.modifications == 0
+
+    assert partition[1].read() == b""
+    assert partition.modifications == 0
+
+    partition[1].write(b"2")
+    assert partition.modifications > 0
+
+    modifications = partition.modifications
+    partition[0].erase()
+    assert partition.modifications > modifications
+
+
+def test_slots_stored_on_write():
+    partition = UserDataPartition()
+    assert all(partition[slot].read() == b"" for slot in range(512))
+    assert partition.to_dict() == {}
+
+    slot = partition[3]
+    assert partition[3] is slot
+    slot.write(b"3")
+    assert partition.to_dict() == {3: {"free": False, "value": b"3"}}
+
+    # A slot removed from the partition is not stored back when modified
+    del partition[3]
+    slot.erase()
+    assert partition.to_dict() == {}
+    assert not hasattr(slot, "__dict__")
@@ -1,4 +1,7 @@
-from tvl.random_number_generator import RandomNumberGenerator
+import pytest
+
+from tvl.random_number_generator import DRBG_BACKENDS, POOL_SIZE, RandomNumberGenerator
+from tvl.targets.model.tropic01_model import Tropic01Model
 
 
 def test_value_is_deterministic_when_initialized_with_not_none():
@@ -87,3 +90,40 @@ def test_value_is_random_when_initialized_with_none():
             v16 == b"deadbeefdeadbeef",
         )
     )
+
+
+@pytest.mark.parametrize("backend", DRBG_BACKENDS)
+def test_value_is_reproducible_when_seeded(backend: str):
+    rng1 = RandomNumberGenerator(seed=1234, backend=backend)
+    rng2 = RandomNumberGenerator(seed=1234, backend=backend)
+    rng3 = RandomNumberGenerator(seed=1235, backend=backend)
+
+    sizes = [1, 32, POOL_SIZE, 3 * POOL_SIZE, 7]
+    values = [rng1.urandom(size) for size in sizes]
+    assert [len(value) for value in values] == sizes
+    assert b"".join(values) == rng2.urandom(sum(sizes))
+    assert values != [rng3.urandom(size) for size in sizes]
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        RandomNumberGenerator(seed=0, backend="unknown")
+
+
+def test_negative_seed():
+    with pytest.raises(ValueError):
+        RandomNumberGenerator(seed=-1)
+
+
+def test_debug_value_swapped():
+    rng = RandomNumberGenerator(b"\x01\x02\x03")
+    assert rng.urandom(7, swap_endianness=True) == b"\x03\x02\x01\x03\x02\x01\x03"
+
+
+def test_seeded_models_are_reproducible():
+    model1 = Tropic01Model(rng_seed=42)
+    model2 = Tropic01Model(rng_seed=42)
+
+    assert model1.spi_fsm.busy_iter == model2.spi_fsm.busy_iter
+    assert model1.trng2.urandom(100) == model2.trng2.urandom(100)
+    assert Tropic01Model.from_dict(model1.to_dict()).trng2.seed == 42
@@ -0,0 +1,214 @@
+import logging
+from typing import Any, List
+
+import pytest
+
+from tvl.api.l2_api import TsL2GetInfoRequest, TsL2GetInfoResponse
+from tvl.api.l3_api import TsL3PingCommand, TsL3PingResult
+from tvl.constants import L2IdFieldEnum, L2StatusEnum, L3ResultFieldEnum
+from tvl.host.host import Host
+from tvl.host.protocols import LLSendL2RequestFn, LLSendL3CommandFn
+from tvl.server.internal import Buffer, IrqNotifier, TagEnum, process, split_l2_frames
+from tvl.targets.model.internal.timing import LatencyTable
+from tvl.targets.model.tropic01_model import Tropic01Model
+
+LOGGER = logging.getLogger("server")
+
+
+class _CompoundTagsDriver:
+    """Target driver sending each request/command as a single frame"""
+
+    def __init__(self, model: Tropic01Model) -> None:
+        self.model = model
+        self.logger = LOGGER
+
+    def __enter__(self) -> "_CompoundTagsDriver":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def _process(self, tag: TagEnum, payload: bytes) -> bytes:
+        result = process(Buffer(tag, len(payload), payload), self.model, LOGGER)
+        assert result.buffer.tag == tag
+        return result.buffer.payload
+
+    def send_l2_request(self, fn: LLSendL2RequestFn, data: bytes) -> bytes:
+        return self._process(TagEnum.L2_REQUEST, data)
+
+    def send_l3_command(self, fn: LLSendL3CommandFn, data: List[bytes]) -> List[bytes]:
+        return split_l2_frames(self._process(TagEnum.L3_COMMAND, b"".join(data)))
+
+
+@pytest.fixture()
+def model():
+    yield Tropic01Model(activate_encryption=False, busy_iter=[False])
+
+
+@pytest.fixture()
+def host(model: Tropic01Model):
+    yield Host(activate_encryption=False, target_driver=_CompoundTagsDriver(model))
+
+
+def test_l2_request(host: Host):
+    response = host.send_request(TsL2GetInfoRequest(object_id=1, block_index=0))
+    assert isinstance(response, TsL2GetInfoResponse)
+    assert response.status.value == L2StatusEnum.REQ_OK
+
+
+def test_l3_command(host: Host):
+    result = host.send_command(TsL3PingCommand(data_in=(data := b"\x01" * 300)))
+    assert isinstance(result, TsL3PingResult)
+    assert result.result.value == L3ResultFieldEnum.OK
+    assert result.data_out.to_bytes() == data
+
+
+def test_with_latencies():
+    model = Tropic01Model(
+        activate_encryption=False,
+        latencies=LatencyTable(default_l2=100, default_l3=50),
+    )
+    host = Host(activate_encryption=False, target_driver=_CompoundTagsDriver(model))
+
+    response = host.send_request(TsL2GetInfoRequest(object_id=1, block_index=0))
+    assert isinstance(response, TsL2GetInfoResponse)
+    assert model.clock.now == 100
+
+    result = host.send_command(TsL3PingCommand(data_in=b"ping"))
+    assert isinstance(result, TsL3PingResult)
+    assert result.data_out.to_bytes() == b"ping"
+    assert model.clock.now == 100 + 100 + 50
+
+
+def test_spi_transaction(model: Tropic01Model):
+    data = TsL2GetInfoRequest(object_id=1, block_index=0).to_bytes()
+    result = process(Buffer(TagEnum.SPI_TRANSACTION, len(data), data), model, LOGGER)
+    assert result.buffer.tag == TagEnum.SPI_TRANSACTION
+    assert len(result.buffer.payload) == len(data)
+    assert not model.spi_fsm.csn_is_low
+
+
+def test_batch(model: Tropic01Model):
+    frames = [
+        Buffer(TagEnum.POWER_ON),
+        Buffer(TagEnum.SPI_DRIVE_CSN_LOW),
+        Buffer(TagEnum.SPI_SEND, 2, b"\xaa\xbb"),
+        Buffer(TagEnum.SPI_DRIVE_CSN_HIGH),
+        Buffer(TagEnum.RESET_TARGET),
+        Buffer(TagEnum.POWER_OFF),
+    ]
+    payload = b"".join(frame.to_bytes() for frame in frames)
+
+    result = process(Buffer(TagEnum.BATCH, len(payload), payload), model, LOGGER)
+
+    assert result.reset_target
+    assert result.buffer.tag == TagEnum.BATCH
+    assert result.buffer.payload == b"".join(
+        frame.to_bytes()
+        for frame in [
+            Buffer(TagEnum.POWER_ON),
+            Buffer(TagEnum.SPI_DRIVE_CSN_LOW),
+            Buffer(TagEnum.SPI_SEND, 2, b"\x01\xff"),
+            Buffer(TagEnum.SPI_DRIVE_CSN_HIGH),
+            Buffer(TagEnum.RESET_TARGET),
+        ]
+    )
+
+
+def test_truncated_batch(model: Tropic01Model):
+    payload = Buffer(TagEnum.SPI_SEND, 2, b"\xaa\xbb").to_bytes()[:-1]
+    result = process(Buffer(TagEnum.BATCH, len(payload), payload), model, LOGGER)
+    assert result.buffer.tag == TagEnum.EXCEPTION
+
+
+def test_nested_batch(model: Tropic01Model):
+    payload = Buffer(TagEnum.POWER_ON).to_bytes()
+    for _ in range(3000):
+        payload = Buffer(TagEnum.BATCH, len(payload), payload).to_bytes()
+    result = process(Buffer.from_bytes(payload), model, LOGGER)
+    assert result.buffer.tag == TagEnum.EXCEPTION
+
+
+def test_irq(model: Tropic01Model):
+    irq = Buffer(TagEnum.IRQ)
+    assert process(irq, model, LOGGER).buffer.payload == b"\x00"
+    data = TsL2GetInfoRequest(object_id=1, block_index=0).to_bytes()
+    process(Buffer(TagEnum.SPI_TRANSACTION, len(data), data), model, LOGGER)
+    assert process(irq, model, LOGGER).buffer.payload == b"\x01"
+
+
+def test_irq_notifications(model: Tropic01Model):
+    notifier = IrqNotifier()
+    request = TsL2GetInfoRequest(object_id=1, block_index=0).to_bytes()
+    get_resp = bytes([L2IdFieldEnum.GET_RESP]) + bytes(2 + 128 + 2)
+
+    def _transaction(data: bytes):
+        buffer = Buffer(TagEnum.SPI_TRANSACTION, len(data), data)
+        process(buffer, model, LOGGER)
+        return notifier.notification(buffer, model)
+
+    # Disabled by default
+    assert _transaction(request) is None
+    _transaction(get_resp)
+
+    for enable in (b"\x01", b"\x00"):
+        subscribe = Buffer(TagEnum.IRQ, 1, enable)
+        assert process(subscribe, model, LOGGER).buffer.payload == b"\x00"
+        assert notifier.notification(subscribe, model) is None
+        notification = _transaction(request)
+        assert _transaction(get_resp) is None
+        if enable == b"\x01":
+            assert notification == Buffer(TagEnum.IRQ, 1, b"\x01")
+        else:
+            assert notification is None
+
+
+def test_irq_notification_after_wait():
+    model = Tropic01Model(
+        activate_encryption=False, latencies=LatencyTable(default_l2=100)
+    )
+    notifier = IrqNotifier()
+    notifier.notification(Buffer(TagEnum.IRQ, 1, b"\x01"), model)
+
+    data = TsL2GetInfoRequest(object_id=1, block_index=0).to_bytes()
+    transaction = Buffer(TagEnum.SPI_TRANSACTION, len(data), data)
+    process(transaction, model, LOGGER)
+    assert notifier.notification(transaction, model) is None
+
+    wait = Buffer(TagEnum.WAIT, 4, (200).to_bytes(4, "little"))
+    process(wait, model, LOGGER)
+    assert notifier.notification(wait, model) == Buffer(TagEnum.IRQ, 1, b"\x01")
+
+
+def test_irq_notified_once_per_response():
+    model = Tropic01Model(
+        activate_encryption=False, latencies=LatencyTable(default_l2=100)
+    )
+    notifier = IrqNotifier()
+    notifier.notification(Buffer(TagEnum.IRQ, 1, b"\x01"), model)
+    request = TsL2GetInfoRequest(object_id=1, block_index=0).to_bytes()
+    get_resp = bytes([L2IdFieldEnum.GET_RESP]) + bytes(2 + 128 + 2)
+    wait = Buffer(TagEnum.WAIT, 4, (200).to_bytes(4, "little"))
+
+    def _notifications(*buffers: Buffer) -> List[Buffer]:
+        notifications = []
+        for buffer in buffers:
+            process(buffer, model, LOGGER)
+            if (notification := notifier.notification(buffer, model)) is not None:
+                notifications.append(notification)
+        return notifications
+
+    for _ in range(2):
+        notifications = _notifications(
+            Buffer(TagEnum.SPI_DRIVE_CSN_LOW),
+            Buffer(TagEnum.SPI_SEND, len(request), request),
+            Buffer(TagEnum.SPI_DRIVE_CSN_HIGH),
+            wait,
+            wait,
+            wait,
+            Buffer(TagEnum.SPI_DRIVE_CSN_HIGH),
+        )
+        assert notifications == [Buffer(TagEnum.IRQ, 1, b"\x01")]
+        assert not _notifications(
+            Buffer(TagEnum.SPI_TRANSACTION, len(get_resp), get_resp)
+        )
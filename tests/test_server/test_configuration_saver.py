@@ -0,0 +1,94 @@
+import logging
+import time
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+import yaml
+
+import tvl.server.configuration as configuration
+from tvl.server.configuration import ConfigurationSaver
+from tvl.targets.model.tropic01_model import Tropic01Model
+
+LOGGER = logging.getLogger("test")
+
+
+def _model() -> Tropic01Model:
+    return Tropic01Model.from_dict(
+        {
+            "s_t_priv": b"\x01" * 32,
+            "r_user_data": {0: {"free": False, "value": b"data"}},
+            "busy_iter": [False],
+        }
+    )
+
+
+def _load(filepath: Path) -> Any:
+    return yaml.safe_load(filepath.read_text())
+
+
+def test_saved_configuration(tmp_path: Path):
+    saver = ConfigurationSaver(delay=60)
+    (model := _model()).r_mcounters[3].init(42)
+    saver.save(filepath := tmp_path / "config.yml", model, LOGGER)
+    saver.flush()
+
+    assert _load(filepath) == model.to_dict()
+    assert filepath.read_text() == yaml.dump(model.to_dict())
+
+
+def test_requests_debounced(tmp_path: Path):
+    saver = ConfigurationSaver(delay=60)
+    (model_1 := _model()).r_user_data[1].write(b"1")
+    (model_2 := _model()).r_user_data[2].write(b"2")
+
+    saver.save(filepath := tmp_path / "config.yml", model_1, LOGGER)
+    saver.save(filepath, model_2, LOGGER)
+    assert not filepath.exists()
+
+    saver.flush()
+    assert _load(filepath) == model_2.to_dict()
+
+
+def test_written_in_background(tmp_path: Path):
+    saver = ConfigurationSaver(delay=0.01)
+    saver.save(filepath := tmp_path / "config.yml", model := _model(), LOGGER)
+
+    deadline = time.monotonic() + 5
+    while not filepath.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _load(filepath) == model.to_dict()
+
+
+def test_only_modified_partitions_serialized(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    serialized: List[str] = []
+    dump_entry = configuration._dump_yaml_entry
+
+    def _dump_entry(key: str, value: Any) -> str:
+        serialized.append(key)
+        return dump_entry(key, value)
+
+    monkeypatch.setattr(configuration, "_dump_yaml_entry", _dump_entry)
+    saver = ConfigurationSaver(delay=60)
+    filepath = tmp_path / "config.yml"
+    partitions = set((model := _model()).partitions())
+
+    saver.save(filepath, model, LOGGER)
+    saver.flush()
+    assert partitions <= set(serialized)
+
+    # Unmodified partitions of a new model are not serialized again
+    serialized.clear()
+    (model := _model()).r_user_data[0].erase()
+    saver.save(filepath, model, LOGGER)
+    saver.flush()
+    assert set(serialized) & partitions == {"r_user_data"}
+
+    # Modified partition of the previous model has to be restored
+    serialized.clear()
+    saver.save(filepath, model := _model(), LOGGER)
+    saver.flush()
+    assert set(serialized) & partitions == {"r_user_data"}
+    assert _load(filepath) == model.to_dict()
@@ -0,0 +1,80 @@
+import os
+import random
+from typing import Any, List
+
+import pytest
+
+from tvl.server.internal import Buffer, FrameReader
+
+
+class _Connection:
+    def __init__(self, chunks: List[bytes]) -> None:
+        self.chunks = chunks
+        self.nb_reads = 0
+
+    def receive_into(self, buffer: memoryview) -> int:
+        self.nb_reads += 1
+        if not self.chunks:
+            return 0
+        chunk = self.chunks.pop(0)
+        size = min(len(chunk), len(buffer))
+        buffer[:size] = chunk[:size]
+        if size < len(chunk):
+            self.chunks.insert(0, chunk[size:])
+        return size
+
+    def __getattr__(self, name: str) -> Any:
+        raise NotImplementedError(name)
+
+
+def _buffer(length: int) -> Buffer:
+    return Buffer(os.urandom(1), length, os.urandom(length))
+
+
+def _read_all(reader: FrameReader) -> List[Buffer]:
+    buffers: List[Buffer] = []
+    while (buffer := reader.read()) is not None:
+        buffers.append(buffer)
+    return buffers
+
+
+def _split(data: bytes, sizes: List[int]) -> List[bytes]:
+    chunks: List[bytes] = []
+    while data:
+        size = random.choice(sizes)
+        chunks.append(data[:size])
+        data = data[size:]
+    return chunks
+
+
+def test_coalesced_frames():
+    buffers = [_buffer(random.randint(0, 300)) for _ in range(20)]
+    connection = _Connection([b"".join(b.to_bytes() for b in buffers)])
+
+    assert _read_all(FrameReader(connection)) == buffers
+    # one read for the data, one read to detect the end of the connection
+    assert connection.nb_reads == 2
+
+
+@pytest.mark.parametrize("sizes", [[1], [1, 2, 3], [7, 100, 1000]])
+def test_partial_frames(sizes: List[int]):
+    buffers = [_buffer(random.randint(0, 300)) for _ in range(20)]
+    connection = _Connection(_split(b"".join(b.to_bytes() for b in buffers), sizes))
+
+    assert _read_all(FrameReader(connection)) == buffers
+
+
+def test_frames_wrapping_around_buffer():
+    buffers = [_buffer(2**16 - 1) for _ in range(5)]
+    connection = _Connection(
+        _split(b"".join(b.to_bytes() for b in buffers), [50_000, 70_000])
+    )
+
+    assert _read_all(FrameReader(connection)) == buffers
+
+
+def test_connection_closed_within_frame():
+    reader = FrameReader(_Connection([_buffer(10).to_bytes()[:-1]]))
+
+    with pytest.raises(RuntimeError):
+        reader.read()
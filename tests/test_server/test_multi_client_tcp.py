@@ -0,0 +1,133 @@
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+from tvl.server.internal import Buffer, TagEnum
+from tvl.server.multi_client_tcp import MultiClientServer
+
+
+class _Target:
+    def __init__(self, instances: List["_Target"]) -> None:
+        instances.append(self)
+        self.received: List[bytes] = []
+
+    def __enter__(self) -> "_Target":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def spi_send(self, data: bytes) -> bytes:
+        self.received.append(data)
+        return data[::-1]
+
+
+def _get_target_fn(instances: List[_Target], dumps: List[Path]):
+    def _get_target(
+        _: Optional[Path], configuration_out: Path, __: logging.Logger
+    ) -> Tuple[_Target, Callable[[], None]]:
+        return _Target(instances), lambda: dumps.append(configuration_out)
+
+    return _get_target
+
+
+async def _exchange(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, buffer: Buffer
+) -> Buffer:
+    writer.write(buffer.to_bytes())
+    header = await reader.readexactly(Buffer.TAG_SIZE + Buffer.LENGTH_SIZE)
+    rx = Buffer.from_bytes(header)
+    rx.payload = await reader.readexactly(rx.length)
+    return rx
+
+
+def _run_clients(server: MultiClientServer, *clients: Any) -> None:
+    async def _main() -> None:
+        tcp_server = await asyncio.start_server(server.handle_client, "127.0.0.1", 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+
+        async def _connect(client: Any) -> None:
+            await client(*await asyncio.open_connection("127.0.0.1", port))
+
+        async with tcp_server:
+            await asyncio.gather(*map(_connect, clients))
+            # let the server handle the disconnections
+            await asyncio.sleep(0.1)
+        server.close()
+
+    asyncio.run(_main())
+
+
+def _spi_send(data: bytes) -> Buffer:
+    return Buffer(TagEnum.SPI_SEND, len(data), data)
+
+
+def test_one_target_per_client():
+    instances: List[_Target] = []
+    dumps: List[Path] = []
+    server = MultiClientServer(
+        None,
+        Path("config.yml"),
+        logging.getLogger("server"),
+        _get_target_fn(instances, dumps),
+    )
+
+    def _client(data: bytes):
+        async def _run(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            for _ in range(10):
+                rx = await _exchange(reader, writer, _spi_send(data))
+                assert rx == Buffer(TagEnum.SPI_SEND, len(data), data[::-1])
+            writer.close()
+
+        return _run
+
+    _run_clients(server, _client(b"\x01\x02"), _client(b"\x03\x04\x05"))
+
+    assert len(instances) == 2
+    assert sorted(len(target.received) for target in instances) == [10, 10]
+    for target in instances:
+        assert len(set(target.received)) == 1
+    assert sorted(dumps) == [Path("config.0.yml"), Path("config.1.yml")]
+
+
+def test_shared_target():
+    instances: List[_Target] = []
+    dumps: List[Path] = []
+    server = MultiClientServer(
+        None,
+        Path("config.yml"),
+        logging.getLogger("server"),
+        _get_target_fn(instances, dumps),
+    )
+    select = Buffer(TagEnum.SELECT_MODEL, len(name := b"farm"), name)
+
+    async def _client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        assert await _exchange(reader, writer, select) == Buffer(TagEnum.SELECT_MODEL)
+        await _exchange(reader, writer, _spi_send(b"\x00"))
+        writer.close()
+
+    _run_clients(server, _client, _client)
+
+    shared = [target for target in instances if target.received]
+    assert len(shared) == 1
+    assert len(shared[0].received) == 2
+    assert Path("config.shared.farm.yml") in dumps
+
+
+def test_invalid_model_name():
+    instances: List[_Target] = []
+    server = MultiClientServer(
+        None,
+        Path("config.yml"),
+        logging.getLogger("server"),
+        _get_target_fn(instances, []),
+    )
+    select = Buffer(TagEnum.SELECT_MODEL, len(name := b"../etc"), name)
+
+    async def _client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        assert await _exchange(reader, writer, select) == Buffer(TagEnum.EXCEPTION)
+        writer.close()
+
+    _run_clients(server, _client)
+    assert not server.shared_targets
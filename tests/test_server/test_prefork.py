@@ -0,0 +1,105 @@
+import os
+import re
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+import pytest
+
+from tvl.api.l2_api import TsL2GetInfoRequest, TsL2GetInfoResponse
+from tvl.host.host import Host
+from tvl.host.remote_target import ConnectionPool, RemoteModelTarget
+from tvl.server.prefork import worker_arguments
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="fork not available")
+
+
+def _free_port() -> int:
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        return server.getsockname()[1]
+
+
+def _get_info(target: RemoteModelTarget) -> None:
+    host = Host(target=target, activate_encryption=False)
+    response = host.send_request(TsL2GetInfoRequest(object_id=1, block_index=0))
+    assert isinstance(response, TsL2GetInfoResponse)
+
+
+def _worker_pids(log: Path, nb_pids: int) -> List[int]:
+    deadline = time.monotonic() + 10
+    while (
+        len(pids := re.findall(r"Worker \d started with PID (\d+)", log.read_text()))
+        < nb_pids
+    ):
+        assert time.monotonic() < deadline, log.read_text()
+        time.sleep(0.05)
+    return [int(pid) for pid in pids]
+
+
+@pytest.fixture()
+def server(tmp_path: Path) -> Iterator[Tuple[subprocess.Popen, Tuple[str, int]]]:
+    address = ("127.0.0.1", _free_port())
+    with open(log := tmp_path / "server.log", "w") as stderr:
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "tvl.server.server",
+                "tcp",
+                f"--port={address[1]}",
+                "--workers=2",
+                f"--configuration-out={tmp_path / 'config.yml'}",
+            ],
+            stderr=stderr,
+            stdout=stderr,
+        )
+    _worker_pids(log, 2)
+    yield process, address
+    process.kill()
+    process.wait()
+
+
+def test_worker_arguments():
+    kwargs = {
+        "configuration_out": Path("config.yml"),
+        "trace": Path("frames.trace.xz"),
+        "metrics_port": 9000,
+    }
+    assert worker_arguments(1, kwargs) == {
+        "configuration_out": Path("config.worker1.yml"),
+        "trace": Path("frames.trace.worker1.xz"),
+        "metrics_port": 9001,
+    }
+    assert worker_arguments(0, {"configuration_out": Path("c.yml"), "trace": None}) == {
+        "configuration_out": Path("c.worker0.yml"),
+        "trace": None,
+    }
+
+
+def test_workers(tmp_path: Path, server: Tuple[subprocess.Popen, Tuple[str, int]]):
+    process, address = server
+    log = tmp_path / "server.log"
+    # each client holds its own worker
+    targets = [
+        RemoteModelTarget(address, pool=ConnectionPool(timeout=10)) for _ in range(2)
+    ]
+    for target in targets:
+        _get_info(target)
+
+    # a crashed worker is restarted
+    os.kill(_worker_pids(log, 2)[0], signal.SIGKILL)
+    _worker_pids(log, 3)
+    for target in targets:
+        _get_info(target)
+        target.pool.close()
+
+    process.send_signal(signal.SIGTERM)
+    assert process.wait(20) == 0
+    assert {path.name for path in tmp_path.glob("config.*.yml")} == {
+        "config.worker0.yml",
+        "config.worker1.yml",
+    }
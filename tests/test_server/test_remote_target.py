@@ -0,0 +1,174 @@
+import logging
+import socket
+import threading
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+import pytest
+
+from tvl.api.l2_api import TsL2GetInfoRequest, TsL2GetInfoResponse
+from tvl.api.l3_api import TsL3PingCommand, TsL3PingResult
+from tvl.host.host import Host
+from tvl.host.remote_target import (
+    ConnectionPool,
+    RemoteModelTarget,
+    RemoteTargetError,
+    SharedMemoryAddress,
+)
+from tvl.server.internal import run_server
+from tvl.server.shm_connection import SharedMemoryConnection
+from tvl.server.tcp_connection import TCPConnection
+from tvl.server.unix_connection import UnixConnection
+from tvl.targets.model.tropic01_model import Tropic01Model
+
+
+def _serve(connection: Any, tmp_path: Path, models: List[Tropic01Model]) -> None:
+    def _get_target(
+        _: Optional[Path], __: Path, ___: logging.Logger
+    ) -> Tuple[Tropic01Model, Callable[[], None]]:
+        models.append(Tropic01Model(activate_encryption=False, busy_iter=[False]))
+        return models[-1], lambda: None
+
+    threading.Thread(
+        target=run_server,
+        args=(connection, None, tmp_path / "config.yml", logging.getLogger("server")),
+        kwargs={"get_target_fn": _get_target},
+        daemon=True,
+    ).start()
+
+
+@pytest.fixture()
+def models() -> List[Tropic01Model]:
+    return []
+
+
+@pytest.fixture()
+def address(tmp_path: Path, models: List[Tropic01Model]) -> Tuple[str, int]:
+    connection = TCPConnection("127.0.0.1", 0, logging.getLogger("server"))
+    _serve(connection, tmp_path, models)
+    return connection.server.getsockname()
+
+
+@pytest.fixture()
+def pool() -> Iterator[ConnectionPool]:
+    pool = ConnectionPool(timeout=5)
+    yield pool
+    pool.close()
+
+
+def _get_info(target: RemoteModelTarget) -> None:
+    host = Host(target=target, activate_encryption=False)
+    response = host.send_request(TsL2GetInfoRequest(object_id=1, block_index=0))
+    assert isinstance(response, TsL2GetInfoResponse)
+
+
+def test_host_requests(address: Tuple[str, int], pool: ConnectionPool):
+    with RemoteModelTarget(address, pool=pool) as target:
+        host = Host(target=target, activate_encryption=False)
+        response = host.send_request(TsL2GetInfoRequest(object_id=1, block_index=0))
+        assert isinstance(response, TsL2GetInfoResponse)
+        result = host.send_command(TsL3PingCommand(data_in=b"ping"))
+        assert isinstance(result, TsL3PingResult)
+        assert result.data_out.to_bytes() == b"ping"
+        assert not target.irq_state()
+        target.wait(1000)
+
+
+def test_connection_reused(address: Tuple[str, int], pool: ConnectionPool):
+    with RemoteModelTarget(address, pool=pool) as target:
+        _get_info(target)
+        connection = target.connection
+    assert pool.idle[address] == [connection]
+
+    with RemoteModelTarget(address, pool=pool) as target:
+        _get_info(target)
+        assert target.connection is connection
+
+
+def test_reconnect(
+    address: Tuple[str, int], pool: ConnectionPool, models: List[Tropic01Model]
+):
+    with RemoteModelTarget(address, pool=pool) as target:
+        _get_info(target)
+        assert target.connection is not None
+        target.connection.transport.shutdown(socket.SHUT_RDWR)
+        _get_info(target)
+    assert len(models) == 1
+
+
+def _closing_server(nb_replies: List[int]) -> Tuple[str, int]:
+    """Server replying to the given numbers of frames, by connection, then
+    closing the connection upon the next one"""
+    server = socket.create_server(("127.0.0.1", 0))
+
+    def _serve_connections() -> None:
+        for nb in nb_replies:
+            client, _ = server.accept()
+            with client:
+                for _ in range(nb):
+                    client.sendall(client.recv(1024))
+                client.recv(1024)
+
+    threading.Thread(target=_serve_connections, daemon=True).start()
+    return server.getsockname()
+
+
+def test_reconnect_stale_pooled_connection(pool: ConnectionPool):
+    address = _closing_server([1, 1])
+    with RemoteModelTarget(address, pool=pool) as target:
+        target.power_on()
+    with RemoteModelTarget(address, pool=pool) as target:
+        target.power_on()
+
+
+def test_no_retry_on_new_connection(pool: ConnectionPool):
+    # The request would succeed if sent again
+    address = _closing_server([0, 1])
+    with RemoteModelTarget(address, pool=pool) as target:
+        with pytest.raises(RemoteTargetError):
+            target.power_on()
+
+
+def test_reset_target(
+    address: Tuple[str, int], pool: ConnectionPool, models: List[Tropic01Model]
+):
+    with RemoteModelTarget(address, pool=pool) as target:
+        target.reset_target()
+        _get_info(target)
+    assert len(models) == 2
+
+
+def test_exception(
+    address: Tuple[str, int], pool: ConnectionPool, models: List[Tropic01Model]
+):
+    with RemoteModelTarget(address, pool=pool) as target:
+        target.spi_drive_csn_low()
+        with pytest.raises(RemoteTargetError):
+            target.spi_send(b"\x77\x00")
+        # the server replaced the faulty model
+        _get_info(target)
+    assert len(models) == 2
+
+
+def test_unix_socket(tmp_path: Path, pool: ConnectionPool):
+    path = tmp_path / "model.sock"
+    _serve(UnixConnection(path, logging.getLogger("server")), tmp_path, [])
+    with RemoteModelTarget(path, pool=pool) as target:
+        _get_info(target)
+
+
+def test_shared_memory(tmp_path: Path, pool: ConnectionPool):
+    name = f"tvl_test_{tmp_path.name}"
+    models: List[Tropic01Model] = []
+    _serve(SharedMemoryConnection(name, logging.getLogger("server")), tmp_path, models)
+    address = SharedMemoryAddress(name)
+    with RemoteModelTarget(address, pool=pool) as target:
+        _get_info(target)
+    # a pooled connection keeps its client slot, a new client waits for it
+    pool.close()
+    with RemoteModelTarget(address, pool=pool) as target:
+        _get_info(target)
+    assert len(models) == 1
+    # the server thread never exits
+    shared_memory.SharedMemory(name).unlink()
@@ -0,0 +1,162 @@
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from typing import Any, Iterator, List
+
+import pytest
+
+from tvl.server.internal import Buffer, FrameReader, TagEnum
+from tvl.server.shm_connection import (
+    _SERVER_PID,
+    SharedMemoryClient,
+    SharedMemoryConnection,
+)
+
+CAPACITY = 64
+
+
+@pytest.fixture()
+def server(request: pytest.FixtureRequest) -> Iterator[SharedMemoryConnection]:
+    name = f"tvl_test_{request.node.name}"
+    with SharedMemoryConnection(
+        name, logging.getLogger("server"), capacity=CAPACITY
+    ) as server:
+        yield server
+
+
+def _echo(server: SharedMemoryConnection, nb_clients: int) -> threading.Thread:
+    def _run() -> None:
+        for _ in range(nb_clients):
+            server.connect()
+            reader = FrameReader(server, size=2**17)
+            while (buffer := reader.read()) is not None:
+                server.send(buffer.to_bytes())
+
+    thread = threading.Thread(target=_run, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_frames_larger_than_ring(server: SharedMemoryConnection):
+    thread = _echo(server, 1)
+    client = SharedMemoryClient(server.shm.name, timeout=5)
+    reader = FrameReader(client, size=2**17)
+    for size in (0, 1, CAPACITY - 3, CAPACITY, 5 * CAPACITY + 7, 2**16 - 1):
+        frame = Buffer(TagEnum.SPI_SEND, size, bytes(i % 251 for i in range(size)))
+        client.sendall(frame.to_bytes())
+        assert reader.read() == frame
+    client.close()
+    thread.join(5)
+    assert not thread.is_alive()
+
+
+def test_clients_one_after_the_other(server: SharedMemoryConnection):
+    thread = _echo(server, 2)
+    frame = Buffer(TagEnum.WAIT, 2, b"\x10\x00")
+    for _ in range(2):
+        client = SharedMemoryClient(server.shm.name, timeout=5)
+        client.sendall(frame.to_bytes())
+        data = bytearray(16)
+        assert bytes(data[: client.recv_into(memoryview(data))]) == frame.to_bytes()
+        client.close()
+    thread.join(5)
+    assert not thread.is_alive()
+
+
+def _connect_and_hang(name: str, connected: Any) -> None:
+    SharedMemoryClient(name, timeout=5)
+    connected.set()
+    time.sleep(60)
+
+
+def test_killed_client(server: SharedMemoryConnection):
+    thread = _echo(server, 2)
+    context = multiprocessing.get_context("fork")
+    connected = context.Event()
+    process = context.Process(
+        target=_connect_and_hang, args=(server.shm.name, connected)
+    )
+    process.start()
+    assert connected.wait(5)
+    process.kill()
+    process.join()
+
+    # The server sees the client disconnected and accepts a new one
+    client = SharedMemoryClient(server.shm.name, timeout=5)
+    frame = Buffer(TagEnum.POWER_ON)
+    client.sendall(frame.to_bytes())
+    assert FrameReader(client).read() == frame
+    client.close()
+    thread.join(5)
+    assert not thread.is_alive()
+
+
+def test_concurrent_clients(server: SharedMemoryConnection):
+    results: List[Any] = []
+
+    def _connect() -> None:
+        try:
+            results.append(SharedMemoryClient(server.shm.name, timeout=0.2))
+        except TimeoutError as exc:
+            results.append(exc)
+
+    threads = [threading.Thread(target=_connect) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    clients = [r for r in results if isinstance(r, SharedMemoryClient)]
+    assert len(clients) == 1
+    clients[0].close()
+
+
+def test_busy_server(server: SharedMemoryConnection):
+    client = SharedMemoryClient(server.shm.name, timeout=0.01)
+    with pytest.raises(TimeoutError):
+        SharedMemoryClient(server.shm.name, timeout=0.01)
+    with pytest.raises(TimeoutError):
+        client.recv_into(memoryview(bytearray(1)))
+    client.close()
+
+
+def test_server_closed():
+    name = "tvl_test_server_closed"
+    server = SharedMemoryConnection(name, logging.getLogger("server"))
+    client = SharedMemoryClient(name)
+    server.__exit__(None, None, None)
+    assert client.recv_into(memoryview(bytearray(1))) == 0
+    with pytest.raises(BrokenPipeError):
+        client.sendall(b"\x01")
+    client.close()
+
+
+def test_server_running(server: SharedMemoryConnection):
+    with pytest.raises(FileExistsError):
+        SharedMemoryConnection(server.shm.name, logging.getLogger("server"))
+    # The running server still accepts its clients
+    thread = _echo(server, 1)
+    client = SharedMemoryClient(server.shm.name, timeout=5)
+    frame = Buffer(TagEnum.POWER_ON)
+    client.sendall(frame.to_bytes())
+    assert FrameReader(client).read() == frame
+    client.close()
+    thread.join(5)
+
+
+def test_stale_server():
+    name = "tvl_test_stale_server"
+    logger = logging.getLogger("server")
+    # The server died without closing the segment
+    stale = SharedMemoryConnection(name, logger, capacity=CAPACITY)
+    process = multiprocessing.get_context("fork").Process(target=int)
+    process.start()
+    process.join()
+    stale.words[_SERVER_PID] = process.pid
+    stale.release()
+
+    with SharedMemoryConnection(name, logger, capacity=CAPACITY) as server:
+        assert server.words[_SERVER_PID] == os.getpid()
+        client = SharedMemoryClient(name, timeout=5)
+        client.close()
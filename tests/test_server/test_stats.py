@@ -0,0 +1,68 @@
+import json
+import logging
+from urllib.request import urlopen
+
+from tvl.api.l2_api import TsL2GetInfoRequest
+from tvl.host.host import Host
+from tvl.server.internal import Buffer, TagEnum, process
+from tvl.server.stats import Histogram, ServerStats, start_metrics_server
+from tvl.targets.model.tropic01_model import Tropic01Model
+
+LOGGER = logging.getLogger("server")
+
+
+def test_histogram():
+    histogram = Histogram((1.0, 2.0))
+    for value in (0.5, 1.0, 1.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.count == 4
+    assert histogram.sum == 6.0
+    assert list(histogram.cumulative_counts()) == [("1.0", 2), ("2.0", 3), ("+Inf", 4)]
+
+
+def test_model_latencies():
+    stats = ServerStats()
+    model = Tropic01Model(busy_iter=[False])
+    stats.watch(model)
+
+    for _ in range(3):
+        Host(target=model).send_request(TsL2GetInfoRequest(object_id=1, block_index=0))
+
+    assert stats.l2_latencies["TsL2GetInfoRequest"].count == 3
+
+
+def test_stats_tag():
+    stats = ServerStats()
+    stats.connection_opened()
+    stats.record_frame("SPI_SEND", 10, 20, 0.001)
+
+    buffer = process(Buffer(TagEnum.STATS), Tropic01Model(), LOGGER, stats).buffer
+
+    assert buffer.tag == TagEnum.STATS
+    content = json.loads(buffer.payload)
+    assert content["tags"]["SPI_SEND"]["count"] == 1
+    assert content["bytes_in"] == 10
+    assert content["bytes_out"] == 20
+    assert content["active_connections"] == 1
+
+
+def test_stats_tag_unsupported_without_stats():
+    buffer = process(Buffer(TagEnum.STATS), Tropic01Model(), LOGGER).buffer
+    assert buffer.tag == TagEnum.UNSUPPORTED
+
+
+def test_metrics_endpoint():
+    stats = ServerStats()
+    stats.record_frame("POWER_ON", 3, 3, 0.001)
+    http_server = start_metrics_server(stats, 0, LOGGER)
+    try:
+        port = http_server.server_address[1]
+        with urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            body = response.read().decode()
+    finally:
+        http_server.shutdown()
+        http_server.server_close()
+
+    assert 'tvl_server_frames_total{tag="POWER_ON"} 1' in body
+    assert "tvl_server_received_bytes_total 3" in body
@@ -0,0 +1,335 @@
+import logging
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
+
+from tvl.api.l2_api import TsL2GetInfoRequest
+from tvl.api.l3_api import TsL3PingCommand, TsL3RandomValueGetCommand
+from tvl.constants import L2IdFieldEnum
+from tvl.host.host import Host, establish_secure_channel
+from tvl.host.protocols import LLSendL2RequestFn, LLSendL3CommandFn
+from tvl.server.internal import (
+    Buffer,
+    TagEnum,
+    load_model,
+    process,
+    run_server,
+    split_l2_frames,
+)
+from tvl.server.replay import replay_trace, replay_traces
+from tvl.server.trace import (
+    TraceDirection,
+    TraceFormatError,
+    TraceRecord,
+    TraceRecorder,
+    read_trace,
+)
+from tvl.targets.model.tropic01_model import Tropic01Model
+
+LOGGER = logging.getLogger("server")
+
+
+class _Disconnected(Exception):
+    pass
+
+
+class _Connection:
+    """Connection accepted once per given bytes, received by the client"""
+
+    def __init__(self, *data: bytes) -> None:
+        self.clients = list(data)
+        self.data = b""
+        self.sent = bytearray()
+
+    def __enter__(self) -> "_Connection":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def connect(self) -> None:
+        if not self.clients:
+            raise _Disconnected
+        self.data = self.clients.pop(0)
+
+    def receive_into(self, buffer: memoryview) -> int:
+        size = min(len(buffer), len(self.data))
+        buffer[:size] = self.data[:size]
+        self.data = self.data[size:]
+        return size
+
+    def send(self, data: bytes) -> None:
+        self.sent += data
+
+
+class _RecordingDriver:
+    """Target driver keeping track of the frames exchanged with the model"""
+
+    def __init__(self, model: Tropic01Model) -> None:
+        self.model = model
+        self.logger = LOGGER
+        self.requests: List[bytes] = []
+        self.responses: List[bytes] = []
+
+    def __enter__(self) -> "_RecordingDriver":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def _process(self, tag: TagEnum, payload: bytes) -> bytes:
+        buffer = Buffer(tag, len(payload), payload)
+        result = process(buffer, self.model, LOGGER)
+        self.requests.append(buffer.to_bytes())
+        self.responses.append(result.buffer.to_bytes())
+        return result.buffer.payload
+
+    def send_l2_request(self, fn: LLSendL2RequestFn, data: bytes) -> bytes:
+        return self._process(TagEnum.L2_REQUEST, data)
+
+    def send_l3_command(self, fn: LLSendL3CommandFn, data: List[bytes]) -> List[bytes]:
+        return split_l2_frames(self._process(TagEnum.L3_COMMAND, b"".join(data)))
+
+
+@pytest.fixture()
+def configuration():
+    tropic_priv_key = X25519PrivateKey.generate()
+    host_priv_key = X25519PrivateKey.generate()
+    tropic_pub_key_bytes = tropic_priv_key.public_key().public_bytes_raw()
+    host_pub_key_bytes = host_priv_key.public_key().public_bytes_raw()
+    yield {
+        "host": {
+            "s_h_priv": [host_priv_key.private_bytes_raw()],
+            "s_h_pub": [host_pub_key_bytes],
+            "s_t_pub": tropic_pub_key_bytes,
+            "pairing_key_index": 0,
+        },
+        "model": {
+            "s_t_priv": tropic_priv_key.private_bytes_raw(),
+            "s_t_pub": tropic_pub_key_bytes,
+            "i_pairing_keys": {0: {"value": host_pub_key_bytes}},
+            "rng_seed": 1,
+        },
+    }
+
+
+@pytest.fixture()
+def snapshot(tmp_path: Path, configuration: Dict[str, Any]):
+    path = tmp_path / "model.snap"
+    Tropic01Model.from_dict(configuration["model"]).save_snapshot(path)
+    yield path
+
+
+@pytest.fixture()
+def driver(snapshot: Path, configuration: Dict[str, Any]):
+    driver = _RecordingDriver(load_model(snapshot, LOGGER))
+    with Host.from_dict(configuration["host"]).set_target_driver(driver) as host:
+        establish_secure_channel(host)
+        host.send_command(TsL3PingCommand(data_in=b"\x01" * 300))
+        host.send_command(TsL3RandomValueGetCommand(n_bytes=64))
+    yield driver
+
+
+def _record(trace: Path, snapshot: Path, driver: _RecordingDriver) -> bytes:
+    connection = _Connection(b"".join(driver.requests))
+    with pytest.raises(_Disconnected):
+        run_server(
+            connection,
+            snapshot,
+            Path("config.yml"),
+            LOGGER,
+            lambda config_in, _, logger: (load_model(config_in, logger), lambda: None),
+            trace=trace,
+        )
+    return bytes(connection.sent)
+
+
+@pytest.mark.parametrize("suffix", [".trace", ".gz", ".xz"])
+def test_record_and_replay(
+    tmp_path: Path, snapshot: Path, driver: _RecordingDriver, suffix: str
+):
+    trace = tmp_path / f"frames{suffix}"
+    assert _record(trace, snapshot, driver) == b"".join(driver.responses)
+
+    records = list(read_trace(trace))
+    assert records[0] == (TraceDirection.OPEN, records[0].timestamp, b"")
+    assert records[-1] == (TraceDirection.CLOSE, records[-1].timestamp, b"")
+    assert [record.timestamp for record in records] == sorted(
+        record.timestamp for record in records
+    )
+
+    records = records[1:-1]
+    assert [record.frame for record in records[::2]] == driver.requests
+    assert [record.frame for record in records[1::2]] == driver.responses
+    assert all(record.direction is TraceDirection.RX for record in records[::2])
+    assert all(record.direction is TraceDirection.TX for record in records[1::2])
+
+    result = replay_trace(trace, snapshot)
+    assert result.nb_requests == len(driver.requests)
+    assert not result.mismatches
+
+
+_NOTIFICATION = Buffer(TagEnum.IRQ, 1, b"\x01")
+
+
+@pytest.fixture()
+def irq_snapshot(tmp_path: Path, configuration: Dict[str, Any]):
+    # The IRQ does not account for the busy sequence, the GET_RESP must succeed
+    path = tmp_path / "irq.snap"
+    configuration["model"]["busy_iter"] = [False]
+    Tropic01Model.from_dict(configuration["model"]).save_snapshot(path)
+    yield path
+
+
+@pytest.fixture()
+def irq_trace(tmp_path: Path, irq_snapshot: Path):
+    frames = [
+        Buffer(TagEnum.IRQ, 1, b"\x01"),
+        *(
+            Buffer(TagEnum.SPI_TRANSACTION, len(data), data)
+            for data in (
+                TsL2GetInfoRequest(object_id=1, block_index=0).to_bytes(),
+                bytes([L2IdFieldEnum.GET_RESP]) + bytes(2 + 128 + 2),
+            )
+        ),
+    ]
+    driver = _RecordingDriver(load_model(irq_snapshot, LOGGER))
+    driver.requests = [frame.to_bytes() for frame in frames]
+    sent = _record(trace := tmp_path / "irq.trace", irq_snapshot, driver)
+    assert sent.count(_NOTIFICATION.to_bytes()) == 1
+    yield trace
+
+
+def _rewrite(trace: Path, records: List[TraceRecord]) -> Path:
+    with TraceRecorder(path := trace.with_name("rewritten.trace")) as recorder:
+        for record in records:
+            recorder.record(record.direction, record.frame)
+    return path
+
+
+def test_record_and_replay_irq_notifications(irq_trace: Path, irq_snapshot: Path):
+    assert len(list(read_trace(irq_trace))) == 1 + 3 * 2 + 1 + 1
+
+    result = replay_trace(irq_trace, irq_snapshot)
+    assert result.nb_requests == 3
+    assert not result.mismatches
+
+
+def test_replay_missing_irq_notification(irq_trace: Path, irq_snapshot: Path):
+    records = [
+        record
+        for record in read_trace(irq_trace)
+        if record.direction is TraceDirection.RX
+        or record.frame != _NOTIFICATION.to_bytes()
+    ]
+    result = replay_trace(_rewrite(irq_trace, records), irq_snapshot)
+    assert [(m.index, m.expected, m.actual) for m in result.mismatches] == [
+        (1, None, _NOTIFICATION)
+    ]
+
+
+def test_replay_missing_last_irq_notification(irq_trace: Path, irq_snapshot: Path):
+    # The trace ends after the reply to the request, before its notification
+    records = list(read_trace(irq_trace))[:5]
+    assert records[-1].direction is TraceDirection.TX
+    result = replay_trace(_rewrite(irq_trace, records), irq_snapshot)
+    assert [(m.index, m.expected, m.actual) for m in result.mismatches] == [
+        (1, None, _NOTIFICATION)
+    ]
+
+
+def test_replay_unexpected_irq_notification(irq_trace: Path, irq_snapshot: Path):
+    records = list(read_trace(irq_trace))
+    records.insert(-1, records[-2]._replace(frame=_NOTIFICATION.to_bytes()))
+    result = replay_trace(_rewrite(irq_trace, records), irq_snapshot)
+    assert [(m.index, m.expected, m.actual) for m in result.mismatches] == [
+        (2, _NOTIFICATION, None)
+    ]
+
+
+def test_replay_irq_notifications_per_connection(tmp_path: Path, irq_snapshot: Path):
+    # The first client subscribes to the notifications, not the second one
+    request = TsL2GetInfoRequest(object_id=1, block_index=0).to_bytes()
+    transaction = Buffer(TagEnum.SPI_TRANSACTION, len(request), request)
+    connection = _Connection(
+        Buffer(TagEnum.IRQ, 1, b"\x01").to_bytes(), transaction.to_bytes()
+    )
+    with pytest.raises(_Disconnected):
+        run_server(
+            connection,
+            irq_snapshot,
+            Path("config.yml"),
+            LOGGER,
+            lambda config_in, _, logger: (load_model(config_in, logger), lambda: None),
+            trace=(trace := tmp_path / "connections.trace"),
+        )
+    assert _NOTIFICATION.to_bytes() not in connection.sent
+
+    records = list(read_trace(trace))
+    assert [record.direction for record in records] == [
+        TraceDirection.OPEN,
+        TraceDirection.RX,
+        TraceDirection.TX,
+        TraceDirection.CLOSE,
+        TraceDirection.OPEN,
+        TraceDirection.RX,
+        TraceDirection.TX,
+        TraceDirection.CLOSE,
+    ]
+    result = replay_trace(trace, irq_snapshot)
+    assert result.nb_requests == 2
+    assert not result.mismatches
+
+
+def test_replay_with_other_seed(
+    tmp_path: Path,
+    snapshot: Path,
+    driver: _RecordingDriver,
+    configuration: Dict[str, Any],
+):
+    _record(trace := tmp_path / "frames.trace", snapshot, driver)
+
+    other_snapshot = tmp_path / "other.snap"
+    configuration["model"]["rng_seed"] = 2
+    Tropic01Model.from_dict(configuration["model"]).save_snapshot(other_snapshot)
+
+    result = replay_trace(trace, other_snapshot)
+    assert result.mismatches
+    # The ephemeral key of the handshake is the first random value
+    assert result.mismatches[0].request.payload[0] == 0x02
+
+
+def test_truncated_trace(tmp_path: Path, snapshot: Path, driver: _RecordingDriver):
+    _record(trace := tmp_path / "frames.trace", snapshot, driver)
+    # Remove the CLOSE record, 13 bytes, and the end of the last response
+    trace.write_bytes(trace.read_bytes()[: -13 - 1])
+
+    records = list(read_trace(trace))
+    assert len(records) == 1 + 2 * len(driver.requests) - 1
+
+    # The last request is replayed, its response is missing
+    result = replay_trace(trace, snapshot)
+    assert result.nb_requests == len(driver.requests)
+    assert not result.mismatches
+
+
+def test_not_a_trace(tmp_path: Path):
+    (path := tmp_path / "frames.trace").write_bytes(b"\x00" * 16)
+    with pytest.raises(TraceFormatError):
+        list(read_trace(path))
+
+
+def test_replay_in_parallel(tmp_path: Path, snapshot: Path):
+    traces = [tmp_path / "power.trace", tmp_path / "reset.trace"]
+    for trace, tag in zip(traces, [TagEnum.POWER_ON, TagEnum.RESET_TARGET]):
+        with TraceRecorder(trace) as recorder:
+            for _ in range(3):
+                recorder.record(TraceDirection.RX, Buffer(tag).to_bytes())
+                recorder.record(TraceDirection.TX, Buffer(tag).to_bytes())
+
+    results = list(replay_traces(traces, snapshot, workers=2))
+    assert [result.trace for result in results] == traces
+    assert [result.nb_requests for result in results] == [3, 3]
+    assert not any(result.mismatches for result in results)
@@ -0,0 +1,37 @@
+import logging
+import socket
+from pathlib import Path
+
+import pytest
+
+from tvl.server.unix_connection import UnixConnection
+
+LOGGER = logging.getLogger("server")
+
+
+def test_stale_socket(tmp_path: Path):
+    path = tmp_path / "model.sock"
+    # Left by a server which died
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(path))
+    assert path.is_socket()
+
+    with UnixConnection(path, LOGGER):
+        assert path.is_socket()
+    assert not path.exists()
+
+
+def test_server_running(tmp_path: Path):
+    path = tmp_path / "model.sock"
+    with UnixConnection(path, LOGGER) as server:
+        with pytest.raises(FileExistsError):
+            UnixConnection(path, LOGGER)
+        # The probe of the other server is seen as a client leaving at once
+        server.connect()
+        assert server.receive_into(memoryview(bytearray(1))) == 0
+        # The running server still accepts its clients
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(path))
+            server.connect()
+            client.sendall(b"\x01")
+            assert server.receive_into(memoryview(bytearray(1))) == 1
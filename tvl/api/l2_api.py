@@ -7,7 +7,15 @@
 
 from typing import List, Union
 
-from tvl.messages.datafield import U8Array, U8Scalar, datafield
+from tvl.messages.datafield import (
+    ArrayDataField,
+    Dtype,
+    Params,
+    ScalarDataField,
+    U8Array,
+    U8Scalar,
+    datafield,
+)
 from tvl.messages.l2_messages import L2Request, L2Response
 from tvl.targets.model.base_model import BaseModel
 from tvl.targets.model.meta_model import api
@@ -59,11 +67,18 @@ class TsL2GetInfoRequest(APIL2Request, id=L2Enum.GET_INFO):
     """In case the requested object is larger than 128B use chunk number.
     First chunk has index 0 and maximum value is 29 for 3840B Certificate
     Store ."""
+    __specs__ = (
+        ("object_id", ScalarDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+        ("block_index", ScalarDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL2GetInfoResponse(APIL2Response, id=L2Enum.GET_INFO):
     object: U8Array = datafield(min_size=1, max_size=128)
     """The data content of the requested object block."""
+    __specs__ = (
+        ("object", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=128, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL2HandshakeRequest(APIL2Request, id=L2Enum.HANDSHAKE):
@@ -83,6 +98,10 @@ class TsL2HandshakeRequest(APIL2Request, id=L2Enum.HANDSHAKE):
         """Corresponds to $S_{H2Pub}$."""
         PAIRING_KEY_SLOT_3 = 0x03
         """Corresponds to $S_{H3Pub}$."""
+    __specs__ = (
+        ("e_hpub", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=32, max_size=32, priority=0, is_data=True, default=0)),
+        ("pkey_index", ScalarDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL2HandshakeResponse(APIL2Response, id=L2Enum.HANDSHAKE):
@@ -90,16 +109,26 @@ class TsL2HandshakeResponse(APIL2Response, id=L2Enum.HANDSHAKE):
     """TROPIC01's X25519 Ephemeral key."""
     t_tauth: U8Array = datafield(size=16)  # Authentication Tag
     """The Secure Channel Handshake Authentication Tag."""
+    __specs__ = (
+        ("e_tpub", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=32, max_size=32, priority=0, is_data=True, default=0)),
+        ("t_tauth", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=16, max_size=16, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL2EncryptedCmdRequest(APIL2Request, id=L2Enum.ENCRYPTED_CMD):
     l3_chunk: U8Array = datafield(min_size=1, max_size=252)  # L3 command.
     """The encrypted L3 command or a chunk of it."""
+    __specs__ = (
+        ("l3_chunk", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=252, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL2EncryptedCmdResponse(APIL2Response, id=L2Enum.ENCRYPTED_CMD):
     l3_chunk: U8Array = datafield(min_size=1, max_size=252)  # L3 result.
     """The encrypted L3 result or a chunk of it."""
+    __specs__ = (
+        ("l3_chunk", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=252, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL2EncryptedSessionAbtRequest(APIL2Request, id=L2Enum.ENCRYPTED_SESSION_ABT):
@@ -124,6 +153,9 @@ class TsL2SleepRequest(APIL2Request, id=L2Enum.SLEEP):
     class SleepKindEnum(HexReprIntEnum):
         SLEEP_MODE = 0x05
         """Sleep Mode"""
+    __specs__ = (
+        ("sleep_kind", ScalarDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL2SleepResponse(APIL2Response, id=L2Enum.SLEEP):
@@ -138,6 +170,9 @@ class TsL2StartupRequest(APIL2Request, id=L2Enum.STARTUP):
         MAINTENANCE_REBOOT = 0x03
         """Restart, then initialize. Stay in Start-up mode and do not load the
         mutable FW from R-Memory."""
+    __specs__ = (
+        ("startup_id", ScalarDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL2StartupResponse(APIL2Response, id=L2Enum.STARTUP):
@@ -151,6 +186,9 @@ class TsL2GetLogRequest(APIL2Request, id=L2Enum.GET_LOG):
 class TsL2GetLogResponse(APIL2Response, id=L2Enum.GET_LOG):
     log_msg: U8Array = datafield(min_size=0, max_size=255)  # Log message
     """Log message of RISCV FW."""
+    __specs__ = (
+        ("log_msg", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=0, max_size=255, priority=0, is_data=True, default=0)),
+    )
 
 
 class L2API(BaseModel):
@@ -6,7 +6,18 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from tvl.messages.datafield import AUTO, U8Array, U8Scalar, U16Scalar, U32Scalar, datafield
+from tvl.messages.datafield import (
+    AUTO,
+    ArrayDataField,
+    Dtype,
+    Params,
+    ScalarDataField,
+    U8Array,
+    U8Scalar,
+    U16Scalar,
+    U32Scalar,
+    datafield,
+)
 from tvl.messages.l3_messages import L3Command, L3Result
 from tvl.targets.model.base_model import BaseModel
 from tvl.targets.model.meta_model import api
@@ -73,11 +84,17 @@ class APIL3Result(L3Result):
 class TsL3PingCommand(APIL3Command, id=L3Enum.PING):
     data_in: U8Array = datafield(min_size=0, max_size=4096)  # Data in
     """The input data"""
+    __specs__ = (
+        ("data_in", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=0, max_size=4096, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3PingResult(APIL3Result, id=L3Enum.PING):
     data_out: U8Array = datafield(min_size=0, max_size=4096)  # Data out
     """The output data (loopback of the DATA_IN L3 Field)."""
+    __specs__ = (
+        ("data_out", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=0, max_size=4096, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3PairingKeyWriteCommand(APIL3Command, id=L3Enum.PAIRING_KEY_WRITE):
@@ -97,6 +114,11 @@ class TsL3PairingKeyWriteCommand(APIL3Command, id=L3Enum.PAIRING_KEY_WRITE):
     s_hipub: U8Array = datafield(size=32)  # Public Key
     """The X25519 public key to be written in the Pairing Key slot specified
     in the SLOT field."""
+    __specs__ = (
+        ("slot", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+        ("padding", ScalarDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=1, priority=0, is_data=True, default=AUTO)),
+        ("s_hipub", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=32, max_size=32, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3PairingKeyWriteResult(APIL3Result, id=L3Enum.PAIRING_KEY_WRITE):
@@ -115,6 +137,9 @@ class TsL3PairingKeyReadCommand(APIL3Command, id=L3Enum.PAIRING_KEY_READ):
         """Corresponds to $S_{H2Pub}$."""
         PAIRING_KEY_SLOT_3 = 0x03
         """Corresponds to $S_{H3Pub}$."""
+    __specs__ = (
+        ("slot", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3PairingKeyReadResult(APIL3Result, id=L3Enum.PAIRING_KEY_READ):
@@ -130,6 +155,10 @@ class TsL3PairingKeyReadResult(APIL3Result, id=L3Enum.PAIRING_KEY_READ):
     s_hipub: U8Array = datafield(size=32)  # Public Key
     """The X25519 public key to be written in the Pairing Key slot specified
     in the SLOT field."""
+    __specs__ = (
+        ("padding", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=3, max_size=3, priority=0, is_data=True, default=AUTO)),
+        ("s_hipub", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=32, max_size=32, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3PairingKeyInvalidateCommand(APIL3Command, id=L3Enum.PAIRING_KEY_INVALIDATE):
@@ -144,6 +173,9 @@ class TsL3PairingKeyInvalidateCommand(APIL3Command, id=L3Enum.PAIRING_KEY_INVALI
         """Corresponds to $S_{H2Pub}$."""
         PAIRING_KEY_SLOT_3 = 0x03
         """Corresponds to $S_{H3Pub}$."""
+    __specs__ = (
+        ("slot", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3PairingKeyInvalidateResult(APIL3Result, id=L3Enum.PAIRING_KEY_INVALIDATE):
@@ -157,6 +189,11 @@ class TsL3RConfigWriteCommand(APIL3Command, id=L3Enum.R_CONFIG_WRITE):
     """The padding by dummy data."""
     value: U32Scalar  # Configuration object value
     """The CO value to write in the computed address."""
+    __specs__ = (
+        ("address", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+        ("padding", ScalarDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=1, priority=0, is_data=True, default=AUTO)),
+        ("value", ScalarDataField, Params(dtype=Dtype.UINT32, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3RConfigWriteResult(APIL3Result, id=L3Enum.R_CONFIG_WRITE):
@@ -166,6 +203,9 @@ class TsL3RConfigWriteResult(APIL3Result, id=L3Enum.R_CONFIG_WRITE):
 class TsL3RConfigReadCommand(APIL3Command, id=L3Enum.R_CONFIG_READ):
     address: U16Scalar  # Configuration object address
     """The CO address offset for TROPIC01 to compute the actual CO address."""
+    __specs__ = (
+        ("address", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3RConfigReadResult(APIL3Result, id=L3Enum.R_CONFIG_READ):
@@ -173,6 +213,10 @@ class TsL3RConfigReadResult(APIL3Result, id=L3Enum.R_CONFIG_READ):
     """The padding by dummy data."""
     value: U32Scalar  # Configuration object value
     """The CO value TROPIC01 read from the computed address."""
+    __specs__ = (
+        ("padding", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=3, max_size=3, priority=0, is_data=True, default=AUTO)),
+        ("value", ScalarDataField, Params(dtype=Dtype.UINT32, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3RConfigEraseCommand(APIL3Command, id=L3Enum.R_CONFIG_ERASE):
@@ -188,6 +232,10 @@ class TsL3IConfigWriteCommand(APIL3Command, id=L3Enum.I_CONFIG_WRITE):
     """The CO address offset for TROPIC01 to compute the actual CO address."""
     bit_index: U8Scalar  # Bit to write.
     """The bit to write from 1 to 0. Valid values are 0-31."""
+    __specs__ = (
+        ("address", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+        ("bit_index", ScalarDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3IConfigWriteResult(APIL3Result, id=L3Enum.I_CONFIG_WRITE):
@@ -197,6 +245,9 @@ class TsL3IConfigWriteResult(APIL3Result, id=L3Enum.I_CONFIG_WRITE):
 class TsL3IConfigReadCommand(APIL3Command, id=L3Enum.I_CONFIG_READ):
     address: U16Scalar  # Configuration object address
     """The CO address offset for TROPIC01 to compute the actual CO address."""
+    __specs__ = (
+        ("address", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3IConfigReadResult(APIL3Result, id=L3Enum.I_CONFIG_READ):
@@ -204,6 +255,10 @@ class TsL3IConfigReadResult(APIL3Result, id=L3Enum.I_CONFIG_READ):
     """The padding by dummy data."""
     value: U32Scalar  # Configuration object value
     """The CO value TROPIC01 read from the computed address."""
+    __specs__ = (
+        ("padding", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=3, max_size=3, priority=0, is_data=True, default=AUTO)),
+        ("value", ScalarDataField, Params(dtype=Dtype.UINT32, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3RMemDataWriteCommand(APIL3Command, id=L3Enum.R_MEM_DATA_WRITE):
@@ -214,6 +269,11 @@ class TsL3RMemDataWriteCommand(APIL3Command, id=L3Enum.R_MEM_DATA_WRITE):
     data: U8Array = datafield(min_size=1, max_size=444)  # Data to write
     """The data stream to be written in the slot specified in the UDATA_SLOT
     L3 field."""
+    __specs__ = (
+        ("udata_slot", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+        ("padding", ScalarDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=1, priority=0, is_data=True, default=AUTO)),
+        ("data", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=444, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3RMemDataWriteResult(APIL3Result, id=L3Enum.R_MEM_DATA_WRITE):
@@ -225,6 +285,9 @@ class TsL3RMemDataWriteResult(APIL3Result, id=L3Enum.R_MEM_DATA_WRITE):
 class TsL3RMemDataReadCommand(APIL3Command, id=L3Enum.R_MEM_DATA_READ):
     udata_slot: U16Scalar  # Slot to read
     """The slot of the User Data partition. Valid values are 0 - 511."""
+    __specs__ = (
+        ("udata_slot", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3RMemDataReadResult(APIL3Result, id=L3Enum.R_MEM_DATA_READ):
@@ -233,11 +296,18 @@ class TsL3RMemDataReadResult(APIL3Result, id=L3Enum.R_MEM_DATA_READ):
     data: U8Array = datafield(min_size=0, max_size=444)  # Data to read
     """The data stream read from the slot specified in the UDATA_SLOT L3
     field."""
+    __specs__ = (
+        ("padding", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=3, max_size=3, priority=0, is_data=True, default=AUTO)),
+        ("data", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=0, max_size=444, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3RMemDataEraseCommand(APIL3Command, id=L3Enum.R_MEM_DATA_ERASE):
     udata_slot: U16Scalar  # Slot to erase
     """The slot of the User Data partition. Valid values are 0 - 511."""
+    __specs__ = (
+        ("udata_slot", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3RMemDataEraseResult(APIL3Result, id=L3Enum.R_MEM_DATA_ERASE):
@@ -247,6 +317,9 @@ class TsL3RMemDataEraseResult(APIL3Result, id=L3Enum.R_MEM_DATA_ERASE):
 class TsL3RandomValueGetCommand(APIL3Command, id=L3Enum.RANDOM_VALUE_GET):
     n_bytes: U8Scalar  # Number of bytes to get.
     """The number of random bytes to get."""
+    __specs__ = (
+        ("n_bytes", ScalarDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3RandomValueGetResult(APIL3Result, id=L3Enum.RANDOM_VALUE_GET):
@@ -255,6 +328,10 @@ class TsL3RandomValueGetResult(APIL3Result, id=L3Enum.RANDOM_VALUE_GET):
     random_data: U8Array = datafield(min_size=0, max_size=255)  # Random data
     """The random data from TRNG2 in the number of bytes specified in the
     N_BYTES L3 Field."""
+    __specs__ = (
+        ("padding", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=3, max_size=3, priority=0, is_data=True, default=AUTO)),
+        ("random_data", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=0, max_size=255, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3EccKeyGenerateCommand(APIL3Command, id=L3Enum.ECC_KEY_GENERATE):
@@ -267,6 +344,10 @@ class TsL3EccKeyGenerateCommand(APIL3Command, id=L3Enum.ECC_KEY_GENERATE):
         """P256 Curve - 64-byte long public key."""
         ED25519 = 0x02
         """Ed25519 Curve - 32-byte long public key."""
+    __specs__ = (
+        ("slot", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+        ("curve", ScalarDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3EccKeyGenerateResult(APIL3Result, id=L3Enum.ECC_KEY_GENERATE):
@@ -288,6 +369,12 @@ class TsL3EccKeyStoreCommand(APIL3Command, id=L3Enum.ECC_KEY_STORE):
     k: U8Array = datafield(size=32)  # Key to store
     """The ECC Key to store. The key must be a member of the field given by
     the curve specified in the CURVE L3 Field."""
+    __specs__ = (
+        ("slot", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+        ("curve", ScalarDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+        ("padding", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=12, max_size=12, priority=0, is_data=True, default=AUTO)),
+        ("k", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=32, max_size=32, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3EccKeyStoreResult(APIL3Result, id=L3Enum.ECC_KEY_STORE):
@@ -297,6 +384,9 @@ class TsL3EccKeyStoreResult(APIL3Result, id=L3Enum.ECC_KEY_STORE):
 class TsL3EccKeyReadCommand(APIL3Command, id=L3Enum.ECC_KEY_READ):
     slot: U16Scalar  # ECC Key slot
     """The slot to read the public ECC Key from. Valid values are 0 - 31."""
+    __specs__ = (
+        ("slot", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3EccKeyReadResult(APIL3Result, id=L3Enum.ECC_KEY_READ):
@@ -322,11 +412,20 @@ class TsL3EccKeyReadResult(APIL3Result, id=L3Enum.ECC_KEY_READ):
     pub_key: U8Array = datafield(min_size=32, max_size=64)  # Public Key
     """The public key from the ECC Key slot as specified in the SLOT L3
     Field."""
+    __specs__ = (
+        ("curve", ScalarDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+        ("origin", ScalarDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+        ("padding", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=13, max_size=13, priority=0, is_data=True, default=AUTO)),
+        ("pub_key", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=32, max_size=64, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3EccKeyEraseCommand(APIL3Command, id=L3Enum.ECC_KEY_ERASE):
     slot: U16Scalar  # ECC Key slot
     """The slot to erase. Valid values are 0 - 31."""
+    __specs__ = (
+        ("slot", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3EccKeyEraseResult(APIL3Result, id=L3Enum.ECC_KEY_ERASE):
@@ -341,6 +440,11 @@ class TsL3EcdsaSignCommand(APIL3Command, id=L3Enum.ECDSA_SIGN):
     """The padding by dummy data."""
     msg_hash: U8Array = datafield(size=32)  # Hash of the Message to sign.
     """The hash of the message to sign (max size of 32 bytes)."""
+    __specs__ = (
+        ("slot", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+        ("padding", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=13, max_size=13, priority=0, is_data=True, default=AUTO)),
+        ("msg_hash", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=32, max_size=32, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3EcdsaSignResult(APIL3Result, id=L3Enum.ECDSA_SIGN):
@@ -353,6 +457,11 @@ class TsL3EcdsaSignResult(APIL3Result, id=L3Enum.ECDSA_SIGN):
     """ECDSA signature - The R part"""
     s: U8Array = datafield(size=32)  # ECDSA Signature - S part
     """ECDSA signature - The S part"""
+    __specs__ = (
+        ("padding", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=15, max_size=15, priority=0, is_data=True, default=AUTO)),
+        ("r", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=32, max_size=32, priority=0, is_data=True, default=0)),
+        ("s", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=32, max_size=32, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3EddsaSignCommand(APIL3Command, id=L3Enum.EDDSA_SIGN):
@@ -363,6 +472,11 @@ class TsL3EddsaSignCommand(APIL3Command, id=L3Enum.EDDSA_SIGN):
     """The padding by dummy data."""
     msg: U8Array = datafield(min_size=0, max_size=4096)  # Message to sign.
     """The message to sign (max size of 4096 bytes)."""
+    __specs__ = (
+        ("slot", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+        ("padding", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=13, max_size=13, priority=0, is_data=True, default=AUTO)),
+        ("msg", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=0, max_size=4096, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3EddsaSignResult(APIL3Result, id=L3Enum.EDDSA_SIGN):
@@ -375,6 +489,11 @@ class TsL3EddsaSignResult(APIL3Result, id=L3Enum.EDDSA_SIGN):
     """EdDSA signature - The R part"""
     s: U8Array = datafield(size=32)  # EDDSA Signature - S part
     """EdDSA signature - The S part"""
+    __specs__ = (
+        ("padding", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=15, max_size=15, priority=0, is_data=True, default=AUTO)),
+        ("r", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=32, max_size=32, priority=0, is_data=True, default=0)),
+        ("s", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=32, max_size=32, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3McounterInitCommand(APIL3Command, id=L3Enum.MCOUNTER_INIT):
@@ -385,6 +504,11 @@ class TsL3McounterInitCommand(APIL3Command, id=L3Enum.MCOUNTER_INIT):
     """The padding by dummy data."""
     mcounter_val: U32Scalar  # Initialization value.
     """The initialization value of the Monotonic Counter."""
+    __specs__ = (
+        ("mcounter_index", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+        ("padding", ScalarDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=1, priority=0, is_data=True, default=AUTO)),
+        ("mcounter_val", ScalarDataField, Params(dtype=Dtype.UINT32, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3McounterInitResult(APIL3Result, id=L3Enum.MCOUNTER_INIT):
@@ -395,6 +519,9 @@ class TsL3McounterUpdateCommand(APIL3Command, id=L3Enum.MCOUNTER_UPDATE):
     mcounter_index: U16Scalar  # Index of Monotonic Counter
     """The index of the Monotonic Counter to update. Valid values are 0 -
     15."""
+    __specs__ = (
+        ("mcounter_index", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3McounterUpdateResult(APIL3Result, id=L3Enum.MCOUNTER_UPDATE):
@@ -411,6 +538,9 @@ class TsL3McounterGetCommand(APIL3Command, id=L3Enum.MCOUNTER_GET):
     mcounter_index: U16Scalar  # Index of Monotonic Counter
     """The index of the Monotonic Counter to get the value of. Valid index
     values are 0 - 15."""
+    __specs__ = (
+        ("mcounter_index", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3McounterGetResult(APIL3Result, id=L3Enum.MCOUNTER_GET):
@@ -423,6 +553,10 @@ class TsL3McounterGetResult(APIL3Result, id=L3Enum.MCOUNTER_GET):
     mcounter_val: U32Scalar  # Initialization value.
     """The value of the Monotonic Counter specified by the MCOUNTER_INDEX L3
     Field."""
+    __specs__ = (
+        ("padding", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=3, max_size=3, priority=0, is_data=True, default=AUTO)),
+        ("mcounter_val", ScalarDataField, Params(dtype=Dtype.UINT32, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3MacAndDestroyCommand(APIL3Command, id=L3Enum.MAC_AND_DESTROY):
@@ -433,6 +567,11 @@ class TsL3MacAndDestroyCommand(APIL3Command, id=L3Enum.MAC_AND_DESTROY):
     """The padding by dummy data."""
     data_in: U8Array = datafield(size=32)  # Input data
     """The data input for the MAC-and-Destroy sequence."""
+    __specs__ = (
+        ("slot", ScalarDataField, Params(dtype=Dtype.UINT16, min_size=1, max_size=1, priority=0, is_data=True, default=0)),
+        ("padding", ScalarDataField, Params(dtype=Dtype.UINT8, min_size=1, max_size=1, priority=0, is_data=True, default=AUTO)),
+        ("data_in", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=32, max_size=32, priority=0, is_data=True, default=0)),
+    )
 
 
 class TsL3MacAndDestroyResult(APIL3Result, id=L3Enum.MAC_AND_DESTROY):
@@ -440,6 +579,10 @@ class TsL3MacAndDestroyResult(APIL3Result, id=L3Enum.MAC_AND_DESTROY):
     """The padding by dummy data."""
     data_out: U8Array = datafield(size=32)  # Output data
     """The data output from the MAC-and-Destroy sequence."""
+    __specs__ = (
+        ("padding", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=3, max_size=3, priority=0, is_data=True, default=AUTO)),
+        ("data_out", ArrayDataField, Params(dtype=Dtype.UINT8, min_size=32, max_size=32, priority=0, is_data=True, default=0)),
+    )
 
 
 class L3API(BaseModel):
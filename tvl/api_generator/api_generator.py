@@ -108,6 +108,20 @@ def get_input_arguments():
         help="\n".join(_templates_args_help),
         metavar="FILE",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of files generated in parallel. Defaults to %(default)s.",
+        metavar="INT",
+    )
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="Generate all the files, including those up to date",
+    )
     return parser.parse_args()
 
 
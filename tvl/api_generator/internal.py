@@ -1,7 +1,9 @@
 import logging
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import InitVar, dataclass, field
 from datetime import datetime
+from functools import partial
 from hashlib import sha256
 from pathlib import Path
 from pprint import pformat
@@ -12,6 +14,12 @@ import jinja2
 import yaml
 
 from tvl.api_generator.grammar import InoutTypeEnum, InputFileModel
+from tvl.generation_cache import (
+    GenerationCache,
+    generator_files,
+    hash_content,
+    template_files,
+)
 
 __version__ = "1.7"
 
@@ -44,6 +52,13 @@ def generate_python_api(model: InputFileModel, _: Path) -> Dict[str, Any]:
         InoutTypeEnum.U32: ["U32Scalar", "U32Array"],
         InoutTypeEnum.U64: ["U64Scalar", "U64Array"],
     }
+    PYTHON_FIELD_TYPES = ["ScalarDataField", "ArrayDataField"]
+    PYTHON_DTYPES = {
+        InoutTypeEnum.U8: "Dtype.UINT8",
+        InoutTypeEnum.U16: "Dtype.UINT16",
+        InoutTypeEnum.U32: "Dtype.UINT32",
+        InoutTypeEnum.U64: "Dtype.UINT64",
+    }
 
     def to_dict(lst: List[Any]) -> List[Dict[str, Any]]:
         return [x.dict() for x in lst]
@@ -117,16 +132,27 @@ def generate_python_api(model: InputFileModel, _: Path) -> Dict[str, Any]:
                     }
                     size = max_size_value
                 _size = size if size != 1 else None
+                name = arg.name.lower()
+
+                # Precomputed field specification, trusted by the message class
+                spec = {
+                    "type": PYTHON_FIELD_TYPES[_size is not None],
+                    "dtype": PYTHON_DTYPES[arg.type],
+                    "min_size": arg.min_size if arg.size is None else arg.size,
+                    "max_size": arg.max_size if arg.size is None else arg.size,
+                    "default": "AUTO" if name == "padding" else "0",
+                }
 
                 message_dct["arguments"].append(
                     {
-                        "name": arg.name.lower(),
+                        "name": name,
                         "description": arg.description,
                         "description_long": format_descr(arg.description_long),
                         "dtype": arg_type[_size is not None],
                         "choices": to_dict(arg.choices)
                         if arg.choices is not None
                         else None,
+                        "spec": spec,
                         **size_dct,
                     }
                 )
@@ -149,6 +175,10 @@ def proc_python(filename: Path) -> None:
     )
 
 
+def no_post_processing(_: Path) -> None:
+    pass
+
+
 def generate_c_api(model: InputFileModel, output_file: Path) -> Dict[str, Any]:
     def to_dict(lst: List[Any]) -> List[Dict[str, Any]]:
         return [x.dict() for x in lst]
@@ -252,7 +282,7 @@ class LanguageInfo:
     comment_tag: str
     template: InitVar[str]
     generate_fn: Callable[[InputFileModel, Path], Dict[str, Any]]
-    post_processing_fn: Callable[[Path], None] = lambda _: None
+    post_processing_fn: Callable[[Path], None] = no_post_processing
     default_template: Path = field(init=False)
     template_extension: str = field(init=False)
 
@@ -370,30 +400,73 @@ def create_param_list(
     ]
 
 
+def compute_cache_key(input_file: Path, params: Params) -> str:
+    """Hash everything an API file is generated from."""
+    if (template_file := params.template) is None:
+        template_file = params.language_info.default_template
+    return hash_content(
+        __version__,
+        *generator_files(TOOL),
+        params.language_info.name,
+        input_file,
+        template_file.name,
+        *template_files(template_file),
+    )
+
+
 def generate_api_files(
     input_file: Path,
     output_files: List[Path],
     templates: Optional[List[Path]] = None,
+    jobs: int = 1,
+    force: bool = False,
     **_: Any,
 ) -> None:
     """Generate API files from an API description file
 
+    The files generated from the same API description file and templates
+    since their last generation are skipped.
+
     Args:
         input_file (Path): path to the API description file
         output_files (List[Path]): paths to the API files to be generated
         templates: (List[Path], optional):
             templates to render the configuration with. Defaults to None.
+        jobs (int, optional): number of files generated in parallel.
+            Defaults to 1.
+        force (bool, optional): generate all the files, even those
+            up to date. Defaults to False.
     """
-    api_model = open_api_description_file(input_file)
-
     if not (param_list := create_param_list(output_files, templates)):
         raise APIGeneratorError("Nothing to generate, check your inputs.")
 
+    cache = GenerationCache()
+    keys = {params: compute_cache_key(input_file, params) for params in param_list}
+    if not force:
+        for params in param_list:
+            if cache.is_up_to_date(params.output_file, keys[params]):
+                __logger.info("%s up to date.", params.output_file)
+                del keys[params]
+    if not keys:
+        __logger.info("API files up to date.")
+        return
+
+    api_model = open_api_description_file(input_file)
+
     __logger.info("Generating header.")
     header = prepare_header(input_file)
     __logger.debug("header= %s", LogMapping(header))
 
     __logger.info("Generating API files.")
-    for params in param_list:
-        generate(header, api_model, params)
+    if jobs > 1 and len(keys) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            # consume the results to raise the exceptions of the workers
+            list(executor.map(partial(generate, header, api_model), keys))
+    else:
+        for params in keys:
+            generate(header, api_model, params)
+
+    for params, key in keys.items():
+        cache.update(params.output_file, key)
+    cache.save()
     __logger.info("API files generated.")
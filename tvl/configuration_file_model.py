@@ -1,8 +1,7 @@
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-import yaml
-from pydantic import BaseModel, Extra, StrictBool, StrictBytes
+from pydantic import BaseModel, Extra, StrictBool, StrictBytes, StrictStr, conint
 from typing_extensions import TypedDict
 
 from .constants import (
@@ -13,14 +12,18 @@ from .constants import (
     S_HI_PUB_NB_SLOTS,
     SPECT_FW_VERSION_SIZE,
 )
+from .lazy_import import lazy_import
 from .targets.model.configuration_object_impl import ConfigurationObjectImplModel
 from .targets.model.internal.ecc_keys import EccModel
 from .targets.model.internal.mcounter import MCountersModel
 from .targets.model.internal.mac_and_destroy import MacAndDestroyDataModel
 from .targets.model.internal.pairing_keys import PairingKeysModel
+from .targets.model.internal.timing import LatencyTableModel
 from .targets.model.internal.user_data_partition import UserDataPartitionModel
 from .typing_utils import FixedSizeBytes, RangedInt, SizedBytes, SizedList
 
+yaml = lazy_import("yaml")
+
 
 class _BaseModel(BaseModel):
     class Config:
@@ -35,6 +38,8 @@ class HostConfigurationModel(_BaseModel):
     pairing_key_index: RangedInt[0, S_HI_PUB_NB_SLOTS - 1]
     activate_encryption: Optional[StrictBool]
     debug_random_value: Optional[StrictBytes]
+    rng_seed: Optional[conint(strict=True, ge=0)]  # type: ignore
+    rng_backend: Optional[StrictStr]
 
 
 class ModelConfigurationModel(_BaseModel):
@@ -55,9 +60,12 @@ class ModelConfigurationModel(_BaseModel):
     riscv_fw_version: Optional[FixedSizeBytes[RISCV_FW_VERSION_SIZE]]
     spect_fw_version: Optional[FixedSizeBytes[SPECT_FW_VERSION_SIZE]]
     debug_random_value: Optional[StrictBytes]
+    rng_seed: Optional[conint(strict=True, ge=0)]  # type: ignore
+    rng_backend: Optional[StrictStr]
     activate_encryption: Optional[StrictBool]
     init_byte: Optional[FixedSizeBytes[1]]
     busy_iter: Optional[List[StrictBool]]
+    latencies: Optional[LatencyTableModel]
 
 
 class ConfigurationFileModel(_BaseModel):
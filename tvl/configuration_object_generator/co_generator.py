@@ -91,6 +91,12 @@ def get_input_arguments():
         help="Template file; defaults to %(default)s",
         metavar="FILE",
     )
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="Generate the output file even if up to date",
+    )
     return parser.parse_args()
 
 
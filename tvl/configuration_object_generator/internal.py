@@ -7,7 +7,14 @@ from typing import Any, Dict, TypedDict
 
 import jinja2
 
-__version__ = "0.4"
+from tvl.generation_cache import (
+    GenerationCache,
+    generator_files,
+    hash_content,
+    template_files,
+)
+
+__version__ = "0.5"
 
 TOOL = Path(__file__).parent
 TEMPLATE_DIR = TOOL / "templates"
@@ -131,12 +138,28 @@ def render(template: Path, *, header: HeaderDict, context: ContextDict) -> str:
 
 
 def generate_configuration_object(
-    input_file: Path, output_file: Path, template: Path, **_: Any
+    input_file: Path,
+    output_file: Path,
+    template: Path,
+    force: bool = False,
+    **_: Any,
 ) -> None:
     __logger.debug("input_file = %s", input_file)
     __logger.debug("output_file = %s", output_file)
     __logger.debug("template_file = %s", template)
 
+    cache = GenerationCache()
+    key = hash_content(
+        __version__,
+        *generator_files(TOOL),
+        input_file,
+        template.name,
+        *template_files(template),
+    )
+    if not force and cache.is_up_to_date(output_file, key):
+        __logger.info("Output file up to date.")
+        return
+
     __logger.info("Processing input file.")
     header = create_header(input_file)
     context = create_context(input_file)
@@ -149,4 +172,6 @@ def generate_configuration_object(
     __logger.info("Writing output file.")
     with open(output_file, "w") as fd:
         fd.write(content)
+    cache.update(output_file, key)
+    cache.save()
     __logger.info("Output file written.")
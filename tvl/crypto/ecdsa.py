@@ -1,11 +1,14 @@
-from typing import Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Tuple
 
-from Crypto.PublicKey.ECC import EccPoint
 from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
 
 from .tmac import tmac
 
+if TYPE_CHECKING:
+    from Crypto.PublicKey.ECC import EccPoint
+
 
 class P256_PARAMETERS:
     G = [
@@ -19,10 +22,23 @@ class P256_PARAMETERS:
     """Cofactor of the subgroup generated by G"""
 
 
-ECDSA_G = EccPoint(*P256_PARAMETERS.G, curve="secp256r1")
 ECDSA_KEY_SIZE = 64
 
 
+@lru_cache(maxsize=None)
+def _generator() -> "EccPoint":
+    # pycryptodome takes long to import: only import it when signing
+    from Crypto.PublicKey.ECC import EccPoint
+
+    return EccPoint(*P256_PARAMETERS.G, curve="secp256r1")
+
+
+def __getattr__(name: str) -> Any:
+    if name == "ECDSA_G":
+        return _generator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class SignatureError(Exception):
     pass
 
@@ -104,7 +120,7 @@ def ecdsa_sign_second_part(d: bytes, z: bytes, k_int: int) -> Tuple[bytes, bytes
     Second part of the ECDSA signing algorithm.
     The computation of k is separated from the rest so the testing is easier.
     """
-    g = ECDSA_G * k_int
+    g = _generator() * k_int
     r_int = int(g.x) % P256_PARAMETERS.q
     _assert_not_zero(r_int)
 
@@ -1,11 +1,14 @@
+from functools import lru_cache
 from hashlib import sha512
-from typing import Literal, Protocol, Tuple
+from typing import TYPE_CHECKING, Any, Literal, Protocol, Tuple
 
-from Crypto.PublicKey.ECC import EccPoint
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
 from .tmac import tmac
 
+if TYPE_CHECKING:
+    from Crypto.PublicKey.ECC import EccPoint
+
 
 class ED25519_PARAMETERS:
     G = [
@@ -19,10 +22,23 @@ class ED25519_PARAMETERS:
     """Cofactor of the subgroup generated by G"""
 
 
-EDDSA_B = EccPoint(*ED25519_PARAMETERS.G, curve="ed25519")
 EDDSA_KEY_SIZE = 32
 
 
+@lru_cache(maxsize=None)
+def _base_point() -> "EccPoint":
+    # pycryptodome takes long to import: only import it when signing
+    from Crypto.PublicKey.ECC import EccPoint
+
+    return EccPoint(*ED25519_PARAMETERS.G, curve="ed25519")
+
+
+def __getattr__(name: str) -> Any:
+    if name == "EDDSA_B":
+        return _base_point()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class EdDSAComputeRFn(Protocol):
     def __call__(
         self, s: bytes, prefix: bytes, a: bytes, m: bytes, h: bytes, n: bytes
@@ -100,7 +116,7 @@ def eddsa_sign(
     """
     r_int = compute_r_fn(s, prefix, a, m, h, n)
 
-    b_ = EDDSA_B * r_int
+    b_ = _base_point() * r_int
     r_ = b_.y | ((b_.x & 1) << 255)
     r_ = _to_bytes(r_, size=32)
 
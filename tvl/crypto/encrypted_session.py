@@ -1,6 +1,10 @@
+import os
+import queue
+import threading
+from functools import lru_cache
 from hashlib import sha256
 from hmac import HMAC
-from typing import Optional, Protocol, Tuple
+from typing import NamedTuple, Optional, Protocol, Tuple
 
 from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.asymmetric.x25519 import (
@@ -21,11 +25,76 @@ IV_LEN = 12
 """Length of AES-GCM initialization vector, aka nonce."""
 
 
+KEY_POOL_SIZE = 16
+"""Default number of ephemeral key pairs generated in advance."""
+
+
 class _RandomSource(Protocol):
     def urandom(self, size: int, /) -> bytes:
         ...
 
 
+class KeyPair(NamedTuple):
+    private_key: X25519PrivateKey
+    public_key: bytes
+    """Raw bytes of the public key"""
+
+
+def _key_pair(private_bytes: bytes) -> KeyPair:
+    private_key = X25519PrivateKey.from_private_bytes(private_bytes)
+    return KeyPair(private_key, private_key.public_key().public_bytes_raw())
+
+
+class EphemeralKeyPool:
+    """X25519 key pairs generated in advance by a background thread.
+
+    The keys are drawn from the operating system, so the pool only serves the
+    sessions whose random source is not deterministic: the handshakes remain
+    reproducible with a debug random value or a seed.
+    """
+
+    def __init__(self, size: int = KEY_POOL_SIZE) -> None:
+        """Initialize the pool.
+
+        Args:
+            size (int, optional): number of key pairs generated in advance.
+                Defaults to KEY_POOL_SIZE.
+        """
+        if size < 1:
+            raise ValueError(f"Size should be positive; got {size}")
+        self.keys: "queue.Queue[KeyPair]" = queue.Queue(size)
+        self.lock = threading.Lock()
+        self.thread: Optional[threading.Thread] = None
+        self.nb_misses = 0
+        """Number of key pairs generated upon request, the pool being empty"""
+
+    def _fill(self) -> None:
+        while True:
+            self.keys.put(_key_pair(os.urandom(X25519_KEY_LEN)))
+
+    def get(self) -> KeyPair:
+        """Get a key pair, generated now if the pool is empty.
+
+        The background thread is started upon the first call.
+        """
+        if self.thread is None:
+            with self.lock:
+                if self.thread is None:
+                    self.thread = threading.Thread(target=self._fill, daemon=True)
+                    self.thread.start()
+        try:
+            return self.keys.get_nowait()
+        except queue.Empty:
+            self.nb_misses += 1
+            return _key_pair(os.urandom(X25519_KEY_LEN))
+
+
+@lru_cache(maxsize=None)
+def get_ephemeral_key_pool() -> EphemeralKeyPool:
+    """Get the ephemeral key pool shared by the sessions of the process."""
+    return EphemeralKeyPool()
+
+
 def hkdf(salt: bytes, input_keying_material: bytes) -> Tuple[bytes, bytes]:
     temp_key = HMAC(salt, input_keying_material, sha256).digest()
     output1 = HMAC(temp_key, b"\x01", sha256).digest()
@@ -47,14 +116,22 @@ class EncryptedSessionBase:
     common to the host and the Tropic chip.
     """
 
-    def __init__(self, random_source: _RandomSource) -> None:
+    def __init__(
+        self,
+        random_source: _RandomSource,
+        key_pool: Optional[EphemeralKeyPool] = None,
+    ) -> None:
         """Initialize a new encrypted session.
 
         Args:
             random_source (_RandomSource): source of entropy for key generation
+            key_pool (EphemeralKeyPool, optional): pool of ephemeral keys,
+                used unless the random source is deterministic.
+                Defaults to None.
         """
         self.reset()
         self.random_source = random_source
+        self.key_pool = key_pool
 
     def reset(self) -> None:
         self.nonce_cmd = -1
@@ -100,10 +177,12 @@ class EncryptedSessionBase:
             self.reset()
             raise AssertionError("Nonces out of sync.")
 
-    def _generate_private_key(self) -> X25519PrivateKey:
-        return X25519PrivateKey.from_private_bytes(
-            self.random_source.urandom(X25519_KEY_LEN)
-        )
+    def _generate_key_pair(self) -> KeyPair:
+        if self.key_pool is not None and not getattr(
+            self.random_source, "is_deterministic", True
+        ):
+            return self.key_pool.get()
+        return _key_pair(self.random_source.urandom(X25519_KEY_LEN))
 
 
 class HostEncryptedSession(EncryptedSessionBase):
@@ -116,11 +195,12 @@ class HostEncryptedSession(EncryptedSessionBase):
         super().reset()
         # Host ephemeral X25519 key. Valid only during handshake.
         self.eh_private_key: Optional[X25519PrivateKey] = None
+        self.eh_public_key = b""
 
     def create_handshake_request(self) -> bytes:
         # Generate ephemeral host key pair.
-        self.eh_private_key = self._generate_private_key()
-        return self.eh_private_key.public_key().public_bytes_raw()
+        self.eh_private_key, self.eh_public_key = self._generate_key_pair()
+        return self.eh_public_key
 
     def process_handshake_response(
         self,
@@ -139,7 +219,7 @@ class HostEncryptedSession(EncryptedSessionBase):
 
         # Convert locally stored public keys to bytes.
         sh_public_key = sh_private_key_obj.public_key().public_bytes_raw()
-        eh_public_key = self.eh_private_key.public_key().public_bytes_raw()
+        eh_public_key = self.eh_public_key
 
         # Compute shared secrets.
         secret_eh_et = self.eh_private_key.exchange(et_public_key_obj)
@@ -148,6 +228,7 @@ class HostEncryptedSession(EncryptedSessionBase):
 
         # Invalidate host's ephemeral key, since it's no longer needed.
         self.eh_private_key = None
+        self.eh_public_key = b""
 
         # Compute the session's symmetric keys.
         expected_authentication_tag = self.execute_handshake(
@@ -212,8 +293,7 @@ class TropicEncryptedSession(EncryptedSessionBase):
         eh_public_key_obj = X25519PublicKey.from_public_bytes(eh_public_key)
 
         # Generate Tropic's ephemeral key pair.
-        et_private_key_obj = self._generate_private_key()
-        et_public_key = et_private_key_obj.public_key().public_bytes_raw()
+        et_private_key_obj, et_public_key = self._generate_key_pair()
 
         # Convert static public keys to bytes.
         st_public_key = st_private_key_obj.public_key().public_bytes_raw()
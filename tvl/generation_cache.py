@@ -0,0 +1,89 @@
+"""Content-hash cache of the files produced by the code generators.
+
+An output file is regenerated only if the hash of everything it is generated
+from (generator version and sources, input file, templates...) changed since it was last
+generated, or if the file itself was modified or deleted in the meantime.
+The hashes are stored in a JSON file in the directory of the output files.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Union
+
+CACHE_FILENAME = ".generation_cache.json"
+
+
+def hash_content(*items: Union[str, bytes, Path]) -> str:
+    """Compute the SHA-256 of several items.
+
+    Args:
+        *items: strings, bytes or paths to files whose content is hashed
+
+    Returns:
+        the hexadecimal digest
+    """
+    sha256 = hashlib.sha256()
+    for item in items:
+        if isinstance(item, Path):
+            item = item.read_bytes()
+        elif isinstance(item, str):
+            item = item.encode()
+        # prefix with the length so that the items cannot be confused
+        sha256.update(len(item).to_bytes(8, "big"))
+        sha256.update(item)
+    return sha256.hexdigest()
+
+
+def template_files(template: Path) -> Iterable[Path]:
+    """Files a template may extend or include: all the files of its directory."""
+    return sorted(p for p in template.parent.iterdir() if p.is_file())
+
+
+def generator_files(tool: Path) -> Iterable[Path]:
+    """Source files of a generator: the Python files of its package."""
+    return sorted(tool.glob("*.py"))
+
+
+class GenerationCache:
+    """Hashes of the inputs and of the content of the generated files"""
+
+    def __init__(self) -> None:
+        self.entries: Dict[Path, Dict[str, Dict[str, str]]] = {}
+
+    def _entries(self, directory: Path) -> Dict[str, Dict[str, str]]:
+        if (entries := self.entries.get(directory)) is None:
+            try:
+                entries = json.loads((directory / CACHE_FILENAME).read_text())
+            except (OSError, ValueError):
+                entries = {}
+            self.entries[directory] = entries
+        return entries
+
+    def is_up_to_date(self, output_file: Path, key: str) -> bool:
+        """Check whether a file was generated from the same inputs and is intact.
+
+        Args:
+            output_file (Path): the generated file
+            key (str): hash of the inputs of the generation
+
+        Returns:
+            True if the file does not need to be generated again
+        """
+        entry = self._entries(output_file.resolve().parent).get(output_file.name)
+        if entry is None or entry["key"] != key or not output_file.is_file():
+            return False
+        return entry["content"] == hash_content(output_file)
+
+    def update(self, output_file: Path, key: str) -> None:
+        """Record the inputs of a file which was just generated."""
+        self._entries(output_file.resolve().parent)[output_file.name] = {
+            "key": key,
+            "content": hash_content(output_file),
+        }
+
+    def save(self) -> None:
+        for directory, entries in self.entries.items():
+            (directory / CACHE_FILENAME).write_text(
+                json.dumps(entries, indent=2, sort_keys=True) + "\n"
+            )
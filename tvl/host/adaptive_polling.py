@@ -0,0 +1,114 @@
+"""Polling schedules adapted to the latencies observed for each message type.
+
+A `LatencyTracker` keeps the latencies after which the responses to a type of
+message were ready, estimated from the waits preceding the polling attempts.
+The first wait of the next polling is a percentile of these latencies, the
+following ones back off exponentially. The time is the one of the target, as
+passed to `TropicProtocol.wait`.
+"""
+
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence
+
+
+class AdaptivePolling:
+    """Settings of the adaptive polling and latency trackers by message type"""
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 50,
+        window: int = 32,
+        backoff: float = 2,
+        min_retry_wait: int = 10,
+        max_retry_wait: int = 100_000,
+    ) -> None:
+        """Initialize the adaptive polling.
+
+        Args:
+            percentile (float, optional): percentile of the observed latencies
+                waited before the first polling attempt. Defaults to 50.
+            window (int, optional): number of latencies kept per message
+                type. Defaults to 32.
+            backoff (float, optional): factor between two successive waits
+                after the first polling attempt. Defaults to 2.
+            min_retry_wait (int, optional): wait before the second polling
+                attempt if the `retry_wait` parameter is lower, in
+                microseconds. Defaults to 10.
+            max_retry_wait (int, optional): maximum wait between two polling
+                attempts, in microseconds. Defaults to 100_000.
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Percentile should be in [0, 100]; got {percentile}")
+        if window < 1:
+            raise ValueError(f"Window should be positive; got {window}")
+        if backoff < 1:
+            raise ValueError(f"Backoff should be at least 1; got {backoff}")
+        self.percentile = percentile
+        self.window = window
+        self.backoff = backoff
+        self.min_retry_wait = min_retry_wait
+        self.max_retry_wait = max_retry_wait
+        self.trackers: Dict[str, LatencyTracker] = {}
+        """Latency trackers, by message type"""
+
+    def tracker(self, name: str) -> "LatencyTracker":
+        """Get the latency tracker of a message type, created if needed."""
+        if (tracker := self.trackers.get(name)) is None:
+            tracker = self.trackers[name] = LatencyTracker(self)
+        return tracker
+
+    def estimates(self) -> Dict[str, Optional[float]]:
+        """Estimated latency of each message type, in microseconds."""
+        return {name: tracker.estimate() for name, tracker in self.trackers.items()}
+
+
+class LatencyTracker:
+    """Latencies observed for one message type"""
+
+    def __init__(self, polling: AdaptivePolling) -> None:
+        self.polling = polling
+        self.latencies: Deque[float] = deque(maxlen=polling.window)
+        """Latest latencies, in microseconds"""
+
+    def estimate(self) -> Optional[float]:
+        """Percentile of the latest latencies, None if none was observed."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[round(self.polling.percentile / 100 * (len(ordered) - 1))]
+
+    def schedule(self, max_polling: int, wait: int, retry_wait: int) -> List[int]:
+        """Time to wait before each polling attempt.
+
+        Args:
+            max_polling (int): number of polling attempts
+            wait (int): wait before the first attempt until a latency is
+                observed, in microseconds
+            retry_wait (int): wait before the second attempt, in microseconds
+
+        Returns:
+            the waits, in microseconds
+        """
+        if (estimate := self.estimate()) is not None:
+            wait = round(estimate)
+        waits = [wait]
+        step = float(max(retry_wait, self.polling.min_retry_wait))
+        for _ in range(max_polling - 1):
+            waits.append(min(round(step), self.polling.max_retry_wait))
+            step *= self.polling.backoff
+        return waits[:max_polling]
+
+    def record(self, waits: Sequence[int], nb_attempts: int) -> None:
+        """Record the latency of a response ready after some polling attempts.
+
+        The response got ready between the last two attempts: the middle of
+        this interval is recorded, so that the estimate also decreases when
+        the first attempt succeeds.
+        """
+        waited = sum(waits[:nb_attempts])
+        self.latencies.append(waited - waits[nb_attempts - 1] / 2)
+
+    def record_timeout(self, waits: Sequence[int]) -> None:
+        """Record that no response was ready after all the polling attempts."""
+        self.latencies.append(sum(waits))
@@ -29,7 +29,7 @@ from ..constants import (
     L2StatusEnum,
     L3ResultFieldEnum,
 )
-from ..crypto.encrypted_session import HostEncryptedSession
+from ..crypto.encrypted_session import EphemeralKeyPool, HostEncryptedSession
 from ..messages.l2_messages import L2Request, L2Response
 from ..messages.l3_messages import L3Command, L3EncryptedPacket, L3Result
 from ..random_number_generator import RandomNumberGenerator
@@ -77,6 +77,9 @@ class Host:
         ),
         function_factory: Optional[FunctionFactory] = None,
         debug_random_value: Optional[bytes] = None,
+        rng_seed: Optional[int] = None,
+        rng_backend: str = "shake256",
+        key_pool: Optional[EphemeralKeyPool] = None,
         logger: Optional[logging.Logger] = None,
     ) -> None:
         def __i(value: Optional[T], default: Callable[[], T]) -> T:
@@ -106,8 +109,10 @@ class Host:
         Valid once the host and Tropic chip have been paired."""
         self.pairing_key_index = __i(pairing_key_index, lambda: -1)
         """Index at which the host public key is stored in the Tropic chip"""
-        self.rng = RandomNumberGenerator(debug_random_value)
-        self.session = HostEncryptedSession(random_source=self.rng)
+        self.rng = RandomNumberGenerator(
+            debug_random_value, seed=rng_seed, backend=rng_backend
+        )
+        self.session = HostEncryptedSession(random_source=self.rng, key_pool=key_pool)
         """Encrypted session"""
         self.activate_encryption = activate_encryption
         """Encrypt L3-layer messages"""
@@ -140,6 +145,8 @@ class Host:
             "pairing_key_index": self.pairing_key_index,
             "activate_encryption": self.activate_encryption,
             "debug_random_value": self.rng.debug_random_value,
+            "rng_seed": self.rng.seed,
+            "rng_backend": self.rng.backend,
         }
 
     @classmethod
@@ -156,6 +163,8 @@ class Host:
             **__s("pairing_key_index"),
             **__s("activate_encryption"),
             **__s("debug_random_value"),
+            **__s("rng_seed"),
+            **__s("rng_backend"),
         )
 
     def set_logger(self, logger: logging.Logger) -> Self:
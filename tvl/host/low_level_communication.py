@@ -9,6 +9,7 @@ from typing import (
     Mapping,
     NamedTuple,
     Optional,
+    Sequence,
     Tuple,
     Type,
     TypedDict,
@@ -16,12 +17,17 @@ from typing import (
     cast,
 )
 
-from ..api.l2_api import TsL2EncryptedCmdRequest, TsL2EncryptedCmdResponse
+from ..api.l2_api import (
+    TsL2EncryptedCmdRequest,
+    TsL2EncryptedCmdResponse,
+    TsL2ResendRequest,
+)
 from ..constants import MIN_L2_FRAME_LEN, L1ChipStatusFlag, L2IdFieldEnum, L2StatusEnum
 from ..messages.l2_messages import L2Request, L2Response
 from ..messages.l3_messages import L3Command, L3Result
 from ..messages.message import Message
 from ..protocols import TropicProtocol
+from .adaptive_polling import AdaptivePolling, LatencyTracker
 from .protocols import LLSendL2RequestFn, LLSendL3CommandFn
 
 F = TypeVar("F", bound=Callable[..., Any])
@@ -47,6 +53,13 @@ class UnexpectedError(Exception):
     pass
 
 
+class InvalidFrameError(Exception):
+    pass
+
+
+_RESEND_REQUEST = TsL2ResendRequest().to_bytes()
+
+
 def _send(data: bytes, target: TropicProtocol, logger: logging.Logger) -> None:
     logger.info("++ Sending raw data ++")
 
@@ -61,65 +74,106 @@ def _send(data: bytes, target: TropicProtocol, logger: logging.Logger) -> None:
     target.spi_drive_csn_high()
 
 
-def ll_receive(
+def _log_status(recvd: bytes, logger: logging.Logger) -> None:
+    # CHIP_STATUS field - one byte
+    chip_status = recvd[0]
+    try:
+        chip_status = L1ChipStatusFlag(chip_status)
+        logger.debug(f"CHIP_STATUS: {chip_status!s}.")
+    except ValueError:
+        logger.debug(f"Unknown CHIP_STATUS: {chip_status:#04x}.")
+
+    # STATUS field - one byte
+    status = recvd[1]
+    try:
+        status = L2StatusEnum(status)
+        logger.debug(f"STATUS: {status!s}.")
+    except ValueError:
+        logger.debug(f"Unknown STATUS: {status:#04x}.")
+
+
+def _get_resp(target: TropicProtocol, logger: logging.Logger) -> bytes:
+    # start communication
+    logger.info("Driving Chip Select to LOW.")
+    target.spi_drive_csn_low()
+
+    # send GET_RESP and a few padding bytes
+    recvd = target.spi_send(bytes([L2IdFieldEnum.GET_RESP]) + bytes(MIN_L2_FRAME_LEN))
+    _log_status(recvd, logger)
+    return recvd
+
+
+def _poll_status(target: TropicProtocol, logger: logging.Logger) -> Optional[bytes]:
+    """Poll for the STATUS byte, leave Chip Select LOW if a response is ready."""
+    recvd = _get_resp(target, logger)
+
+    # if a response is ready, fetch it
+    if recvd[1] != L2StatusEnum.NO_RESP:
+        return recvd
+
+    # end communication otherwise
+    logger.info("Driving Chip Select to HIGH.")
+    target.spi_drive_csn_high()
+    return None
+
+
+def _poll_irq(target: TropicProtocol, logger: logging.Logger) -> Optional[bytes]:
+    """Check the IRQ, then poll for the STATUS byte if a response is ready."""
+    # check a new l2 response is ready
+    if not target.irq_state():
+        return None
+    return _poll_status(target, logger)
+
+
+PollFn = Callable[[TropicProtocol, logging.Logger], Optional[bytes]]
+
+
+def _schedule(max_polling: int, wait: int, retry_wait: int) -> List[int]:
+    """Time to wait before each polling attempt"""
+    return [wait, *repeat(retry_wait, max_polling - 1)][:max_polling]
+
+
+def _receive(
     target: TropicProtocol,
     logger: logging.Logger,
-    max_polling: int = 10,
-    wait: int = 0,
-    retry_wait: int = 0,
-) -> bytes:
-    if wait > 0:
-        logger.info("Waiting before polling.")
-        logger.debug(f"Wait time: {wait} us.")
-        target.wait(wait)
-
+    poll_fn: PollFn,
+    waits: Sequence[int],
+) -> Tuple[bytes, int]:
+    """Poll the target until a response is ready and fetch it.
+
+    Args:
+        target (TropicProtocol): the target
+        logger (logging.Logger): the logger
+        poll_fn (PollFn): single polling attempt
+        waits (Sequence[int]): time to wait before each attempt, in us
+
+    Raises:
+        TargetTimeoutError: no response ready after the last attempt
+
+    Returns:
+        the response and the number of attempts
+    """
     # poll for status
     logger.info("Polling for STATUS byte.")
 
-    for i in range(start := 1, max_polling + start):
-        # wait a bit until next try except at the beginning of the loop
-        if i != start and retry_wait > 0:
-            logger.info("Waiting before next try.")
-            logger.debug(f"Retry wait time: {retry_wait} us.")
-            target.wait(retry_wait)
+    for i, wait in enumerate(waits, start := 1):
+        # wait a bit until next try
+        if wait > 0:
+            if i == start:
+                logger.info("Waiting before polling.")
+                logger.debug(f"Wait time: {wait} us.")
+            else:
+                logger.info("Waiting before next try.")
+                logger.debug(f"Retry wait time: {wait} us.")
+            target.wait(wait)
 
         logger.debug(f"- attempt no. {i}.")
 
-        # start communication
-        logger.info("Driving Chip Select to LOW.")
-        target.spi_drive_csn_low()
-
-        # send GET_RESP and a few padding bytes
-        recvd = target.spi_send(
-            bytes([L2IdFieldEnum.GET_RESP]) + bytes(MIN_L2_FRAME_LEN)
-        )
-
-        # CHIP_STATUS field - one byte
-        chip_status = recvd[0]
-        try:
-            chip_status = L1ChipStatusFlag(chip_status)
-            logger.debug(f"CHIP_STATUS: {chip_status!s}.")
-        except ValueError:
-            logger.debug(f"Unknown CHIP_STATUS: {chip_status:#04x}.")
-
-        # STATUS field - one byte
-        status = recvd[1]
-        try:
-            status = L2StatusEnum(status)
-            logger.debug(f"STATUS: {status!s}.")
-        except ValueError:
-            logger.debug(f"Unknown STATUS: {status:#04x}.")
-
-        # if a response is ready, fetch it
-        if status is not L2StatusEnum.NO_RESP:
+        if (recvd := poll_fn(target, logger)) is not None:
             break
 
-        # end communication otherwise
-        logger.info("Driving Chip Select to HIGH.")
-        target.spi_drive_csn_high()
-
     else:
-        raise TargetTimeoutError(f"Target not ready after {max_polling} attempts.")
+        raise TargetTimeoutError(f"Target not ready after {len(waits)} attempts.")
 
     # start accumulating bytes
     response = recvd[1:]
@@ -138,81 +192,94 @@ def ll_receive(
     target.spi_drive_csn_high()
 
     logger.debug(f"Received {response}.")
-    return response
+    return response, i
 
 
-def ll_receive_check_irq(
+def ll_receive(
     target: TropicProtocol,
     logger: logging.Logger,
     max_polling: int = 10,
     wait: int = 0,
     retry_wait: int = 0,
 ) -> bytes:
-    if wait > 0:
-        logger.info("Waiting before polling.")
-        logger.debug(f"Wait time: {wait} us.")
-        target.wait(wait)
+    waits = _schedule(max_polling, wait, retry_wait)
+    return _receive(target, logger, _poll_status, waits)[0]
 
-    # poll for status
-    logger.info("Polling for STATUS byte.")
 
-    for i in range(start := 1, max_polling + start):
-        # wait a bit until next try except at the beginning of the loop
-        if i != start and retry_wait > 0:
-            logger.info("Waiting before next try.")
-            logger.debug(f"Retry wait time: {retry_wait} us.")
-            target.wait(retry_wait)
-
-        logger.debug(f"- attempt no. {i}.")
+def ll_receive_check_irq(
+    target: TropicProtocol,
+    logger: logging.Logger,
+    max_polling: int = 10,
+    wait: int = 0,
+    retry_wait: int = 0,
+) -> bytes:
+    waits = _schedule(max_polling, wait, retry_wait)
+    return _receive(target, logger, _poll_irq, waits)[0]
 
-        # check a new l2 response is ready
-        if target.irq_state():
-            break
 
-    else:
-        raise TargetTimeoutError(f"Target not ready after {max_polling} attempts.")
+def ll_receive_adaptive(
+    target: TropicProtocol,
+    logger: logging.Logger,
+    tracker: LatencyTracker,
+    max_polling: int = 10,
+    wait: int = 0,
+    retry_wait: int = 0,
+    use_irq: bool = False,
+) -> bytes:
+    """Receive a response, waiting as long as the tracked latencies suggest.
 
-    # start communication
-    logger.info("Driving Chip Select to LOW.")
-    target.spi_drive_csn_low()
+    The `wait` and `retry_wait` parameters are only used until latencies
+    are observed, see `LatencyTracker.schedule`.
+    """
+    waits = tracker.schedule(max_polling, wait, retry_wait)
+    logger.debug(f"Adaptive polling schedule: {waits} us.")
+    try:
+        response, nb_attempts = _receive(
+            target, logger, _poll_irq if use_irq else _poll_status, waits
+        )
+    except TargetTimeoutError:
+        tracker.record_timeout(waits)
+        raise
+    tracker.record(waits, nb_attempts)
+    return response
 
-    # send GET_RESP and a few padding bytes
-    recvd = target.spi_send(bytes([L2IdFieldEnum.GET_RESP]) + bytes(MIN_L2_FRAME_LEN))
 
-    # CHIP_STATUS field - one byte
-    chip_status = recvd[0]
-    try:
-        chip_status = L1ChipStatusFlag(chip_status)
-        logger.debug(f"CHIP_STATUS: {chip_status!s}.")
-    except ValueError:
-        logger.debug(f"Unknown CHIP_STATUS: {chip_status:#04x}.")
+def is_valid_frame(frame: bytes) -> bool:
+    """Check the LEN and CRC fields of a received L2 frame.
 
-    # STATUS field - one byte
-    status = recvd[1]
-    try:
-        status = L2StatusEnum(status)
-        logger.debug(f"STATUS: {status!s}.")
-    except ValueError:
-        logger.debug(f"Unknown STATUS: {status:#04x}.")
+    Args:
+        frame (bytes): the L2 frame
 
-    # start accumulating bytes
-    response = recvd[1:]
+    Returns:
+        True if the frame is consistent, False if it was garbled
+    """
+    if len(frame) < MIN_L2_FRAME_LEN or frame[1] != len(frame) - MIN_L2_FRAME_LEN:
+        return False
+    return L2Response.with_length(len(frame)).from_bytes(frame).has_valid_crc()
 
-    # LEN field - one byte
-    rsp_len = response[1]
-    logger.debug(f"RSP_LEN: {rsp_len:#04x}.")
 
-    # fetching remaining bytes
-    if rsp_len > 0:
-        logger.debug(f"Fetching {rsp_len} remaining bytes.")
-        response += target.spi_send(bytes(rsp_len))
+def _receive_valid(
+    target: TropicProtocol,
+    logger: logging.Logger,
+    receive_fn: ReceiveFn,
+    max_resend: int,
+) -> bytes:
+    """Receive a frame, asking for it again with Resend_Req if it is invalid.
 
-    # end communication
-    logger.info("Driving Chip Select to HIGH.")
-    target.spi_drive_csn_high()
+    The frames are not checked if `max_resend` is 0.
 
-    logger.debug(f"Received {response}.")
-    return response
+    Raises:
+        InvalidFrameError: still invalid after `max_resend` Resend_Req
+    """
+    for i in range(max_resend + 1):
+        if i > 0:
+            logger.info("Invalid frame, requesting the target to resend it.")
+            logger.debug(f"Resend request no. {i}.")
+            _send(_RESEND_REQUEST, target, logger)
+        response = receive_fn(target, logger)
+        if max_resend <= 0 or is_valid_frame(response):
+            return response
+    raise InvalidFrameError(f"Frame still invalid after {max_resend} resend(s).")
 
 
 def ll_send_l2_request(
@@ -220,9 +287,10 @@ def ll_send_l2_request(
     target: TropicProtocol,
     logger: logging.Logger,
     receive_fn: ReceiveFn = ll_receive,
+    max_resend: int = 0,
 ) -> bytes:
     _send(data, target, logger)
-    return receive_fn(target, logger)
+    return _receive_valid(target, logger, receive_fn, max_resend)
 
 
 def ll_send_l3_command(
@@ -233,6 +301,7 @@ def ll_send_l3_command(
     send_chunk_fn: LLSendL2RequestFn = ll_send_l2_request,
     l3_receive_fn: ReceiveFn = ll_receive,
     receive_chunk_fn: ReceiveFn = ll_receive,
+    max_resend: int = 0,
 ) -> List[bytes]:
     def _check_status_is_req_cont(status: int) -> None:
         if status != L2StatusEnum.REQ_CONT:
@@ -269,7 +338,7 @@ def ll_send_l3_command(
         chain([l3_receive_fn], repeat(receive_chunk_fn, times=max_recvd)),
         start=1,
     ):
-        result_chunk = receive_fn(target, logger)
+        result_chunk = _receive_valid(target, logger, receive_fn, max_resend)
         logger.debug(f"Receiving chunk {i}.")
         result_chunks.append(result_chunk)
         if result_chunk[0] != L2StatusEnum.RES_CONT:
@@ -296,11 +365,26 @@ def partialize(base_fn: F, fn_params: OptParam = None) -> F:
 
 
 class LowLevelFunctionFactory:
-    """Factory for parametrizing the low level functions"""
+    """Factory for parametrizing the low level functions
 
-    def __init__(self, parameters: Optional[Params] = None) -> None:
+    If `use_irq` is set, the responses are fetched once the IRQ pin of the
+    target signals them ready instead of polling the target with GET_RESP.
+    If `polling` is set, the waits between the polling attempts are adapted
+    to the latencies observed for each message type, see `AdaptivePolling`.
+    """
+
+    def __init__(
+        self,
+        parameters: Optional[Params] = None,
+        *,
+        use_irq: bool = False,
+        polling: Optional[AdaptivePolling] = None,
+    ) -> None:
         if parameters is None:
             parameters = {}
+        self.use_irq = use_irq
+        self.receive_fn: ReceiveFn = ll_receive_check_irq if use_irq else ll_receive
+        self.polling = polling
         self.parameters = parameters
 
     @property
@@ -371,6 +455,23 @@ class LowLevelFunctionFactory:
     ) -> Tuple[OptParam, OptParam]:
         return self._get_params(__type, __id, tx=L3Command, rx=L3Result)
 
+    def _create_receive_fn(
+        self, __type: Type[Message], __id: Optional[int], param: OptParam
+    ) -> ReceiveFn:
+        if self.polling is None:
+            return partialize(self.receive_fn, param)
+        name = __type.__name__
+        if getattr(__type, "ID", None) is None and isinstance(__id, int):
+            name += f"[{__id:#04x}]"
+        return partialize(
+            partial(
+                ll_receive_adaptive,
+                tracker=self.polling.tracker(name),
+                use_irq=self.use_irq,
+            ),
+            param,
+        )
+
     @lru_cache
     def create_ll_l2_fn(
         self, __type: Type[L2Request], __id: Optional[int] = None
@@ -378,7 +479,7 @@ class LowLevelFunctionFactory:
         tx_param, rx_param = self.get_l2_params(__type, __id)
         return partialize(
             partialize(ll_send_l2_request, tx_param),
-            {"receive_fn": partialize(ll_receive, rx_param)},
+            {"receive_fn": self._create_receive_fn(__type, __id, rx_param)},
         )
 
     @lru_cache
@@ -390,9 +491,10 @@ class LowLevelFunctionFactory:
             partialize(ll_send_l3_command, tx_param),
             {
                 "send_chunk_fn": self.create_ll_l2_fn(TsL2EncryptedCmdRequest),
-                "l3_receive_fn": partialize(ll_receive, rx_param),
-                "receive_chunk_fn": partialize(
-                    ll_receive,
+                "l3_receive_fn": self._create_receive_fn(__type, __id, rx_param),
+                "receive_chunk_fn": self._create_receive_fn(
+                    TsL2EncryptedCmdResponse,
+                    None,
                     self._get_info(TsL2EncryptedCmdResponse, L2Response).param,
                 ),
             },
@@ -406,3 +508,4 @@ class FnParam(TypedDict, total=False):
     wait: int  # receive
     retry_wait: int  # receive
     max_recvd: int  # L3 command
+    max_resend: int  # L2 request and L3 command
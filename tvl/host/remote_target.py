@@ -0,0 +1,244 @@
+"""Client of the model server, usable as the target of a `Host`.
+
+The frames of the server protocol (tag, length, payload) are exchanged over
+TCP, over a Unix socket or through shared memory. When a target is closed, its
+connection is kept in a pool, so that the next target addressing the same
+server reuses it instead of connecting again.
+"""
+
+import atexit
+import logging
+import socket
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from typing_extensions import Self
+
+from ..server.internal import Buffer, FrameReader, TagEnum
+from ..server.shm_connection import SharedMemoryClient
+from ..server.tcp_connection import TCP_DEFAULT_ADDRESS, TCP_DEFAULT_PORT
+
+
+class SharedMemoryAddress(NamedTuple):
+    name: str
+    """Name of the shared memory segment of the server"""
+
+
+Address = Union[SharedMemoryAddress, Tuple[str, int], str, Path]
+"""(host, port) of a TCP server, path of a Unix socket or shared memory"""
+
+WAIT_PAYLOAD_SIZE = 4
+
+
+class RemoteTargetError(Exception):
+    pass
+
+
+def _key(address: Address) -> Union[Tuple[Any, ...], str]:
+    return address if isinstance(address, tuple) else str(address)
+
+
+class RemoteConnection:
+    """Connection to a model server"""
+
+    def __init__(self, address: Address, timeout: Optional[float] = None) -> None:
+        self.address = address
+        self.transport: Union[socket.socket, SharedMemoryClient]
+        if isinstance(address, SharedMemoryAddress):
+            self.transport = SharedMemoryClient(address.name, timeout)
+        elif isinstance(address, tuple):
+            self.transport = socket.create_connection(address, timeout=timeout)
+            self.transport.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.transport.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        else:
+            self.transport = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.transport.settimeout(timeout)
+            try:
+                self.transport.connect(str(address))
+            except OSError:
+                self.transport.close()
+                raise
+        self.reader = FrameReader(self)
+
+    def receive_into(self, buffer: memoryview) -> int:
+        return self.transport.recv_into(buffer)
+
+    def send(self, data: bytes) -> None:
+        self.transport.sendall(data)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class ConnectionPool:
+    """Idle connections to the model servers, by address"""
+
+    def __init__(self, max_idle: int = 4, timeout: Optional[float] = None) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_idle (int, optional): maximum number of idle connections kept
+                per address. Defaults to 4.
+            timeout (float, optional): timeout of the socket operations of the
+                new connections, in seconds. Defaults to None.
+        """
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self.idle: Dict[Union[Tuple[Any, ...], str], List[RemoteConnection]] = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, address: Address) -> Tuple[RemoteConnection, bool]:
+        """Get an idle connection to a server, or open a new one.
+
+        Returns:
+            the connection and whether it was reused
+        """
+        with self.lock:
+            if connections := self.idle.get(_key(address)):
+                return connections.pop(), True
+        return RemoteConnection(address, self.timeout), False
+
+    def release(self, connection: RemoteConnection) -> None:
+        """Keep a connection for later use, close it if the pool is full."""
+        with self.lock:
+            connections = self.idle.setdefault(_key(connection.address), [])
+            if len(connections) < self.max_idle:
+                connections.append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        """Close all the idle connections."""
+        with self.lock:
+            idle, self.idle = self.idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+
+@lru_cache(maxsize=None)
+def get_connection_pool() -> ConnectionPool:
+    """Get the connection pool of the process, closed at exit."""
+    pool = ConnectionPool()
+    atexit.register(pool.close)
+    return pool
+
+
+class RemoteModelTarget:
+    """Target executing the `TropicProtocol` methods on a model server.
+
+    The connection is opened upon the first request and given back to the
+    pool when the target is closed. The model behind a pooled connection
+    keeps its state: `reset_target` provides a fresh model. If a connection
+    kept from an earlier exchange fails to send a request, or is closed by
+    the server without any reply, the request is sent again once over a new
+    connection. Any other failure raises `RemoteTargetError`, as the server
+    may have processed the request already.
+    """
+
+    def __init__(
+        self,
+        address: Address = (TCP_DEFAULT_ADDRESS, TCP_DEFAULT_PORT),
+        *,
+        pool: Optional[ConnectionPool] = None,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        if pool is None:
+            pool = get_connection_pool()
+        if logger is None:
+            logger = logging.getLogger(self.__class__.__name__.lower())
+        self.address = address
+        self.pool = pool
+        self.logger = logger
+        self.connection: Optional[RemoteConnection] = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Give the connection back to the pool."""
+        if self.connection is not None:
+            self.pool.release(self.connection)
+            self.connection = None
+
+    def _discard(self, connection: RemoteConnection) -> None:
+        connection.close()
+        self.connection = None
+
+    def _exchange(self, tag: TagEnum, payload: bytes = b"") -> bytes:
+        data = Buffer(tag, len(payload), payload).to_bytes()
+        self.logger.debug("Sending %r with %d byte(s).", tag, len(payload))
+        for retry in (False, True):
+            # Only a connection kept from an earlier exchange can be stale
+            stale = True
+            if (connection := self.connection) is None:
+                connection, stale = self.pool.acquire(self.address)
+                self.logger.debug("Connection %s.", "reused" if stale else "opened")
+                self.connection = connection
+            may_retry = stale and not retry
+
+            try:
+                connection.send(data)
+            except (socket.timeout, TimeoutError):
+                self._discard(connection)
+                raise RemoteTargetError(f"{tag!r} not sent in time.") from None
+            except OSError as exc:
+                self._discard(connection)
+                if not may_retry:
+                    raise RemoteTargetError(f"Connection lost: {exc}") from exc
+                self.logger.info("Connection lost, reconnecting: %s", exc)
+                continue
+
+            try:
+                reply = connection.reader.read()
+            except (socket.timeout, TimeoutError):
+                self._discard(connection)
+                raise RemoteTargetError(f"No reply to {tag!r} in time.") from None
+            except (OSError, RuntimeError) as exc:
+                # The server may have processed the request already
+                self._discard(connection)
+                raise RemoteTargetError(f"Connection lost: {exc}") from exc
+            if reply is not None:
+                break
+
+            # Closed by the server before reading the request, e.g. when idle
+            self._discard(connection)
+            if not may_retry:
+                raise RemoteTargetError(f"Connection closed by the server on {tag!r}.")
+            self.logger.info("Connection closed by the server, reconnecting.")
+
+        if reply.tag != tag:
+            if reply.tag == TagEnum.EXCEPTION:
+                raise RemoteTargetError(f"The target raised an exception on {tag!r}.")
+            raise RemoteTargetError(f"Unexpected reply {reply.tag!r} to {tag!r}.")
+        return reply.payload
+
+    def spi_drive_csn_low(self) -> None:
+        self._exchange(TagEnum.SPI_DRIVE_CSN_LOW)
+
+    def spi_drive_csn_high(self) -> None:
+        self._exchange(TagEnum.SPI_DRIVE_CSN_HIGH)
+
+    def spi_send(self, data: bytes) -> bytes:
+        return self._exchange(TagEnum.SPI_SEND, data)
+
+    def power_on(self) -> None:
+        self._exchange(TagEnum.POWER_ON)
+
+    def power_off(self) -> None:
+        self._exchange(TagEnum.POWER_OFF)
+
+    def wait(self, usecs: int) -> None:
+        self._exchange(TagEnum.WAIT, usecs.to_bytes(WAIT_PAYLOAD_SIZE, "little"))
+
+    def irq_state(self) -> bool:
+        return self._exchange(TagEnum.IRQ) == b"\x01"
+
+    def reset_target(self) -> None:
+        """Replace the model behind the connection with a new one."""
+        self._exchange(TagEnum.RESET_TARGET)
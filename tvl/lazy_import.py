@@ -0,0 +1,41 @@
+"""Deferred import of the modules which are long to import.
+
+A module returned by `lazy_import` is registered in `sys.modules` right away
+but only executed when one of its attributes is first accessed, so that
+importing the TVL does not pay for the dependencies a run never uses.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Import a module when one of its attributes is first accessed.
+
+    The parent packages of the module, if any, are imported immediately.
+
+    Args:
+        name (str): absolute name of the module
+
+    Raises:
+        ModuleNotFoundError: the module does not exist
+
+    Returns:
+        the module, executed upon first attribute access
+    """
+    if (module := sys.modules.get(name)) is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+
+    parent, _, child = name.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
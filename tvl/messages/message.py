@@ -1,19 +1,23 @@
 import contextlib
-import functools
 import struct
 from collections import ChainMap
 from itertools import islice
-from typing import Any, Callable, ClassVar, Dict, Iterator, List, Optional, Tuple, Type
-
-from typing_extensions import (
-    Annotated,
-    Self,
-    dataclass_transform,
-    get_args,
-    get_origin,
-    get_type_hints,
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
 )
 
+from typing_extensions import Annotated, Self, dataclass_transform, get_args, get_origin
+
 from ..utils import iter_subclasses
 from .datafield import DataField, Dtype, Params, U8Array, U8Scalar, datafield
 from .endianness import endianness
@@ -30,13 +34,64 @@ from .exceptions import (
 
 _RESERVED_FIELD_NAMES = {"data_field_bytes"}
 
+FieldSpec = Tuple[str, Type[DataField[Any]], Params]
+"""Name, type and parameters of a field"""
+
+
+def _parse_annotations(
+    namespace: Dict[str, Any], existing_fields: Set[str]
+) -> List[FieldSpec]:
+    """Compute the specifications of the fields annotated in a class namespace.
+
+    The annotations of the fields are replaced with the computed parameters
+    and their default values are removed from the namespace.
+
+    Args:
+        namespace (Dict[str, Any]): namespace of the class
+        existing_fields (Set[str]): names of the fields of the base classes
+
+    Returns:
+        the specifications of the fields, in the order of their definition
+    """
+    annotations: Dict[str, Any] = namespace.get("__annotations__", {})
+    specs: List[FieldSpec] = []
+
+    for field_name, field_annot in annotations.items():
+        if field_name in _RESERVED_FIELD_NAMES:
+            raise ReservedFieldNameError(
+                f"Cannot add field '{field_name}': name reserved."
+            )
+        if field_name in existing_fields:
+            raise FieldAlreadyExistsError(
+                f"Cannot add field '{field_name}': already exists."
+            )
+
+        if (origin := get_origin(field_annot)) is ClassVar:
+            continue
+        elif origin is not Annotated:
+            raise UnsupportedTypeAnnotationError(
+                f"Only {ClassVar} and {Annotated} are supported; got {origin}"
+            )
+
+        tp, *params_args = get_args(field_annot)
+
+        if not issubclass(tp, DataField):
+            raise UnsupportedFieldTypeError(f"Field type {tp} not supported.")
+
+        params = Params(**ChainMap(*params_args, namespace.pop(field_name, {})))
+
+        annotations[field_name] = Annotated[tp, params]  # type: ignore
+        specs.append((field_name, tp, params))
 
-def _get_specs(__cls: type, /) -> Iterator[Tuple[str, Type[DataField[Any]], Params]]:
-    return (
-        (name, *get_args(anns))
-        for name, anns in get_type_hints(__cls, include_extras=True).items()
-        if get_origin(anns) is Annotated
-    )
+    return specs
+
+
+def _fixed_format(specs: Iterable[FieldSpec]) -> Optional[str]:
+    """Struct format of the fields, without byte order, None if one of them
+    has a variable size."""
+    if any(params.has_variable_size() for *_, params in specs):
+        return None
+    return "".join(f"{params.min_size}{params.dtype}" for *_, params in specs)
 
 
 @dataclass_transform(kw_only_default=True, field_specifiers=(datafield,))
@@ -45,7 +100,11 @@ class _MetaMessage(type):
     Metaclass of the Message class.
 
     Make sure the field names are unique
-    and add parameters to the DataField objects
+    and add parameters to the DataField objects.
+
+    The specifications of the fields are computed once, when the class is
+    created. If the class provides them in its `__specs__` attribute, they
+    are trusted and the annotations are not inspected.
     """
 
     def __new__(
@@ -55,49 +114,44 @@ class _MetaMessage(type):
         namespace: Dict[str, Any],
         **kwargs: Any,
     ) -> "_MetaMessage":
-        existing_fields = {n for base in bases for n, *_ in _get_specs(base)}
-
-        annotations: Dict[str, Any] = namespace.get("__annotations__", {})
-
-        for field_name, field_annot in annotations.items():
-            if field_name in _RESERVED_FIELD_NAMES:
-                raise ReservedFieldNameError(
-                    f"Cannot add field '{field_name}': name reserved."
-                )
-            if field_name in existing_fields:
-                raise FieldAlreadyExistsError(
-                    f"Cannot add field '{field_name}': already exists."
-                )
-
-            if (origin := get_origin(field_annot)) is ClassVar:
-                continue
-            elif origin is not Annotated:
-                raise UnsupportedTypeAnnotationError(
-                    f"Only {ClassVar} and {Annotated} are supported; got {origin}"
-                )
-
-            tp, *params_args = get_args(field_annot)
-
-            if not issubclass(tp, DataField):
-                raise UnsupportedFieldTypeError(f"Field type {tp} not supported.")
-
-            params = Params(**ChainMap(*params_args, namespace.pop(field_name, {})))
+        if (own_specs := namespace.pop("__specs__", None)) is not None:
+            for field_name, *_ in own_specs:
+                namespace.pop(field_name, None)
+        else:
+            existing_fields = {
+                n for base in bases for n, *_ in getattr(base, "_specs", ())
+            }
+            own_specs = _parse_annotations(namespace, existing_fields)
+        namespace["_own_specs"] = tuple(own_specs)
 
-            annotations[field_name] = Annotated[tp, params]  # type: ignore
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
 
-        return super().__new__(mcs, name, bases, namespace, **kwargs)
+        specs = [
+            spec
+            for klass in reversed(cls.__mro__)
+            for spec in vars(klass).get("_own_specs", ())
+        ]
+        cls._specs = sorted(specs, key=lambda x: x[2].priority)
+        cls._fmt = _fixed_format(cls._specs)
+        return cls
 
 
 class BaseMessage(metaclass=_MetaMessage):
+    _own_specs: ClassVar[Tuple[FieldSpec, ...]]
+    """Specifications of the fields defined by the class itself"""
+    _specs: ClassVar[List[FieldSpec]]
+    """Specifications of all the fields, sorted by priority"""
+    _fmt: ClassVar[Optional[str]]
+    """Struct format of the message without byte order, if of fixed size"""
+
     @classmethod
-    @functools.lru_cache
-    def specs(cls) -> List[Tuple[str, Type[DataField[Any]], Params]]:
+    def specs(cls) -> List[FieldSpec]:
         """Go over the field specifications of the Message.
 
         Returns:
             the list of the field name, type and parameters
         """
-        return sorted(_get_specs(cls), key=lambda x: x[2].priority)
+        return cls._specs
 
     def __init__(self, **kwargs: Any) -> None:
         for name, type_, params in self.specs():
@@ -144,7 +198,7 @@ class BaseMessage(metaclass=_MetaMessage):
         data: bytes,
         /,
         *,
-        fn: Optional[Callable[[Tuple[str, Type[DataField[Any]], Params]], bool]] = None,
+        fn: Optional[Callable[[FieldSpec], bool]] = None,
     ) -> Self:
         """Deserialize a Message instance from bytes representation.
 
@@ -157,6 +211,12 @@ class BaseMessage(metaclass=_MetaMessage):
         Returns:
             Message instance
         """
+        if fn is None and (fmt := cls._fmt) is not None:
+            it = iter(struct.unpack(endianness.fmt + fmt, data))
+            return cls(
+                **{name: list(islice(it, p.min_size)) for name, _, p in cls._specs}
+            )
+
         fmt_dict: Dict[str, Tuple[int, Dtype]] = {}
         varsize_field_name: Optional[str] = None
 
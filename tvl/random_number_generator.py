@@ -1,6 +1,53 @@
+import hashlib
 import os
-from itertools import cycle, islice
-from typing import Optional
+from typing import Callable, Dict, Optional
+
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+POOL_SIZE = 4096
+"""Size of the blocks of random bytes refilling the pool"""
+
+DrbgFn = Callable[[bytes, int, int], bytes]
+"""Deterministic random bit generator: (seed, counter, size) -> random bytes"""
+
+
+def shake256_drbg(seed: bytes, counter: int, size: int) -> bytes:
+    """Generate a block of random bytes with SHAKE256.
+
+    Args:
+        seed (bytes): seed of the generator
+        counter (int): index of the block
+        size (int): the number of bytes to generate
+
+    Returns:
+        the block of random bytes
+    """
+    return hashlib.shake_256(seed + counter.to_bytes(8, "big")).digest(size)
+
+
+def aes_ctr_drbg(seed: bytes, counter: int, size: int) -> bytes:
+    """Generate a block of random bytes with AES-256 in counter mode.
+
+    Args:
+        seed (bytes): seed of the generator
+        counter (int): index of the block
+        size (int): the number of bytes to generate
+
+    Returns:
+        the block of random bytes
+    """
+    nonce = counter.to_bytes(8, "big") + bytes(8)
+    encryptor = Cipher(
+        algorithms.AES(hashlib.sha256(seed).digest()), modes.CTR(nonce)
+    ).encryptor()
+    return encryptor.update(bytes(size))
+
+
+DRBG_BACKENDS: Dict[str, DrbgFn] = {
+    "shake256": shake256_drbg,
+    "aes-ctr": aes_ctr_drbg,
+}
+"""Available deterministic random bit generators, by name"""
 
 
 class RandomNumberGenerator:
@@ -11,16 +58,64 @@ class RandomNumberGenerator:
     Otherwise random numbers will be output.
     This mechanism allows for control over the generation of random numbers
     during tests in debug mode.
+
+    The random numbers are drawn from a pool, refilled by blocks of
+    `POOL_SIZE` bytes either from the operating system or, if a seed is
+    given, from a deterministic random bit generator: the sequence of random
+    bytes only depends on the seed, not on the sizes of the requests.
     """
 
-    def __init__(self, debug_random_value: Optional[bytes] = None) -> None:
+    def __init__(
+        self,
+        debug_random_value: Optional[bytes] = None,
+        *,
+        seed: Optional[int] = None,
+        backend: str = "shake256",
+    ) -> None:
         """Initialize the random number generator.
 
         Args:
             debug_random_value (bytes, optional): debug random value.
                 Defaults to None.
+            seed (int, optional): seed of the deterministic random bit
+                generator. Defaults to None, the random numbers being drawn
+                from the operating system.
+            backend (str, optional): name of the deterministic random bit
+                generator. Defaults to "shake256".
+
+        Raises:
+            ValueError: the seed is negative or the backend is unknown
         """
+        if seed is not None and seed < 0:
+            raise ValueError(f"Negative seed {seed}: expected a seed >= 0.")
+        if backend not in DRBG_BACKENDS:
+            raise ValueError(
+                f"Unknown random bit generator {backend!r}: "
+                f"expected one of {list(DRBG_BACKENDS)}."
+            )
         self.debug_random_value = debug_random_value
+        self.seed = seed
+        self.backend = backend
+        self.pool = b""
+        """Random bytes generated in advance"""
+        self.pool_offset = 0
+        """Position of the next random byte in the pool"""
+        self.counter = 0
+        """Number of blocks generated by the deterministic generator"""
+
+    @property
+    def is_deterministic(self) -> bool:
+        """The random bytes are reproducible: debug random value or seed set"""
+        return self.debug_random_value is not None or self.seed is not None
+
+    def _generate(self, nb_blocks: int) -> bytes:
+        if self.seed is None:
+            return os.urandom(nb_blocks * POOL_SIZE)
+        seed = self.seed.to_bytes(max(1, (self.seed.bit_length() + 7) // 8), "big")
+        drbg = DRBG_BACKENDS[self.backend]
+        blocks = [drbg(seed, self.counter + i, POOL_SIZE) for i in range(nb_blocks)]
+        self.counter += nb_blocks
+        return b"".join(blocks)
 
     def urandom(self, size: int, /, *, swap_endianness: bool = False) -> bytes:
         """Read random bytes from the random number generator.
@@ -33,10 +128,20 @@ class RandomNumberGenerator:
         Returns:
             an array of random bytes
         """
-        if (debug_random_value := self.debug_random_value) is None:
-            return os.urandom(size)
+        if (debug_random_value := self.debug_random_value) is not None:
+            if not debug_random_value:
+                return b""
+            if swap_endianness:
+                debug_random_value = debug_random_value[::-1]
+            repeat = size // len(debug_random_value) + 1
+            return (debug_random_value * repeat)[:size]
 
-        if swap_endianness:
-            debug_random_value = reversed(debug_random_value)
+        if (missing := size - len(self.pool) + self.pool_offset) > 0:
+            self.pool = self.pool[self.pool_offset :] + self._generate(
+                -(-missing // POOL_SIZE)
+            )
+            self.pool_offset = 0
 
-        return bytes(islice(cycle(debug_random_value), size))
+        random_bytes = self.pool[self.pool_offset : self.pool_offset + size]
+        self.pool_offset += size
+        return random_bytes
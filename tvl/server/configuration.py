@@ -1,10 +1,14 @@
+import atexit
 import logging
+import os
+import threading
 from binascii import hexlify
-from functools import singledispatch
+from collections import OrderedDict
+from functools import lru_cache, singledispatch
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Union, cast
+from time import monotonic
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union, cast
 
-import yaml
 from cryptography.hazmat.primitives.asymmetric.x25519 import (
     X25519PrivateKey,
     X25519PublicKey,
@@ -16,13 +20,19 @@ from cryptography.hazmat.primitives.serialization import (
     load_pem_private_key,
     load_pem_public_key,
 )
-from cryptography.x509 import load_pem_x509_certificate
 from pydantic import root_validator  # type: ignore
 from pydantic import BaseModel, Extra, Field, FilePath, StrictBytes
 
 from ..configuration_file_model import ModelConfigurationModel
+from ..lazy_import import lazy_import
+from ..targets.model.base_model import BaseModel as Model
+from ..targets.model.base_model import Partition
+from ..targets.model.internal.snapshot import SNAPSHOT_SUFFIX
 from .logging_utils import LogDict, LogIter
 
+x509 = lazy_import("cryptography.x509")
+yaml = lazy_import("yaml")
+
 DEFAULT_MODEL_CONFIG: Dict[Any, Any] = {
     "i_pairing_keys": {
         0: {
@@ -121,7 +131,7 @@ def _(__value: bytes) -> bytes:
 @load_certificate.register
 def _(__value: Path) -> bytes:
     if __value.suffix == ".pem":
-        return load_pem_x509_certificate(__value.read_bytes()).public_bytes(
+        return x509.load_pem_x509_certificate(__value.read_bytes()).public_bytes(
             Encoding.DER
         )
     if __value.suffix == ".der":
@@ -232,3 +242,163 @@ def dump_configuration(
 ) -> None:
     dump_fn(filepath, cfg)
     logger.debug("Target configuration dumped to %s", filepath)
+
+
+SAVE_DELAY = 0.5
+"""Time without new request to save a file before it is written, in seconds"""
+
+MAX_CACHED_FILES = 16
+"""Number of files whose serialized partitions are kept in memory"""
+
+
+@lru_cache(maxsize=None)
+def _yaml_dumper() -> Any:
+    # libyaml-based dumper is much faster, fall back to the pure Python one.
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _dump_yaml_entry(key: str, value: Any) -> str:
+    return yaml.dump({key: value}, Dumper=_yaml_dumper())
+
+
+class _Fragment(NamedTuple):
+    """YAML serialization of a partition"""
+
+    partition: Partition
+    modifications: int
+    text: str
+
+    def is_valid_for(self, partition: Partition) -> bool:
+        if partition.modifications == 0:
+            # Unmodified partitions of a given file are loaded
+            # from the same configuration, whatever the model.
+            return self.modifications == 0
+        return (
+            self.partition is partition
+            and self.modifications == partition.modifications
+        )
+
+
+class _SaveRequest(NamedTuple):
+    deadline: float
+    model: Model
+    logger: logging.Logger
+
+
+class ConfigurationSaver:
+    """Save the configuration of models to YAML files in a background thread.
+
+    Files with the snapshot suffix are written as binary snapshots instead.
+
+    Requests are debounced: a file is written once no new request to save it
+    was made for `delay` seconds, with the model of the latest request. The
+    partitions which were not modified since they were last written to the
+    file are not serialized again.
+
+    The model is read when the file is written: it should not be used anymore
+    once handed over to the saver.
+    """
+
+    def __init__(self, delay: float = SAVE_DELAY) -> None:
+        self.delay = delay
+        self.condition = threading.Condition()
+        self.write_lock = threading.Lock()
+        self.requests: Dict[Path, _SaveRequest] = {}
+        self.fragments: "OrderedDict[Path, Dict[str, _Fragment]]" = OrderedDict()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def save(self, filepath: Path, model: Model, logger: logging.Logger) -> None:
+        """Request the configuration of the model to be saved.
+
+        Args:
+            filepath (Path): the file to save the configuration to
+            model (Model): the model, not used anymore by the caller
+            logger (logging.Logger): the logger
+        """
+        with self.condition:
+            self.requests[filepath] = _SaveRequest(
+                monotonic() + self.delay, model, logger
+            )
+            self.condition.notify()
+        logger.debug("Target configuration to be dumped to %s", filepath)
+
+    def flush(self) -> None:
+        """Write all the requested files now."""
+        with self.write_lock:
+            self._write(self._pop_requests(None))
+
+    def _pop_requests(self, now: Optional[float]) -> List[Tuple[Path, _SaveRequest]]:
+        with self.condition:
+            popped = [
+                (filepath, request)
+                for filepath, request in self.requests.items()
+                if now is None or request.deadline <= now
+            ]
+            for filepath, _ in popped:
+                del self.requests[filepath]
+        return popped
+
+    def _run(self) -> None:
+        while True:
+            with self.condition:
+                while True:
+                    now = monotonic()
+                    deadline = min(
+                        (r.deadline for r in self.requests.values()), default=None
+                    )
+                    if deadline is not None and deadline <= now:
+                        break
+                    self.condition.wait(None if deadline is None else deadline - now)
+            # Requests are popped and written under the same lock as in `flush`
+            # so an older model never overwrites the file of a newer one.
+            with self.write_lock:
+                self._write(self._pop_requests(monotonic()))
+
+    def _write(self, requests: List[Tuple[Path, _SaveRequest]]) -> None:
+        for filepath, request in requests:
+            try:
+                if filepath.suffix == SNAPSHOT_SUFFIX:
+                    request.model.save_snapshot(filepath)
+                else:
+                    text = self._serialize(filepath, request.model)
+                    tmp_filepath = filepath.with_name(f"{filepath.name}.tmp")
+                    tmp_filepath.write_text(text)
+                    os.replace(tmp_filepath, filepath)
+            except Exception as exc:
+                request.logger.error(
+                    "Failed to dump target configuration to %s:", filepath, exc_info=exc
+                )
+            else:
+                request.logger.debug("Target configuration dumped to %s", filepath)
+
+    def _serialize(self, filepath: Path, model: Model) -> str:
+        fragments = self.fragments.pop(filepath, {})
+        self.fragments[filepath] = fragments
+        while len(self.fragments) > MAX_CACHED_FILES:
+            self.fragments.popitem(last=False)
+
+        entries: Dict[str, str] = {}
+        for name, partition in model.partitions().items():
+            if (fragment := fragments.get(name)) is None or not fragment.is_valid_for(
+                partition
+            ):
+                fragment = _Fragment(
+                    partition,
+                    partition.modifications,
+                    _dump_yaml_entry(name, partition.to_dict()),
+                )
+                fragments[name] = fragment
+            entries[name] = fragment.text
+        for name, value in model.settings_to_dict().items():
+            entries[name] = _dump_yaml_entry(name, value)
+
+        # Same layout as `yaml.dump`, which sorts the keys of the mapping
+        return "".join(entries[name] for name in sorted(entries))
+
+
+@lru_cache(maxsize=None)
+def get_configuration_saver() -> ConfigurationSaver:
+    """Get the configuration saver of the process, flushed at exit."""
+    saver = ConfigurationSaver()
+    atexit.register(saver.flush)
+    return saver
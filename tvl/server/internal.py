@@ -3,14 +3,36 @@ import logging
 from contextlib import ExitStack
 from dataclasses import dataclass
 from enum import Enum, unique
+from functools import partial
+from math import ceil
 from pathlib import Path
-from typing import Any, Callable, ClassVar, NamedTuple, Optional, Protocol, Tuple
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Tuple,
+)
 
 from typing_extensions import Self
 
+from ..constants import MIN_L2_FRAME_LEN
+from ..host.low_level_communication import (
+    ll_receive_check_irq,
+    ll_send_l2_request,
+    ll_send_l3_command,
+)
 from ..protocols import TropicProtocol
+from ..targets.model.internal.snapshot import SNAPSHOT_SUFFIX
 from ..targets.model.tropic01_model import Tropic01Model
-from .configuration import dump_configuration, load_configuration
+from .configuration import get_configuration_saver, load_configuration
+from .stats import ServerStats
+from .trace import TraceDirection, TraceRecorder
 
 _BYTEORDER = "little"
 
@@ -32,8 +54,26 @@ class TagEnum(bytes, Enum):
     POWER_ON = b"\x04"
     POWER_OFF = b"\x05"
     WAIT = b"\x06"
+    # Compound tags, each executed in a single round trip
+    SPI_TRANSACTION = b"\x07"
+    """Drive CSN low, send the payload through SPI and drive CSN high"""
+    L2_REQUEST = b"\x08"
+    """Send the L2 request in payload and poll for its L2 response"""
+    L3_COMMAND = b"\x09"
+    """Send the L2 chunks of an L3 command and receive all the result chunks"""
+    BATCH = b"\x0a"
+    """Process the frames in payload, except batches, in order and return all
+    replies at once"""
+    IRQ = b"\x0b"
+    """Get the state of the IRQ pin; a one-byte payload also enables (1) or
+    disables (0) the notification of the client when a response is ready"""
     # Target-related tag
     RESET_TARGET = b"\x10"
+    SELECT_MODEL = b"\x11"
+    """Attach the connection to a named model shared with other connections"""
+    # Server-related tag
+    STATS = b"\x20"
+    """Get the server statistics, JSON-encoded"""
     # Error tags
     EXCEPTION = b"\xf0"
     """An exception occured during the processing by the target"""
@@ -43,15 +83,33 @@ class TagEnum(bytes, Enum):
     """Server does not provide support for received tag"""
 
 
+def load_model(config_in: Optional[Path], logger: logging.Logger) -> Tropic01Model:
+    """Instantiate the model from a configuration file or a snapshot."""
+    if config_in is not None and config_in.suffix == SNAPSHOT_SUFFIX:
+        logger.info("Loading target snapshot from %s.", config_in)
+        model = Tropic01Model.load_snapshot(config_in)
+    else:
+        model = Tropic01Model.from_dict(load_configuration(config_in, logger))
+    model.set_logger(logging.getLogger("model"))
+    return model
+
+
 def instantiate_model(
     config_in: Optional[Path], config_out: Path, logger: logging.Logger
 ) -> Tuple[Tropic01Model, Callable[[], None]]:
-    """Provide the model and a callback to dump its configuration"""
-    configuration = load_configuration(config_in, logger)
-    model = Tropic01Model.from_dict(configuration).set_logger(
-        logging.getLogger("model")
-    )
-    return model, lambda: dump_configuration(config_out, model.to_dict(), logger)
+    """Provide the model and a callback to dump its configuration.
+
+    The configuration is dumped in the background once the callback is called:
+    the model should not be used afterwards.
+    """
+    model = load_model(config_in, logger)
+    saver = get_configuration_saver()
+    return model, lambda: saver.save(config_out, model, logger)
+
+
+def with_infix(path: Path, infix: str) -> Path:
+    """Insert `infix` between the stem and the suffix of `path`."""
+    return path.with_name(f"{path.stem}.{infix}{path.suffix}")
 
 
 @dataclass
@@ -77,6 +135,84 @@ class Buffer:
     def to_bytes(self) -> bytes:
         return self.tag + _to_bytes(self.length, self.LENGTH_SIZE) + self.payload
 
+    def frame_size(self) -> int:
+        return self.TAG_SIZE + self.LENGTH_SIZE + len(self.payload)
+
+
+def tag_name(tag: bytes) -> str:
+    try:
+        return TagEnum(tag).name
+    except ValueError:
+        return tag.hex()
+
+
+MAX_PAYLOAD_SIZE = 2 ** (8 * Buffer.LENGTH_SIZE) - 1
+
+
+def split_buffers(data: bytes) -> Iterator[Buffer]:
+    """Decode the `Buffer` objects serialized one after the other in `data`."""
+    header_size = Buffer.TAG_SIZE + Buffer.LENGTH_SIZE
+    while data:
+        buffer = Buffer.from_bytes(data[:header_size])
+        buffer.payload = data[header_size : (end := header_size + buffer.length)]
+        if len(buffer.payload) != buffer.length:
+            raise ValueError(f"Truncated frame: {buffer}.")
+        yield buffer
+        data = data[end:]
+
+
+def split_l2_frames(data: bytes) -> List[bytes]:
+    """Split concatenated L2 frames, which are delimited by their LEN field."""
+    frames: List[bytes] = []
+    while data:
+        if len(data) < MIN_L2_FRAME_LEN:
+            raise ValueError(f"Truncated L2 frame: {data!r}.")
+        frames.append(data[: (end := MIN_L2_FRAME_LEN + data[1])])
+        data = data[end:]
+    return frames
+
+
+def receive_upon_irq(target: TropicProtocol, logger: logging.Logger) -> bytes:
+    """Fetch a response once signaled by the IRQ.
+
+    The virtual clock of a model only advances when waited for, so the time
+    left until the response is ready is waited first.
+    """
+    if isinstance(target, Tropic01Model) and (usecs := target.busy_time()) > 0:
+        logger.debug("Waiting %s us for the target.", usecs)
+        target.wait(ceil(usecs))
+    return ll_receive_check_irq(target, logger)
+
+
+def send_l2_request(
+    target: TropicProtocol, data: bytes, logger: logging.Logger
+) -> bytes:
+    """Send an L2 request and fetch its response once signaled by the IRQ."""
+    return ll_send_l2_request(data, target, logger, receive_fn=receive_upon_irq)
+
+
+def send_l3_command(
+    target: TropicProtocol, chunks: List[bytes], logger: logging.Logger
+) -> List[bytes]:
+    """Send an L3 command and fetch its result chunks once signaled by the IRQ."""
+    return ll_send_l3_command(
+        chunks,
+        target,
+        logger,
+        send_chunk_fn=partial(ll_send_l2_request, receive_fn=receive_upon_irq),
+        l3_receive_fn=receive_upon_irq,
+        receive_chunk_fn=receive_upon_irq,
+    )
+
+
+def spi_transaction(target: TropicProtocol, data: bytes) -> bytes:
+    """Send data through SPI with CSN driven low for the whole transfer."""
+    target.spi_drive_csn_low()
+    try:
+        return target.spi_send(data)
+    finally:
+        target.spi_drive_csn_high()
+
 
 class Connection(Protocol):
     def __enter__(self) -> Self:
@@ -88,7 +224,12 @@ class Connection(Protocol):
     def connect(self) -> None:
         ...
 
-    def receive(self, size: Optional[int] = None) -> bytes:
+    def receive_into(self, buffer: memoryview) -> int:
+        """Receive at most `len(buffer)` bytes into `buffer`.
+
+        Blocks until at least one byte is available. Returns the number of
+        bytes received, 0 if the peer closed the connection.
+        """
         ...
 
     def send(self, data: bytes) -> None:
@@ -99,35 +240,92 @@ def connect(connection: Connection) -> None:
     connection.connect()
 
 
-def receive(connection: Connection, logger: logging.Logger) -> Optional[Buffer]:
-    """Receive data from a socket and return a `Buffer` object."""
-
-    def _receive(size: Optional[int] = None) -> bytes:
-        rx = connection.receive(size)
-        logger.debug("Received %d byte(s).", len(rx))
-        logger.debug("%s.", rx)
-        return rx
+FRAME_READER_BUFFER_SIZE = 2 * (
+    Buffer.TAG_SIZE + Buffer.LENGTH_SIZE + 2 ** (8 * Buffer.LENGTH_SIZE) - 1
+)
+
+
+class FrameReader:
+    """Decode `Buffer` objects from the byte stream of a connection.
+
+    The bytes are received into a preallocated buffer, so a read can return
+    part of a frame or several frames at once: complete frames are decoded
+    one after the other and the remaining bytes are kept for the next read.
+    """
+
+    def __init__(
+        self, connection: Connection, size: int = FRAME_READER_BUFFER_SIZE
+    ) -> None:
+        if size < (_m := FRAME_READER_BUFFER_SIZE // 2):
+            raise ValueError(f"Buffer size should be at least {_m} bytes.")
+        self.connection = connection
+        self.data = bytearray(size)
+        self.view = memoryview(self.data)
+        self.start = 0
+        """Index of the first byte not decoded yet"""
+        self.end = 0
+        """Index following the last received byte"""
+
+    def pending(self) -> int:
+        """Number of bytes received but not decoded yet"""
+        return self.end - self.start
+
+    def decode(self) -> Optional[Buffer]:
+        """Decode the next frame, None if it is not fully received yet."""
+        header_size = Buffer.TAG_SIZE + Buffer.LENGTH_SIZE
+        if self.pending() < header_size:
+            return None
+
+        i = self.start + Buffer.TAG_SIZE
+        length = _from_bytes(self.view[i : i + Buffer.LENGTH_SIZE])
+        if self.pending() < header_size + length:
+            return None
+
+        payload_start = self.start + header_size
+        buffer = Buffer(
+            tag=bytes(self.view[self.start : self.start + Buffer.TAG_SIZE]),
+            length=length,
+            payload=bytes(self.view[payload_start : payload_start + length]),
+        )
+        self.start = payload_start + length
+        return buffer
 
-    if (rx := _receive()) == b"":
-        return None
+    def fill(self) -> int:
+        """Receive more bytes from the connection.
+
+        Returns:
+            the number of received bytes, 0 if the connection is closed
+        """
+        if self.start == self.end:
+            self.start = self.end = 0
+        elif self.end == len(self.data):
+            # Move the beginning of the pending frame to the front
+            pending = self.pending()
+            self.data[:pending] = self.view[self.start : self.end]
+            self.start, self.end = 0, pending
+
+        nb_bytes = self.connection.receive_into(self.view[self.end :])
+        self.end += nb_bytes
+        return nb_bytes
+
+    def read(self) -> Optional[Buffer]:
+        """Return the next frame, None if the connection is closed."""
+        while (buffer := self.decode()) is None:
+            if self.fill() == 0:
+                if (_p := self.pending()) > 0:
+                    raise RuntimeError(
+                        f"Connection closed with {_p} byte(s) of incomplete frame."
+                    )
+                return None
+        return buffer
 
-    buffer = Buffer.from_bytes(rx)
 
+def receive(reader: FrameReader, logger: logging.Logger) -> Optional[Buffer]:
+    """Receive the next `Buffer` object from a connection."""
+    if (buffer := reader.read()) is None:
+        return None
     logger.debug("Buffer length field = %(ln)d (%(ln)#x).", {"ln": buffer.length})
-    expected_size = buffer.length + Buffer.TAG_SIZE + Buffer.LENGTH_SIZE
-    logger.debug("Expected size: %d bytes.", expected_size)
-    received_size = len(rx)
-    logger.debug("Received size: %d bytes.", received_size)
-
-    # Return if no more data are expected
-    if (yet_to_receive := expected_size - received_size) <= 0:
-        return buffer
-
-    buffer.payload += _receive(yet_to_receive)
-    if (_p := len(buffer.payload)) != (_l := buffer.length):
-        raise RuntimeError(
-            f"Payload size is {_p} bytes, should be {_l} bytes. Report to development team."
-        )
+    logger.debug("%d byte(s) left in reception buffer.", reader.pending())
     return buffer
 
 
@@ -139,13 +337,82 @@ def send(connection: Connection, buffer: Buffer, logger: logging.Logger) -> None
     connection.send(data)
 
 
+_IRQ_UPDATE_TAGS = (
+    TagEnum.SPI_DRIVE_CSN_HIGH,
+    TagEnum.WAIT,
+    TagEnum.SPI_TRANSACTION,
+    TagEnum.BATCH,
+)
+"""Tags whose processing can end an SPI transaction or the processing of a
+request, after which a response may become ready"""
+_CSN_LOW_TAGS = (
+    TagEnum.SPI_DRIVE_CSN_LOW,
+    TagEnum.SPI_TRANSACTION,
+    TagEnum.L2_REQUEST,
+    TagEnum.L3_COMMAND,
+    TagEnum.BATCH,
+)
+"""Tags whose processing can drive CSN low, deasserting the IRQ pin"""
+
+
+class IrqNotifier:
+    """Notify a client with an `IRQ` frame when a response becomes ready.
+
+    The notifications are enabled by an `IRQ` frame with a payload of 1 and
+    disabled by an `IRQ` frame with a payload of 0. A response becomes ready
+    at the end of the SPI transaction sending the request or reading the
+    previous response or, if the model has latencies, once it was waited for.
+    The client is notified once per rising edge of the IRQ pin, which is
+    deasserted while CSN is low.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.notified = False
+        """The IRQ was seen asserted since CSN was last driven low"""
+
+    def reset(self) -> None:
+        """Forget the notified response, e.g. when the target is replaced."""
+        self.notified = False
+
+    def notification(
+        self, rx_buffer: Buffer, target: TropicProtocol
+    ) -> Optional[Buffer]:
+        """Update the state of the notifications after a frame was processed.
+
+        Args:
+            rx_buffer (Buffer): the processed frame
+            target (TropicProtocol): the target which processed the frame
+
+        Returns:
+            the notification to send after the reply, if any
+        """
+        if rx_buffer.tag == TagEnum.IRQ and rx_buffer.length == 1:
+            self.enabled = rx_buffer.payload != b"\x00"
+            return None
+        if rx_buffer.tag in _CSN_LOW_TAGS:
+            self.notified = False
+        if (
+            self.enabled
+            and not self.notified
+            and rx_buffer.tag in _IRQ_UPDATE_TAGS
+            and target.irq_state()
+        ):
+            self.notified = True
+            return Buffer(TagEnum.IRQ, 1, b"\x01")
+        return None
+
+
 class ProcessingResult(NamedTuple):
     buffer: Buffer
     reset_target: bool = False
 
 
 def process(
-    buffer: Buffer, target: TropicProtocol, logger: logging.Logger
+    buffer: Buffer,
+    target: TropicProtocol,
+    logger: logging.Logger,
+    stats: Optional[ServerStats] = None,
 ) -> ProcessingResult:
     """Process the received data."""
 
@@ -179,6 +446,26 @@ def process(
         logger.debug("Wait time: %(wt)s (%(wt)#x)", {"wt": wait_time})
         execute_command = lambda: target.wait(wait_time)
 
+    elif tag is TagEnum.SPI_TRANSACTION:
+        execute_command = lambda: spi_transaction(target, buffer.payload)
+
+    elif tag is TagEnum.L2_REQUEST:
+        execute_command = lambda: send_l2_request(target, buffer.payload, logger)
+
+    elif tag is TagEnum.L3_COMMAND:
+        execute_command = lambda: b"".join(
+            send_l3_command(target, split_l2_frames(buffer.payload), logger)
+        )
+
+    elif tag is TagEnum.IRQ:
+        execute_command = lambda: bytes([target.irq_state()])
+
+    elif tag is TagEnum.BATCH:
+        return process_batch(buffer, target, logger, stats)
+
+    elif tag is TagEnum.STATS and stats is not None:
+        execute_command = stats.to_json
+
     elif tag is TagEnum.RESET_TARGET:
         return ProcessingResult(Buffer(TagEnum.RESET_TARGET), reset_target=True)
 
@@ -201,6 +488,47 @@ def process(
     return ProcessingResult(Buffer(tag=tag, length=len(result), payload=result))
 
 
+def process_batch(
+    buffer: Buffer,
+    target: TropicProtocol,
+    logger: logging.Logger,
+    stats: Optional[ServerStats] = None,
+) -> ProcessingResult:
+    """Process the frames contained in the payload of a `BATCH` frame.
+
+    The replies are returned concatenated in the payload of a single `BATCH`
+    frame. A batch cannot contain another batch. Processing stops after the first frame requiring the target to be
+    reset, as the following frames would be processed by the former target.
+    """
+    try:
+        sub_buffers = list(split_buffers(buffer.payload))
+    except (RuntimeError, ValueError) as exc:
+        logger.error(exc)
+        return ProcessingResult(Buffer(TagEnum.EXCEPTION))
+    if any(sub_buffer.tag == TagEnum.BATCH for sub_buffer in sub_buffers):
+        logger.error("Nested batch.")
+        return ProcessingResult(Buffer(TagEnum.EXCEPTION))
+    logger.debug("Batch of %d frame(s).", len(sub_buffers))
+
+    replies: List[bytes] = []
+    reset_target = False
+    for sub_buffer in sub_buffers:
+        sub_result, reset_target = process(sub_buffer, target, logger, stats)
+        replies.append(sub_result.to_bytes())
+        if reset_target:
+            logger.info("Target reset requested, skipping rest of the batch.")
+            break
+
+    if (_l := sum(map(len, replies))) > MAX_PAYLOAD_SIZE:
+        logger.error("Batch replies too long: %d bytes.", _l)
+        return ProcessingResult(Buffer(TagEnum.EXCEPTION), reset_target)
+
+    payload = b"".join(replies)
+    return ProcessingResult(
+        Buffer(TagEnum.BATCH, length=len(payload), payload=payload), reset_target
+    )
+
+
 def run_server(
     connection: Connection,
     configuration: Optional[Path],
@@ -210,13 +538,27 @@ def run_server(
         [Optional[Path], Path, logging.Logger],
         Tuple[TropicProtocol, Callable[[], None]],
     ] = instantiate_model,
+    stats: Optional[ServerStats] = None,
+    trace: Optional[Path] = None,
 ) -> None:
-    """Serve the Tropic01Model through the selected connection."""
+    """Serve the Tropic01Model through the selected connection.
 
-    with connection, ExitStack() as stack:
+    The frames received and sent, and the connections of the clients, are
+    recorded to `trace` if it is set.
+    """
+
+    if stats is None:
+        stats = ServerStats()
+
+    with connection, ExitStack() as stack, ExitStack() as trace_stack:
+        recorder: Optional[TraceRecorder] = None
+        if trace is not None:
+            logger.info("Recording frames to %s.", trace)
+            recorder = trace_stack.enter_context(TraceRecorder(trace))
 
         def _instantiate_target() -> Tuple[TropicProtocol, Callable[[], None]]:
             target, save_fn = get_target_fn(configuration, configuration_out, logger)
+            stats.watch(target)
             stack.pop_all().close()
             return stack.enter_context(target), save_fn
 
@@ -224,20 +566,56 @@ def run_server(
         atexit.register(save_fn)
         logger.info("Target instantiated.")
 
-        while True:
-            connect(connection)
-
-            while (rx_buffer := receive(connection, logger)) is not None:
-                logger.debug("Rx buffer: %s", rx_buffer)
-
-                tx_buffer, reset_target = process(rx_buffer, target, logger)
-
-                logger.debug("Tx buffer: %s", tx_buffer)
-                send(connection, tx_buffer, logger)
-
-                if reset_target:
-                    save_fn()
-                    atexit.unregister(save_fn)
-                    target, save_fn = _instantiate_target()
-                    atexit.register(save_fn)
-                    logger.info("Target re-instantiated.")
+        try:
+            while True:
+                connect(connection)
+                reader = FrameReader(connection)
+                notifier = IrqNotifier()
+                stats.connection_opened()
+                if recorder is not None:
+                    recorder.record(TraceDirection.OPEN, b"")
+
+                while (rx_buffer := receive(reader, logger)) is not None:
+                    logger.debug("Rx buffer: %s", rx_buffer)
+                    start = perf_counter()
+                    if recorder is not None:
+                        recorder.record(TraceDirection.RX, rx_buffer.to_bytes())
+
+                    tx_buffer, reset_target = process(rx_buffer, target, logger, stats)
+
+                    logger.debug("Tx buffer: %s", tx_buffer)
+                    send(connection, tx_buffer, logger)
+                    if recorder is not None:
+                        recorder.record(TraceDirection.TX, tx_buffer.to_bytes())
+                    if reset_target:
+                        notification = None
+                        notifier.reset()
+                    else:
+                        notification = notifier.notification(rx_buffer, target)
+                    if notification is not None:
+                        logger.debug("Notifying IRQ.")
+                        send(connection, notification, logger)
+                        if recorder is not None:
+                            recorder.record(TraceDirection.TX, notification.to_bytes())
+                    stats.record_frame(
+                        tag_name(rx_buffer.tag),
+                        rx_buffer.frame_size(),
+                        tx_buffer.frame_size(),
+                        perf_counter() - start,
+                    )
+
+                    if reset_target:
+                        save_fn()
+                        atexit.unregister(save_fn)
+                        target, save_fn = _instantiate_target()
+                        atexit.register(save_fn)
+                        logger.info("Target re-instantiated.")
+
+                stats.connection_closed()
+                if recorder is not None:
+                    recorder.record(TraceDirection.CLOSE, b"")
+                    recorder.flush()
+        finally:
+            # Also save when the server stops without exiting the interpreter
+            save_fn()
+            atexit.unregister(save_fn)
@@ -6,7 +6,9 @@ from pprint import pformat
 from shutil import get_terminal_size
 from typing import Any, Callable, Dict, Iterable, Optional
 
-import yaml
+from ..lazy_import import lazy_import
+
+yaml = lazy_import("yaml")
 
 DEFAULT_LOGGING_CONFIG: Dict[str, Any] = {
     "version": 1,
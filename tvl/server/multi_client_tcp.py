@@ -0,0 +1,253 @@
+import asyncio
+import logging
+import re
+from contextlib import ExitStack
+from itertools import count
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..protocols import TropicProtocol
+from .internal import (
+    Buffer,
+    IrqNotifier,
+    TagEnum,
+    instantiate_model,
+    process,
+    tag_name,
+    with_infix,
+)
+from .stats import ServerStats, start_metrics_server
+
+GetTargetFn = Callable[
+    [Optional[Path], Path, logging.Logger],
+    Tuple[TropicProtocol, Callable[[], None]],
+]
+
+MODEL_NAME_PATTERN = re.compile(r"[A-Za-z0-9_\-]{1,64}")
+"""Allowed names for the shared models, also used in the dump file name"""
+
+
+class InvalidModelNameError(ValueError):
+    pass
+
+
+class TargetSlot:
+    """Target instance with its own configuration dump"""
+
+    def __init__(
+        self,
+        configuration: Optional[Path],
+        configuration_out: Path,
+        logger: logging.Logger,
+        get_target_fn: GetTargetFn,
+        stats: ServerStats,
+    ) -> None:
+        self.configuration = configuration
+        self.configuration_out = configuration_out
+        self.logger = logger
+        self.get_target_fn = get_target_fn
+        self.stats = stats
+        self.stack = ExitStack()
+        self.target: TropicProtocol
+        self.save_fn: Callable[[], None]
+        self._instantiate()
+
+    def _instantiate(self) -> None:
+        target, self.save_fn = self.get_target_fn(
+            self.configuration, self.configuration_out, self.logger
+        )
+        self.stats.watch(target)
+        self.stack.close()
+        self.target = self.stack.enter_context(target)
+        self.logger.info("Target instantiated.")
+
+    def reset(self) -> None:
+        """Save the target configuration and instantiate a new target."""
+        self.save_fn()
+        self._instantiate()
+        self.logger.info("Target re-instantiated.")
+
+    def close(self) -> None:
+        """Save the target configuration and release the target."""
+        self.save_fn()
+        self.stack.close()
+
+
+class MultiClientServer:
+    """Serve Tropic01 models to several clients concurrently.
+
+    Every client is given its own target, instantiated from the same
+    configuration and dumping its configuration to its own file. A client can
+    attach itself to a named target shared with other clients by sending the
+    `SELECT_MODEL` tag with the name of the target as payload; an empty payload
+    brings the client back to its own target.
+
+    Requests are processed one at a time in the event loop, so targets never
+    have to be thread-safe.
+    """
+
+    def __init__(
+        self,
+        configuration: Optional[Path],
+        configuration_out: Path,
+        logger: logging.Logger,
+        get_target_fn: GetTargetFn = instantiate_model,
+        stats: Optional[ServerStats] = None,
+    ) -> None:
+        self.configuration = configuration
+        self.configuration_out = configuration_out
+        self.logger = logger
+        self.get_target_fn = get_target_fn
+        self.stats = ServerStats() if stats is None else stats
+        self.shared_targets: Dict[str, TargetSlot] = {}
+        self.client_ids = count()
+
+    def _new_target(self, infix: str, logger: logging.Logger) -> TargetSlot:
+        return TargetSlot(
+            self.configuration,
+            with_infix(self.configuration_out, infix),
+            logger,
+            self.get_target_fn,
+            self.stats,
+        )
+
+    def get_shared_target(self, name: str) -> TargetSlot:
+        """Get the shared target with the given name, create it if needed.
+
+        Args:
+            name (str): name of the shared target
+
+        Raises:
+            InvalidModelNameError: the name is not valid
+
+        Returns:
+            the shared target
+        """
+        if MODEL_NAME_PATTERN.fullmatch(name) is None:
+            raise InvalidModelNameError(f"Invalid model name: {name!r}.")
+        if (slot := self.shared_targets.get(name)) is None:
+            self.logger.info("Creating shared target %r.", name)
+            slot = self._new_target(f"shared.{name}", self.logger.getChild(name))
+            self.shared_targets[name] = slot
+        return slot
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one client until it disconnects."""
+        client_id = next(self.client_ids)
+        logger = self.logger.getChild(f"client{client_id}")
+        logger.info("New client connected.")
+        logger.debug("New client address: %s", writer.get_extra_info("peername"))
+
+        own_target: Optional[TargetSlot] = None
+        notifier = IrqNotifier()
+        self.stats.connection_opened()
+        try:
+            own_target = slot = self._new_target(str(client_id), logger)
+
+            while (rx_buffer := await receive(reader, logger)) is not None:
+                logger.debug("Rx buffer: %s", rx_buffer)
+                start = perf_counter()
+                notification: Optional[Buffer] = None
+
+                if rx_buffer.tag == TagEnum.SELECT_MODEL:
+                    logger.info("Received tag: %r", TagEnum.SELECT_MODEL)
+                    try:
+                        if (name := rx_buffer.payload.decode()) == "":
+                            slot = own_target
+                        else:
+                            slot = self.get_shared_target(name)
+                    except (UnicodeDecodeError, InvalidModelNameError) as exc:
+                        logger.error(exc)
+                        tx_buffer = Buffer(TagEnum.EXCEPTION)
+                    else:
+                        logger.info("Client now uses target %r.", name or "own")
+                        notifier.reset()
+                        tx_buffer = Buffer(TagEnum.SELECT_MODEL)
+
+                else:
+                    tx_buffer, reset_target = process(
+                        rx_buffer, slot.target, logger, self.stats
+                    )
+                    if reset_target:
+                        slot.reset()
+                        notifier.reset()
+                    else:
+                        notification = notifier.notification(rx_buffer, slot.target)
+
+                logger.debug("Tx buffer: %s", tx_buffer)
+                writer.write(tx_buffer.to_bytes())
+                if notification is not None:
+                    logger.debug("Notifying IRQ.")
+                    writer.write(notification.to_bytes())
+                await writer.drain()
+                self.stats.record_frame(
+                    tag_name(rx_buffer.tag),
+                    rx_buffer.frame_size(),
+                    tx_buffer.frame_size(),
+                    perf_counter() - start,
+                )
+
+        except (ConnectionError, asyncio.IncompleteReadError) as exc:
+            logger.warning("Connection lost: %s", exc)
+        finally:
+            logger.info("Client disconnected.")
+            self.stats.connection_closed()
+            if own_target is not None:
+                own_target.close()
+            writer.close()
+
+    def close(self) -> None:
+        """Save and release the shared targets."""
+        for slot in self.shared_targets.values():
+            slot.close()
+        self.shared_targets.clear()
+
+    async def serve_forever(self, address: str, port: int) -> None:
+        server = await asyncio.start_server(
+            self.handle_client, address, port, reuse_port=True
+        )
+        self.logger.info("Server socket created.")
+        self.logger.debug("Server address: %s", (address, port))
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+
+
+async def receive(
+    reader: asyncio.StreamReader, logger: logging.Logger
+) -> Optional[Buffer]:
+    """Receive a `Buffer` object from a stream, None if the stream is closed."""
+    try:
+        header = await reader.readexactly(Buffer.TAG_SIZE + Buffer.LENGTH_SIZE)
+    except asyncio.IncompleteReadError as exc:
+        if exc.partial:
+            raise
+        return None
+
+    buffer = Buffer.from_bytes(header)
+    logger.debug("Buffer length field = %(ln)d (%(ln)#x).", {"ln": buffer.length})
+    buffer.payload = await reader.readexactly(buffer.length)
+    return buffer
+
+
+def run_multi_client_server_over_tcp(
+    address: str,
+    port: int,
+    configuration: Optional[Path],
+    configuration_out: Path,
+    logger: logging.Logger,
+    metrics_port: Optional[int] = None,
+    **_: Any,
+) -> None:
+    server = MultiClientServer(configuration, configuration_out, logger)
+    if metrics_port is not None:
+        start_metrics_server(server.stats, metrics_port, logger)
+    try:
+        asyncio.run(server.serve_forever(address, port))
+    except KeyboardInterrupt:
+        logger.info("Server stopped.")
@@ -0,0 +1,123 @@
+"""Supervisor of server processes sharing a listening socket.
+
+The workers inherit the listening socket of the supervisor and accept the
+connections on it, so that a connection always goes to an idle worker. With a
+socket per worker bound to the same port with `SO_REUSEPORT`, the kernel would
+spread the connections by hash, possibly to a worker busy with another client.
+
+A worker owns its models and dumps their configuration to its own file, named
+after the `--configuration-out` file with `worker<index>` inserted before the
+extension. The supervisor restarts the workers which exit and stops them all
+with SIGTERM when it is interrupted.
+"""
+
+import logging
+import multiprocessing
+import signal
+from multiprocessing.connection import wait
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, Tuple
+
+from .configuration import get_configuration_saver
+from .internal import with_infix
+
+MIN_UPTIME = 1.0
+"""Workers exiting sooner after their start are restarted after this delay,
+in seconds"""
+STOP_TIMEOUT = 10.0
+"""Time given to the workers to save their configuration, in seconds"""
+
+
+def worker_arguments(index: int, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Give its own files and metrics port to a worker.
+
+    Args:
+        index (int): index of the worker
+        kwargs (Dict[str, Any]): arguments of the server
+
+    Returns:
+        the arguments of the worker
+    """
+    infix = f"worker{index}"
+    kwargs = {
+        **kwargs,
+        "configuration_out": with_infix(kwargs["configuration_out"], infix),
+    }
+    if (trace := kwargs.get("trace")) is not None:
+        kwargs["trace"] = with_infix(trace, infix)
+    if (metrics_port := kwargs.get("metrics_port")) is not None:
+        kwargs["metrics_port"] = metrics_port + index
+    return kwargs
+
+
+def _exit(*_: Any) -> None:
+    raise SystemExit(0)
+
+
+def _run_worker(run_fn: Callable[..., None], kwargs: Dict[str, Any]) -> None:
+    # Only the supervisor handles Ctrl-C, then stops the workers with SIGTERM
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, _exit)
+    try:
+        run_fn(**kwargs)
+    finally:
+        # Worker processes exit without calling the atexit functions
+        get_configuration_saver().flush()
+
+
+def run_prefork_server(
+    workers: int,
+    run_fn: Callable[..., None],
+    logger: logging.Logger,
+    **kwargs: Any,
+) -> None:
+    """Run a server in several worker processes and restart them if they exit.
+
+    Args:
+        workers (int): number of worker processes
+        run_fn (Callable[..., None]): function running the server
+        logger (logging.Logger): the logger
+        kwargs: arguments of `run_fn`, adapted to each worker
+    """
+    context = multiprocessing.get_context("fork")
+    processes: Dict[int, Tuple[Any, float]] = {}
+
+    def _start(index: int) -> None:
+        process = context.Process(
+            target=_run_worker,
+            args=(run_fn, worker_arguments(index, {**kwargs, "logger": logger})),
+            name=f"worker{index}",
+        )
+        process.start()
+        processes[index] = (process, monotonic())
+        logger.info("Worker %d started with PID %d.", index, process.pid)
+
+    sigterm_handler = signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        for index in range(workers):
+            _start(index)
+        while True:
+            sentinels = {p.sentinel: i for i, (p, _) in processes.items()}
+            for sentinel in wait(list(sentinels)):
+                index = sentinels[sentinel]
+                process, start = processes[index]
+                process.join()
+                logger.error(
+                    "Worker %d exited with code %s, restarting it.",
+                    index,
+                    process.exitcode,
+                )
+                if monotonic() - start < MIN_UPTIME:
+                    sleep(MIN_UPTIME)
+                _start(index)
+    except KeyboardInterrupt:
+        logger.info("Stopping the workers.")
+    finally:
+        for process, _ in processes.values():
+            process.terminate()
+        for process, _ in processes.values():
+            process.join(STOP_TIMEOUT)
+            if process.is_alive():
+                process.kill()
+                process.join()
+        signal.signal(signal.SIGTERM, sigterm_handler)
@@ -0,0 +1,176 @@
+import logging
+from concurrent import futures
+from functools import partial
+from pathlib import Path
+from typing import Any, Iterator, List, NamedTuple, Optional, Sequence
+
+from .internal import Buffer, IrqNotifier, load_model, process, tag_name
+from .trace import TraceDirection, read_trace
+
+
+def _hex(buffer: Optional[Buffer]) -> str:
+    return "nothing" if buffer is None else buffer.to_bytes().hex()
+
+
+class Mismatch(NamedTuple):
+    index: int
+    """Index of the request in the trace"""
+    request: Buffer
+    expected: Optional[Buffer]
+    """Response recorded in the trace, None if only the model sent one"""
+    actual: Optional[Buffer]
+    """Response of the replayed model, None if only the trace has one"""
+
+    def __str__(self) -> str:
+        return (
+            f"#{self.index} {tag_name(self.request.tag)}: "
+            f"expected {_hex(self.expected)}, got {_hex(self.actual)}"
+        )
+
+
+class ReplayResult(NamedTuple):
+    trace: Path
+    nb_requests: int
+    mismatches: List[Mismatch]
+
+
+def replay_trace(
+    trace: Path,
+    configuration: Optional[Path],
+    logger: Optional[logging.Logger] = None,
+) -> ReplayResult:
+    """Feed the requests of a trace to a new model and compare its responses
+    with the recorded ones.
+
+    The requests are processed at full speed, regardless of their timestamps.
+    The model has to be deterministic to reproduce the recorded responses:
+    its configuration should set `rng_seed`, as the one of the recorded model.
+    The subscription to the IRQ notifications ends with the recorded
+    connection, as in the server.
+
+    Args:
+        trace (Path): the trace file
+        configuration (Path, optional): configuration file or snapshot of the
+            model, the same as the one of the recorded server
+        logger (logging.Logger, optional): logger. Defaults to None.
+
+    Returns:
+        the number of replayed requests and the differing responses
+    """
+    if logger is None:
+        logger = logging.getLogger("replay")
+    logger.info("Replaying trace %s.", trace)
+
+    target = load_model(configuration, logger)
+    notifier = IrqNotifier()
+    mismatches: List[Mismatch] = []
+    nb_requests = 0
+    request: Optional[Buffer] = None
+    # replies to the last request, followed by its IRQ notification if any
+    expected: List[Buffer] = []
+    replied = False
+    reset_target = False
+
+    def _mismatch(expected_: Optional[Buffer], actual_: Optional[Buffer]) -> None:
+        assert request is not None and logger is not None
+        mismatch = Mismatch(nb_requests - 1, request, expected_, actual_)
+        logger.info("Mismatch: %s", mismatch)
+        mismatches.append(mismatch)
+
+    def _drain() -> None:
+        # the model sent more than recorded, e.g. an IRQ notification
+        for extra in expected:
+            _mismatch(None, extra)
+        expected.clear()
+
+    for record in read_trace(trace):
+        if record.direction in (TraceDirection.OPEN, TraceDirection.CLOSE):
+            # every connection starts unsubscribed from the IRQ notifications
+            if replied:
+                _drain()
+            expected.clear()
+            notifier = IrqNotifier()
+            continue
+
+        buffer = Buffer.from_bytes(record.frame)
+        if record.direction is TraceDirection.RX:
+            _drain()
+            request = buffer
+            actual, reset_target = process(request, target, logger)
+            expected = [actual]
+            if (
+                not reset_target
+                and (notification := notifier.notification(request, target)) is not None
+            ):
+                expected.append(notification)
+            nb_requests += 1
+            replied = False
+            continue
+
+        if request is None:
+            logger.warning("Response without request in %s.", trace)
+            continue
+        replied = True
+        if not expected:
+            # the trace recorded more than the model sent
+            _mismatch(buffer, None)
+        elif (actual := expected.pop(0)).to_bytes() != record.frame:
+            _mismatch(buffer, actual)
+        if reset_target:
+            target = load_model(configuration, logger)
+            notifier.reset()
+            reset_target = False
+
+    # the trace may end before the reply to the last request, e.g. if the
+    # server was killed, but not between the reply and its notification
+    if replied:
+        _drain()
+
+    logger.info("%d request(s), %d mismatch(es).", nb_requests, len(mismatches))
+    return ReplayResult(trace, nb_requests, mismatches)
+
+
+def replay_traces(
+    traces: Sequence[Path],
+    configuration: Optional[Path],
+    workers: int = 1,
+) -> Iterator[ReplayResult]:
+    """Replay several traces, in parallel if `workers` is greater than 1.
+
+    Args:
+        traces (Sequence[Path]): the trace files
+        configuration (Path, optional): configuration file or snapshot of the
+            model
+        workers (int, optional): number of processes. Defaults to 1.
+
+    Yields:
+        the results of the replays, in the order of the traces
+    """
+    replay_fn = partial(replay_trace, configuration=configuration)
+    if workers <= 1:
+        yield from map(replay_fn, traces)
+        return
+    with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(replay_fn, traces)
+
+
+def run_replay(
+    traces: Sequence[Path],
+    configuration: Optional[Path],
+    logger: logging.Logger,
+    workers: int = 1,
+    **_: Any,
+) -> None:
+    failed = False
+    for result in replay_traces(traces, configuration, workers):
+        for mismatch in result.mismatches:
+            logger.error("%s: %s", result.trace, mismatch)
+        failed |= bool(result.mismatches)
+        logger.info(
+            "%s: %d request(s) replayed, %d mismatch(es).",
+            result.trace,
+            result.nb_requests,
+            len(result.mismatches),
+        )
+    if failed:
+        raise SystemExit(1)
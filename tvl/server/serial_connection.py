@@ -2,21 +2,23 @@ import logging
 from pathlib import Path
 from typing import Any, Optional, Union, cast
 
-from serial import Serial
 from typing_extensions import Self
 
+from ..lazy_import import lazy_import
 from .internal import run_server
+from .stats import ServerStats, start_metrics_server
+
+serial = lazy_import("serial")
 
 SERIAL_DEFAULT_PORT = "/dev/ttyUSB0"
 SERIAL_DEFAULT_BAUDRATE = 115200
-SERIAL_BUFFER_SIZE = 3
 
 
 class SerialConnection:
     def __init__(
         self, port: Union[Path, str], baudrate: int, logger: logging.Logger
     ) -> None:
-        self.serial = Serial(str(port), baudrate)
+        self.serial = serial.Serial(str(port), baudrate)
         self.logger = logger
         self.logger.info("Serial comport created.")
         self.logger.debug("Serial port: %s; baudrate: %d", port, baudrate)
@@ -31,11 +33,13 @@ class SerialConnection:
     def connect(self) -> None:
         pass
 
-    def receive(self, size: Optional[int] = None) -> bytes:
-        if size is None:
-            size = SERIAL_BUFFER_SIZE
+    def receive_into(self, buffer: memoryview) -> int:
+        # Block for the first byte, then take whatever else is already waiting
+        size = min(max(self.serial.in_waiting, 1), len(buffer))
         self.logger.debug("Reading %d byte(s).", size)
-        return self.serial.read(size)
+        data = self.serial.read(size)
+        buffer[: (nb_bytes := len(data))] = data
+        return nb_bytes
 
     def send(self, data: bytes) -> None:
         to_send = len(data)
@@ -53,11 +57,18 @@ def run_server_over_serial(
     configuration: Optional[Path],
     configuration_out: Path,
     logger: logging.Logger,
+    metrics_port: Optional[int] = None,
+    trace: Optional[Path] = None,
     **_: Any,
 ) -> None:
+    stats = ServerStats()
+    if metrics_port is not None:
+        start_metrics_server(stats, metrics_port, logger)
     run_server(
         SerialConnection(port, baudrate, logger),
         configuration,
         configuration_out,
         logger,
+        stats=stats,
+        trace=trace,
     )
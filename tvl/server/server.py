@@ -5,15 +5,27 @@ from argparse import ArgumentParser, ArgumentTypeError, RawDescriptionHelpFormat
 from functools import reduce
 from pathlib import Path
 from textwrap import dedent
-from typing import Callable
+from typing import Any, Callable
 
+from ..targets.model.internal.snapshot import SNAPSHOT_SUFFIX
 from .logging_utils import LogDict, configure_logging, dump_logging_configuration
+from .replay import run_replay
 from .serial_connection import (
     SERIAL_DEFAULT_BAUDRATE,
     SERIAL_DEFAULT_PORT,
     run_server_over_serial,
 )
+from .shm_connection import SHM_DEFAULT_NAME, run_server_over_shm
 from .tcp_connection import TCP_DEFAULT_ADDRESS, TCP_DEFAULT_PORT, run_server_over_tcp
+from .trace import TRACE_SUFFIXES
+from .unix_connection import UNIX_DEFAULT_PATH, run_server_over_unix
+
+
+def _run_multi_client_server_over_tcp(**kwargs: Any) -> None:
+    # asyncio is long to import, only load it for this subcommand
+    from .multi_client_tcp import run_multi_client_server_over_tcp
+
+    run_multi_client_server_over_tcp(**kwargs)
 
 
 def get_input_arguments():
@@ -53,9 +65,27 @@ def get_input_arguments():
     parser_tcp = subparsers.add_parser(
         "tcp", description="Serve the Tropic01 model via TCP/IP."
     )
+    parser_tcp_multi = subparsers.add_parser(
+        "tcp-multi",
+        description="Serve one Tropic01 model per client via TCP/IP, "
+        "accepting several clients at the same time.",
+    )
+    parser_unix = subparsers.add_parser(
+        "unix", description="Serve the Tropic01 model via a Unix domain socket."
+    )
+    parser_shm = subparsers.add_parser(
+        "shm",
+        description="Serve the Tropic01 model via shared memory, to a client "
+        "running on the same machine.",
+    )
     parser_serial = subparsers.add_parser(
         "serial", description="Serve the Tropic01 model via serial port."
     )
+    parser_replay = subparsers.add_parser(
+        "replay",
+        description="Replay traces recorded with '--trace' on a new model and "
+        "report the responses differing from the recorded ones.",
+    )
     parser_dump_logging_cfg = subparsers.add_parser(
         "dump-logging-cfg",
         formatter_class=RawDescriptionHelpFormatter,
@@ -67,20 +97,23 @@ def get_input_arguments():
         ),
     )
 
-    for subparser in (parser_tcp, parser_serial):
-        subparser.add_argument(
+    servers = (parser_tcp, parser_tcp_multi, parser_unix, parser_shm, parser_serial)
+    for subparser in (*servers, parser_replay):
+        model_source = subparser.add_mutually_exclusive_group()
+        model_source.add_argument(
             "-c",
             "--configuration",
             type=_existing_file(_is_file, _with_ext(".yml", ".yaml")),
             help="Yaml file from which load the model configuration",
             metavar="FILE",
         )
-        subparser.add_argument(
-            "-o",
-            "--configuration-out",
-            type=_file(_with_ext(".yml", ".yaml")),
-            default=Path.cwd() / (f := ".model_config_save.yaml"),
-            help=f"Yaml file to which save the model configuration. Defaults to ./{f}",
+        model_source.add_argument(
+            "-s",
+            "--snapshot",
+            dest="configuration",
+            type=_existing_file(_is_file, _with_ext(SNAPSHOT_SUFFIX)),
+            help="Binary snapshot from which load the model, much faster "
+            "than a Yaml configuration",
             metavar="FILE",
         )
         subparser.add_argument(
@@ -91,24 +124,85 @@ def get_input_arguments():
             metavar="FILE",
         )
 
+    for subparser in servers:
+        subparser.add_argument(
+            "-o",
+            "--configuration-out",
+            type=_file(_with_ext(".yml", ".yaml", SNAPSHOT_SUFFIX)),
+            default=Path.cwd() / (f := ".model_config_save.yaml"),
+            help="Yaml file to which save the model configuration, or binary "
+            f"snapshot if the extension is {SNAPSHOT_SUFFIX}. Defaults to ./{f}",
+            metavar="FILE",
+        )
+        subparser.add_argument(
+            "-m",
+            "--metrics-port",
+            type=int,
+            help="Expose the server statistics in Prometheus text format "
+            "at http://127.0.0.1:<port>/metrics. Disabled by default",
+            metavar="INT",
+        )
+
+    for subparser in (parser_tcp, parser_unix, parser_shm, parser_serial):
+        subparser.add_argument(
+            "-t",
+            "--trace",
+            type=_file(_with_ext(*TRACE_SUFFIXES)),
+            help="Record the received and sent frames to a binary trace, "
+            "compressed if the extension is .gz or .xz",
+            metavar="FILE",
+        )
+
     parser_tcp.set_defaults(function=run_server_over_tcp)
+    parser_tcp_multi.set_defaults(function=_run_multi_client_server_over_tcp)
+    for subparser in (parser_tcp, parser_tcp_multi):
+        subparser.add_argument(
+            "-a",
+            "--address",
+            type=str,
+            default=TCP_DEFAULT_ADDRESS,
+            help="TCP address. Defaults to %(default)s",
+            metavar="STR",
+        )
+        subparser.add_argument(
+            "-p",
+            "--port",
+            type=int,
+            default=TCP_DEFAULT_PORT,
+            help="TCP port number. Defaults to %(default)s",
+            metavar="INT",
+        )
+
     parser_tcp.add_argument(
-        "-a",
-        "--address",
-        type=str,
-        default=TCP_DEFAULT_ADDRESS,
-        help="TCP address. Defaults to %(default)s",
-        metavar="STR",
-    )
-    parser_tcp.add_argument(
-        "-p",
-        "--port",
+        "-w",
+        "--workers",
         type=int,
-        default=TCP_DEFAULT_PORT,
-        help="TCP port number. Defaults to %(default)s",
+        default=1,
+        help="Number of server processes sharing the port, each with its own "
+        "model and configuration file. Defaults to %(default)s",
         metavar="INT",
     )
 
+    parser_unix.set_defaults(function=run_server_over_unix)
+    parser_unix.add_argument(
+        "-p",
+        "--path",
+        type=Path,
+        default=UNIX_DEFAULT_PATH,
+        help="Path of the socket. Defaults to %(default)s",
+        metavar="FILE",
+    )
+
+    parser_shm.set_defaults(function=run_server_over_shm)
+    parser_shm.add_argument(
+        "-n",
+        "--name",
+        type=str,
+        default=SHM_DEFAULT_NAME,
+        help="Name of the shared memory segment. Defaults to %(default)s",
+        metavar="STR",
+    )
+
     parser_serial.set_defaults(function=run_server_over_serial)
     parser_serial.add_argument(
         "-p",
@@ -127,6 +221,23 @@ def get_input_arguments():
         metavar="INT",
     )
 
+    parser_replay.set_defaults(function=run_replay)
+    parser_replay.add_argument(
+        "traces",
+        type=_existing_file(_is_file, _with_ext(*TRACE_SUFFIXES)),
+        nargs="+",
+        help="Trace files to replay",
+        metavar="TRACE",
+    )
+    parser_replay.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of traces replayed in parallel. Defaults to %(default)s.",
+        metavar="INT",
+    )
+
     parser_dump_logging_cfg.set_defaults(function=dump_logging_configuration)
 
     return vars(parser.parse_args())
@@ -0,0 +1,366 @@
+"""Transport exchanging the frames of the server through shared memory.
+
+The shared memory segment holds the state of both ends and two ring buffers,
+one per direction. Each ring buffer has a single producer and a single
+consumer and is indexed by the numbers of bytes written and read so far,
+stored on their own cache line and each updated by one side only, so no lock
+is needed. The waiting side spins, then yields the CPU, then sleeps, so that
+back-to-back frames are exchanged without any system call when both ends have
+a CPU of their own.
+
+One client is served at a time: a client claims the server by locking the
+segment, the lock being released by the system even if the client dies. The
+client records its PID in the segment, which the server checks while waiting
+for it, so that a dead client is seen as disconnected as with a socket. The
+server records its PID as well: a segment left by a server which died is
+replaced by the next server, but not the segment of a running one.
+"""
+
+import logging
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from time import monotonic, sleep
+from typing import Any, Callable, List, Optional
+
+from typing_extensions import Self
+
+from ..lazy_import import lazy_import
+from .internal import run_server
+from .stats import ServerStats, start_metrics_server
+
+fcntl = lazy_import("fcntl")
+resource_tracker = lazy_import("multiprocessing.resource_tracker")
+shared_memory = lazy_import("multiprocessing.shared_memory")
+
+SHM_DEFAULT_NAME = "tvl_model_server"
+SHM_DEFAULT_CAPACITY = 1 << 17
+"""Size of each ring buffer, large enough for a frame of maximum length"""
+
+SPIN_ITERATIONS = 1000 if (os.cpu_count() or 1) > 1 else 0
+"""Checks before the waiting side yields the CPU, none on a single CPU"""
+YIELD_ITERATIONS = 100
+"""Checks, each after yielding the CPU, before the waiting side sleeps"""
+MAX_SLEEP = 1e-3
+"""Longest sleep of the waiting side, in seconds"""
+LIVENESS_PERIOD = 0.1
+"""Period of the checks that the client is still alive, in seconds"""
+
+# Give the CPU to the other processes, e.g. to the other end on a single CPU
+_yield = getattr(os, "sched_yield", lambda: sleep(0))
+
+_LINE_SIZE = 64
+_WORDS_PER_LINE = _LINE_SIZE // 8
+_HEADER_SIZE = 6 * _LINE_SIZE
+# Indexes of the words of the header, each on its own cache line
+_SERVER_STATE, _CLIENT_STATE, _RX_HEAD, _RX_TAIL, _TX_HEAD, _TX_TAIL = range(
+    0, _HEADER_SIZE // 8, _WORDS_PER_LINE
+)
+# Capacity of the ring buffers and PID of the server, following its state
+_CAPACITY = _SERVER_STATE + 1
+_SERVER_PID = _SERVER_STATE + 2
+# PID of the connected client, following the client state
+_CLIENT_PID = _CLIENT_STATE + 1
+
+# States of the server
+_OPEN = 1
+_CLOSED = 2
+# States of the client
+_IDLE = 0
+_CONNECTED = 1
+_DISCONNECTED = 2
+
+
+def _wait(ready: Callable[[], bool], timeout: Optional[float] = None) -> bool:
+    """Wait until `ready` returns True.
+
+    Returns:
+        False if the timeout, in seconds, expired first
+    """
+    for _ in range(SPIN_ITERATIONS):
+        if ready():
+            return True
+    deadline = None if timeout is None else monotonic() + timeout
+    nb_yields, delay = 0, 0.0
+    while not ready():
+        if deadline is not None and monotonic() >= deadline:
+            return False
+        if delay:
+            sleep(delay)
+        else:
+            _yield()
+        if (nb_yields := nb_yields + 1) > YIELD_ITERATIONS:
+            delay = min(max(2 * delay, 1e-5), MAX_SLEEP)
+    return True
+
+
+def _process_alive(pid: int) -> bool:
+    if pid <= 0:
+        # Not recorded, and 0 would signal the whole process group
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _server_running(shm: Any) -> bool:
+    """Check whether an existing segment is in use, e.g. by a running server."""
+    if shm.size < _HEADER_SIZE:
+        # Not a segment of this transport
+        return True
+    with shm.buf[:_HEADER_SIZE] as header, header.cast("Q") as words:
+        return words[_SERVER_STATE] == _OPEN and _process_alive(words[_SERVER_PID])
+
+
+class _Ring:
+    """Ring buffer with a single producer and a single consumer"""
+
+    def __init__(self, words: memoryview, head: int, tail: int, data: memoryview):
+        self.words = words
+        self.head = head
+        """Index of the number of bytes written, updated by the producer"""
+        self.tail = tail
+        """Index of the number of bytes read, updated by the consumer"""
+        self.data = data
+        self.capacity = len(data)
+
+    def readable(self) -> int:
+        return self.words[self.head] - self.words[self.tail]
+
+    def writable(self) -> int:
+        return self.capacity - self.readable()
+
+    def reset(self) -> None:
+        self.words[self.head] = self.words[self.tail] = 0
+
+    def write(self, data: memoryview) -> int:
+        """Write as many bytes as possible, return their number."""
+        head = self.words[self.head]
+        size = min(len(data), self.capacity - head + self.words[self.tail])
+        start = head % self.capacity
+        first = min(size, self.capacity - start)
+        self.data[start : start + first] = data[:first]
+        self.data[: size - first] = data[first:size]
+        self.words[self.head] = head + size
+        return size
+
+    def read_into(self, buffer: memoryview) -> int:
+        """Read as many bytes as possible, return their number."""
+        tail = self.words[self.tail]
+        size = min(len(buffer), self.words[self.head] - tail)
+        start = tail % self.capacity
+        first = min(size, self.capacity - start)
+        buffer[:first] = self.data[start : start + first]
+        buffer[first:size] = self.data[: size - first]
+        self.words[self.tail] = tail + size
+        return size
+
+
+class _Endpoint(ABC):
+    """End of the shared memory transport"""
+
+    def __init__(self, shm: Any) -> None:
+        self.shm = shm
+        self.views: List[memoryview] = []
+        self.words = self._view(0, _HEADER_SIZE).cast("Q")
+        self.views.append(self.words)
+
+    def _map_rings(self, is_server: bool) -> None:
+        capacity = self.words[_CAPACITY]
+        requests = _Ring(
+            self.words,
+            _RX_HEAD,
+            _RX_TAIL,
+            self._view(_HEADER_SIZE, _HEADER_SIZE + capacity),
+        )
+        responses = _Ring(
+            self.words,
+            _TX_HEAD,
+            _TX_TAIL,
+            self._view(_HEADER_SIZE + capacity, _HEADER_SIZE + 2 * capacity),
+        )
+        if is_server:
+            self.rx, self.tx = requests, responses
+        else:
+            self.rx, self.tx = responses, requests
+
+    def _view(self, start: int, stop: int) -> memoryview:
+        self.views.append(view := self.shm.buf[start:stop])
+        return view
+
+    @abstractmethod
+    def peer_connected(self) -> bool:
+        """The other end is still connected."""
+
+    def wait_readable(self, timeout: Optional[float] = None) -> bool:
+        return _wait(
+            lambda: self.rx.readable() > 0 or not self.peer_connected(), timeout
+        )
+
+    def receive_into(self, buffer: memoryview) -> int:
+        self.wait_readable()
+        return self.rx.read_into(buffer)
+
+    def send(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            if not self.peer_connected():
+                raise BrokenPipeError("Peer disconnected.")
+            view = view[self.tx.write(view) :]
+            if view:
+                _wait(lambda: self.tx.writable() > 0 or not self.peer_connected())
+
+    def release(self) -> None:
+        # The segment cannot be closed while views on it exist
+        for view in reversed(self.views):
+            view.release()
+        self.shm.close()
+
+
+class SharedMemoryConnection(_Endpoint):
+    def __init__(
+        self,
+        name: str,
+        logger: logging.Logger,
+        capacity: int = SHM_DEFAULT_CAPACITY,
+    ) -> None:
+        size = _HEADER_SIZE + 2 * capacity
+        try:
+            shm = shared_memory.SharedMemory(name, create=True, size=size)
+        except FileExistsError:
+            existing = shared_memory.SharedMemory(name)
+            try:
+                running = _server_running(existing)
+            finally:
+                existing.close()
+            if running:
+                if os.name == "posix":
+                    # Attaching registered the segment to be removed at exit
+                    resource_tracker.unregister(existing._name, "shared_memory")
+                raise FileExistsError(f"Shared memory {name} in use.") from None
+            logger.warning("Removing stale shared memory %s.", name)
+            existing.unlink()
+            shm = shared_memory.SharedMemory(name, create=True, size=size)
+        super().__init__(shm)
+        self.words[_CAPACITY] = capacity
+        self.words[_SERVER_PID] = os.getpid()
+        self._map_rings(is_server=True)
+        self.words[_SERVER_STATE] = _OPEN
+        self.next_liveness_check = 0.0
+        self.logger = logger
+        self.logger.info("Shared memory created.")
+        self.logger.debug("Shared memory name: %s; capacity: %d", name, capacity)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.words[_SERVER_STATE] = _CLOSED
+        self.release()
+        self.shm.unlink()
+
+    def _client_alive(self) -> bool:
+        if (now := monotonic()) < self.next_liveness_check:
+            return True
+        self.next_liveness_check = now + LIVENESS_PERIOD
+        if not _process_alive(pid := self.words[_CLIENT_PID]):
+            self.logger.warning("Client with PID %d died.", pid)
+            return False
+        return True
+
+    def peer_connected(self) -> bool:
+        return self.words[_CLIENT_STATE] == _CONNECTED and self._client_alive()
+
+    def connect(self) -> None:
+        self.logger.info("Waiting for new client.")
+        # The previous client disconnected or died
+        if self.words[_CLIENT_STATE] != _IDLE:
+            self.rx.reset()
+            self.tx.reset()
+            self.words[_CLIENT_STATE] = _IDLE
+        _wait(self.peer_connected)
+        self.logger.info("New client connected.")
+
+    def change_buffer_size(self, size: int) -> None:
+        pass
+
+
+class SharedMemoryClient(_Endpoint):
+    """Client end of the shared memory transport.
+
+    Its `recv_into`, `sendall` and `close` methods behave like the ones of a
+    socket.
+    """
+
+    def __init__(self, name: str, timeout: Optional[float] = None) -> None:
+        shm = shared_memory.SharedMemory(name)
+        if os.name == "posix":
+            # Attaching registers the segment to be removed when the client
+            # exits, while the server owns it
+            resource_tracker.unregister(shm._name, "shared_memory")
+        super().__init__(shm)
+        self.timeout = timeout
+        # The server may still be initializing the segment
+        _wait(lambda: self.words[_SERVER_STATE] != 0, timeout)
+        if self.words[_SERVER_STATE] != _OPEN:
+            self.release()
+            raise ConnectionRefusedError(f"Server {name} not open.")
+        self._map_rings(is_server=False)
+        # Claim the server, then wait for it to reset the previous connection
+        if not _wait(self._lock, timeout) or not _wait(
+            lambda: self.words[_CLIENT_STATE] == _IDLE, timeout
+        ):
+            self.release()
+            raise TimeoutError(f"Server {name} busy with another client.")
+        self.words[_CLIENT_PID] = os.getpid()
+        self.words[_CLIENT_STATE] = _CONNECTED
+
+    def _lock(self) -> bool:
+        """Lock the segment until it is closed, False if already locked."""
+        try:
+            fcntl.flock(self.shm._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    def peer_connected(self) -> bool:
+        return self.words[_SERVER_STATE] == _OPEN
+
+    def recv_into(self, buffer: memoryview) -> int:
+        if not self.wait_readable(self.timeout):
+            raise TimeoutError("No data received in time.")
+        return self.rx.read_into(buffer)
+
+    def sendall(self, data: bytes) -> None:
+        self.send(data)
+
+    def close(self) -> None:
+        if self.shm.buf is not None:
+            self.words[_CLIENT_STATE] = _DISCONNECTED
+            self.release()
+
+
+def run_server_over_shm(
+    name: str,
+    configuration: Optional[Path],
+    configuration_out: Path,
+    logger: logging.Logger,
+    metrics_port: Optional[int] = None,
+    trace: Optional[Path] = None,
+    **_: Any,
+) -> None:
+    stats = ServerStats()
+    if metrics_port is not None:
+        start_metrics_server(stats, metrics_port, logger)
+    run_server(
+        SharedMemoryConnection(name, logger),
+        configuration,
+        configuration_out,
+        logger,
+        stats=stats,
+        trace=trace,
+    )
@@ -0,0 +1,197 @@
+import json
+import logging
+import threading
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, DefaultDict, Dict, List
+
+from ..lazy_import import lazy_import
+from ..protocols import TropicProtocol
+from ..targets.model.base_model import BaseModel
+from ..targets.model.internal.instrumentation import Histogram, Stage
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+http_server_lib = lazy_import("http.server")
+
+METRICS_ADDRESS = "127.0.0.1"
+METRICS_PATH = "/metrics"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class ServerStats:
+    """Throughput and latency statistics of the model server"""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.tag_counts: DefaultDict[str, int] = defaultdict(int)
+        self.tag_durations: DefaultDict[str, float] = defaultdict(float)
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.active_connections = 0
+        self.total_connections = 0
+        self.l2_latencies: DefaultDict[str, Histogram] = defaultdict(Histogram)
+        self.l3_latencies: DefaultDict[str, Histogram] = defaultdict(Histogram)
+
+    def connection_opened(self) -> None:
+        with self.lock:
+            self.active_connections += 1
+            self.total_connections += 1
+
+    def connection_closed(self) -> None:
+        with self.lock:
+            self.active_connections -= 1
+
+    def record_frame(
+        self, tag: str, bytes_in: int, bytes_out: int, duration: float
+    ) -> None:
+        """Record a processed frame.
+
+        Args:
+            tag (str): name of the tag of the received frame
+            bytes_in (int): size of the received frame
+            bytes_out (int): size of the sent frame
+            duration (float): processing time in seconds
+        """
+        with self.lock:
+            self.tag_counts[tag] += 1
+            self.tag_durations[tag] += duration
+            self.bytes_in += bytes_in
+            self.bytes_out += bytes_out
+
+    def _record_latency(self, stage: str, name: str, duration: float) -> None:
+        if stage == Stage.L2_REQUEST:
+            latencies = self.l2_latencies
+        elif stage == Stage.L3_COMMAND:
+            latencies = self.l3_latencies
+        else:
+            return
+        with self.lock:
+            latencies[name].observe(duration)
+
+    def watch(self, target: TropicProtocol) -> None:
+        """Record the L2 request and L3 command latencies of a model.
+
+        Targets other than models are not watched.
+
+        Args:
+            target (TropicProtocol): the target to watch
+        """
+        if not isinstance(target, BaseModel):
+            return
+        target.instrumentation.add_hooks(post=self._record_latency)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "tags": {
+                    tag: {"count": count, "duration": self.tag_durations[tag]}
+                    for tag, count in self.tag_counts.items()
+                },
+                "bytes_in": self.bytes_in,
+                "bytes_out": self.bytes_out,
+                "active_connections": self.active_connections,
+                "total_connections": self.total_connections,
+                "l2_latencies": {k: v.to_dict() for k, v in self.l2_latencies.items()},
+                "l3_latencies": {k: v.to_dict() for k, v in self.l3_latencies.items()},
+            }
+
+    def to_json(self) -> bytes:
+        return json.dumps(self.to_dict(), separators=(",", ":")).encode()
+
+    def to_prometheus(self) -> str:
+        """Format the statistics in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def _metric(name: str, type_: str, help_: str) -> None:
+            lines.append(f"# HELP tvl_server_{name} {help_}")
+            lines.append(f"# TYPE tvl_server_{name} {type_}")
+
+        def _histograms(
+            name: str, label: str, histograms: Dict[str, Histogram], help_: str
+        ) -> None:
+            _metric(name, "histogram", help_)
+            for key, histogram in sorted(histograms.items()):
+                for le, count in histogram.cumulative_counts():
+                    lines.append(
+                        f'tvl_server_{name}_bucket{{{label}="{key}",le="{le}"}} {count}'
+                    )
+                lines.append(
+                    f'tvl_server_{name}_sum{{{label}="{key}"}} {histogram.sum}'
+                )
+                lines.append(
+                    f'tvl_server_{name}_count{{{label}="{key}"}} {histogram.count}'
+                )
+
+        with self.lock:
+            _metric("frames_total", "counter", "Number of processed frames per tag.")
+            for tag, count in sorted(self.tag_counts.items()):
+                lines.append(f'tvl_server_frames_total{{tag="{tag}"}} {count}')
+            _metric(
+                "frame_duration_seconds_total",
+                "counter",
+                "Time spent processing frames per tag.",
+            )
+            for tag, duration in sorted(self.tag_durations.items()):
+                lines.append(
+                    f'tvl_server_frame_duration_seconds_total{{tag="{tag}"}} {duration}'
+                )
+            _metric("received_bytes_total", "counter", "Number of received bytes.")
+            lines.append(f"tvl_server_received_bytes_total {self.bytes_in}")
+            _metric("sent_bytes_total", "counter", "Number of sent bytes.")
+            lines.append(f"tvl_server_sent_bytes_total {self.bytes_out}")
+            _metric("active_connections", "gauge", "Number of connected clients.")
+            lines.append(f"tvl_server_active_connections {self.active_connections}")
+            _metric("connections_total", "counter", "Number of accepted clients.")
+            lines.append(f"tvl_server_connections_total {self.total_connections}")
+            _histograms(
+                "l2_request_duration_seconds",
+                "request",
+                self.l2_latencies,
+                "Processing time of the L2 requests by the model.",
+            )
+            _histograms(
+                "l3_command_duration_seconds",
+                "command",
+                self.l3_latencies,
+                "Processing time of the L3 commands by the model.",
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+def start_metrics_server(
+    stats: ServerStats, port: int, logger: logging.Logger
+) -> "ThreadingHTTPServer":
+    """Expose the statistics over HTTP on localhost in a background thread.
+
+    Args:
+        stats (ServerStats): the statistics to expose
+        port (int): the port of the HTTP server
+        logger (logging.Logger): the logger
+
+    Returns:
+        the HTTP server, already serving
+    """
+
+    class _Handler(http_server_lib.BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path != METRICS_PATH:
+                self.send_error(404)
+                return
+            body = stats.to_prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug("Metrics endpoint: " + format, *args)
+
+    http_server = http_server_lib.ThreadingHTTPServer((METRICS_ADDRESS, port), _Handler)
+    threading.Thread(target=http_server.serve_forever, daemon=True).start()
+    logger.info(
+        "Metrics available at http://%s:%d%s", METRICS_ADDRESS, port, METRICS_PATH
+    )
+    return http_server
@@ -6,15 +6,23 @@ from typing import Any, Optional
 from typing_extensions import Self
 
 from .internal import run_server
+from .stats import ServerStats, start_metrics_server
 
 TCP_DEFAULT_ADDRESS = "127.0.0.1"
 TCP_DEFAULT_PORT = 28992
-TCP_BUFFER_SIZE = 1024
 
 
 class TCPConnection:
-    def __init__(self, address: str, port: int, logger: logging.Logger) -> None:
-        self.server = create_server((address, port), backlog=1, reuse_port=True)
+    def __init__(
+        self,
+        address: str,
+        port: int,
+        logger: logging.Logger,
+        server: Optional[socket] = None,
+    ) -> None:
+        if server is None:
+            server = create_server((address, port), backlog=1, reuse_port=True)
+        self.server = server
         self.client: socket
         self.logger = logger
         self.logger.info("Server socket created.")
@@ -36,16 +44,10 @@ class TCPConnection:
     def change_buffer_size(self, size: int) -> None:
         pass
 
-    def receive(self, size: Optional[int] = None) -> bytes:
-        if size is None:
-            return self.client.recv(TCP_BUFFER_SIZE)
-
-        self.logger.debug("Expecting %d byte(s).", size)
-        data = b""
-        while len(data) < size:
-            data += self.client.recv(TCP_BUFFER_SIZE)
-            self.logger.debug("Already got %d byte(s).", len(data))
-        return data
+    def receive_into(self, buffer: memoryview) -> int:
+        nb_bytes = self.client.recv_into(buffer)
+        self.logger.debug("Received %d byte(s).", nb_bytes)
+        return nb_bytes
 
     def send(self, data: bytes) -> None:
         self.client.sendall(data)
@@ -57,11 +59,40 @@ def run_server_over_tcp(
     configuration: Optional[Path],
     configuration_out: Path,
     logger: logging.Logger,
+    metrics_port: Optional[int] = None,
+    trace: Optional[Path] = None,
+    workers: int = 1,
+    server: Optional[socket] = None,
     **_: Any,
 ) -> None:
+    if workers > 1:
+        # multiprocessing is only loaded with several workers
+        from .prefork import run_prefork_server
+
+        # The workers accept the connections on the socket of the supervisor
+        with create_server((address, port), backlog=workers, reuse_port=True) as s:
+            run_prefork_server(
+                workers,
+                run_server_over_tcp,
+                logger,
+                address=address,
+                port=port,
+                configuration=configuration,
+                configuration_out=configuration_out,
+                metrics_port=metrics_port,
+                trace=trace,
+                server=s,
+            )
+        return
+
+    stats = ServerStats()
+    if metrics_port is not None:
+        start_metrics_server(stats, metrics_port, logger)
     run_server(
-        TCPConnection(address, port, logger),
+        TCPConnection(address, port, logger, server),
         configuration,
         configuration_out,
         logger,
+        stats=stats,
+        trace=trace,
     )
@@ -0,0 +1,143 @@
+"""Binary traces of the frames exchanged by the server.
+
+A trace file starts with a header (magic and format version) followed by one
+record per frame:
+
+    direction   1 byte, `TraceDirection`
+    timestamp   8 bytes, nanoseconds since the beginning of the trace
+    length      4 bytes, size of the frame
+    frame       the frame, as sent on the connection, empty when a client
+                connects or disconnects
+
+All the integers are little-endian. The file is compressed on the fly
+if its extension is `.gz` (gzip) or `.xz` (lzma).
+"""
+
+import gzip
+import lzma
+import struct
+from enum import Enum, unique
+from pathlib import Path
+from time import monotonic_ns
+from typing import IO, Any, Iterator, NamedTuple
+
+from typing_extensions import Self
+
+TRACE_MAGIC = b"TVLTRACE"
+TRACE_VERSION = 2
+TRACE_SUFFIXES = (".trace", ".gz", ".xz")
+
+_HEADER = struct.Struct(f"<{len(TRACE_MAGIC)}sH")
+_RECORD = struct.Struct("<cQI")
+
+
+class TraceError(Exception):
+    pass
+
+
+class TraceFormatError(TraceError):
+    pass
+
+
+@unique
+class TraceDirection(bytes, Enum):
+    RX = b"r"
+    """Frame received from the client"""
+    TX = b"t"
+    """Frame sent to the client"""
+    OPEN = b"o"
+    """Client connected, since trace version 2"""
+    CLOSE = b"c"
+    """Client disconnected, since trace version 2"""
+
+
+class TraceRecord(NamedTuple):
+    direction: TraceDirection
+    timestamp: int
+    """Nanoseconds since the beginning of the trace"""
+    frame: bytes
+
+
+def open_trace(path: Path, mode: str) -> IO[bytes]:
+    """Open a trace file, compressed depending on its extension.
+
+    Args:
+        path (Path): the trace file
+        mode (str): "rb" or "wb"
+
+    Returns:
+        the file object
+    """
+    if path.suffix == ".gz":
+        return gzip.open(path, mode)  # type: ignore
+    if path.suffix == ".xz":
+        return lzma.open(path, mode)  # type: ignore
+    return open(path, mode)
+
+
+class TraceRecorder:
+    """Append the frames exchanged by the server to a trace file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.fd = open_trace(path, "wb")
+        self.fd.write(_HEADER.pack(TRACE_MAGIC, TRACE_VERSION))
+        self.start = monotonic_ns()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def record(self, direction: TraceDirection, frame: bytes) -> None:
+        """Append a frame to the trace.
+
+        Args:
+            direction (TraceDirection): whether the frame is received or sent
+            frame (bytes): the frame
+        """
+        self.fd.write(_RECORD.pack(direction, monotonic_ns() - self.start, len(frame)))
+        self.fd.write(frame)
+
+    def flush(self) -> None:
+        self.fd.flush()
+
+    def close(self) -> None:
+        self.fd.close()
+
+
+def read_trace(path: Path) -> Iterator[TraceRecord]:
+    """Read the records of a trace file.
+
+    A record truncated at the end of the file, for instance if the server
+    was killed while recording, ends the trace.
+
+    Args:
+        path (Path): the trace file
+
+    Raises:
+        TraceFormatError: the file is not a trace
+
+    Yields:
+        the records of the trace
+    """
+    with open_trace(path, "rb") as fd:
+        header = fd.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise TraceFormatError(f"{path}: truncated header.")
+        magic, version = _HEADER.unpack(header)
+        if magic != TRACE_MAGIC:
+            raise TraceFormatError(f"{path}: not a trace file.")
+        if not 1 <= version <= TRACE_VERSION:
+            raise TraceFormatError(f"{path}: unsupported trace version {version}.")
+
+        try:
+            while len(data := fd.read(_RECORD.size)) == _RECORD.size:
+                direction, timestamp, length = _RECORD.unpack(data)
+                if len(frame := fd.read(length)) < length:
+                    break
+                yield TraceRecord(TraceDirection(direction), timestamp, frame)
+        except EOFError:
+            # Compressed stream not terminated
+            pass
@@ -0,0 +1,89 @@
+import logging
+import socket
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from typing_extensions import Self
+
+from .internal import run_server
+from .stats import ServerStats, start_metrics_server
+
+UNIX_DEFAULT_PATH = Path(tempfile.gettempdir()) / "tvl_model_server.sock"
+
+
+def _server_running(path: Path) -> bool:
+    """Check whether a server is listening on an existing socket."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        probe.settimeout(1)
+        try:
+            probe.connect(str(path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False
+        except OSError:
+            # e.g. the server is busy and its backlog full
+            pass
+    return True
+
+
+class UnixConnection:
+    def __init__(self, path: Union[Path, str], logger: logging.Logger) -> None:
+        self.path = Path(path)
+        if self.path.is_socket():
+            if _server_running(self.path):
+                raise FileExistsError(f"Server already running on {self.path}.")
+            logger.warning("Removing stale socket %s.", self.path)
+            self.path.unlink()
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(str(self.path))
+        self.server.listen(1)
+        self.client: socket.socket
+        self.logger = logger
+        self.logger.info("Server socket created.")
+        self.logger.debug("Server path: %s", self.path)
+
+    def __enter__(self) -> Self:
+        self.server.__enter__()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.server.__exit__(*args)
+        self.path.unlink(missing_ok=True)
+
+    def connect(self) -> None:
+        self.logger.info("Listening for new connection.")
+        self.client, _ = self.server.accept()
+        self.logger.info("New client connected.")
+
+    def change_buffer_size(self, size: int) -> None:
+        pass
+
+    def receive_into(self, buffer: memoryview) -> int:
+        nb_bytes = self.client.recv_into(buffer)
+        self.logger.debug("Received %d byte(s).", nb_bytes)
+        return nb_bytes
+
+    def send(self, data: bytes) -> None:
+        self.client.sendall(data)
+
+
+def run_server_over_unix(
+    path: Path,
+    configuration: Optional[Path],
+    configuration_out: Path,
+    logger: logging.Logger,
+    metrics_port: Optional[int] = None,
+    trace: Optional[Path] = None,
+    **_: Any,
+) -> None:
+    stats = ServerStats()
+    if metrics_port is not None:
+        start_metrics_server(stats, metrics_port, logger)
+    run_server(
+        UnixConnection(path, logger),
+        configuration,
+        configuration_out,
+        logger,
+        stats=stats,
+        trace=trace,
+    )
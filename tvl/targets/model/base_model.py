@@ -1,5 +1,7 @@
 import logging
 from functools import partial, singledispatchmethod
+from operator import attrgetter
+from pathlib import Path
 from typing import (
     Any,
     Callable,
@@ -10,6 +12,7 @@ from typing import (
     Optional,
     Protocol,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -19,7 +22,7 @@ from typing import (
 from typing_extensions import Self
 
 from ...constants import CHUNK_SIZE, ENCRYPTION_TAG_LEN, S_HI_PUB_NB_SLOTS, L2StatusEnum
-from ...crypto.encrypted_session import TropicEncryptedSession
+from ...crypto.encrypted_session import EphemeralKeyPool, TropicEncryptedSession
 from ...logging_utils import Labeller, LogIter
 from ...messages.exceptions import NoValidSubclassError, SubclassNotFoundError
 from ...messages.l2_messages import L2Request, L2Response
@@ -28,12 +31,16 @@ from ...random_number_generator import RandomNumberGenerator
 from ...utils import split_data
 from .configuration_object_impl import ConfigurationObjectImpl
 from .exceptions import L2ProcessingError, L3ProcessingErrorUnauthorized
+from .internal.access_privileges import AccessTable
 from .internal.command_buffer import CommandBuffer
 from .internal.ecc_keys import EccKeys
+from .internal.instrumentation import CommandProfiler, Instrumentation, Stage
 from .internal.mac_and_destroy import MacAndDestroyData
 from .internal.mcounter import MCounters
 from .internal.pairing_keys import PairingKeys
+from .internal.snapshot import SnapshotReader, write_snapshot
 from .internal.spi_fsm import SpiFsm
+from .internal.timing import LatencyTable, VirtualClock
 from .internal.user_data_partition import UserDataPartition
 from .meta_model import MetaModel, base
 
@@ -44,10 +51,104 @@ class SupportsFromDict(Protocol):
         ...
 
 
+class Partition(Protocol):
+    @property
+    def modifications(self) -> int:
+        ...
+
+    def clone(self) -> Self:
+        ...
+
+    def to_dict(self) -> Any:
+        ...
+
+
+class _PartitionCheckpoint:
+    def __init__(self, partition: Partition) -> None:
+        self.content = partition.clone()
+        self.partition = partition
+        self.modifications = partition.modifications
+
+    def restore(self, partition: Partition) -> Partition:
+        """Get the partition to use after the restore.
+
+        Args:
+            partition (Partition): the partition currently used by the model
+
+        Returns:
+            the same partition if it was not modified since the checkpoint,
+            else a new copy of the checkpointed content
+        """
+        if (
+            partition is not self.partition
+            or partition.modifications != self.modifications
+        ):
+            self.partition = self.content.clone()
+            self.modifications = self.partition.modifications
+        return self.partition
+
+
+class ModelCheckpoint:
+    """State of a model, to be restored with `BaseModel.restore`.
+
+    The partitions are copied when the checkpoint is taken. Upon restore, only
+    the partitions modified since are copied back: a checkpoint can be restored
+    any number of times.
+    """
+
+    def __init__(
+        self,
+        partitions: Dict[str, _PartitionCheckpoint],
+        runtime_state: Dict[str, Dict[str, Any]],
+    ) -> None:
+        self.partitions = partitions
+        self.runtime_state = runtime_state
+
+
 T = TypeVar("T")
 
 D = TypeVar("D", bound=SupportsFromDict)
 
+RUNTIME_STATE: Dict[str, Tuple[str, ...]] = {
+    "": ("pairing_key_slot", "_config"),
+    "session": (
+        "nonce_cmd",
+        "nonce_resp",
+        "k_cmd",
+        "k_resp",
+        "k_auth",
+        "handshake_hash",
+    ),
+    "command_buffer": ("total_size", "received_size", "chunks"),
+    "spi_fsm": ("odata", "current_state", "csn_is_low", "busy_index"),
+    "spi_fsm.response_buffer": ("latest_response", "responses"),
+    "spi_fsm.clock": ("now", "ready_at", "result_ready_at"),
+    "trng2": ("pool", "pool_offset", "counter"),
+}
+"""Attributes holding the state of the model besides its partitions,
+by path of the object they belong to"""
+
+
+def _copy_state(value: T) -> T:
+    # Lists are the only mutable values of the runtime state
+    if isinstance(value, list):
+        return value.copy()  # type: ignore
+    return value
+
+
+SNAPSHOT_SETTINGS_ENTRY = "settings"
+
+PARTITION_TYPES: Dict[str, Type[SupportsFromDict]] = {
+    "r_config": ConfigurationObjectImpl,
+    "r_ecc_keys": EccKeys,
+    "r_user_data": UserDataPartition,
+    "r_mcounters": MCounters,
+    "r_macandd_data": MacAndDestroyData,
+    "i_config": ConfigurationObjectImpl,
+    "i_pairing_keys": PairingKeys,
+}
+"""Types of the R-Memory and I-Memory partitions, by configuration name"""
+
 
 class BaseModel(MetaModel):
     """
@@ -75,8 +176,12 @@ class BaseModel(MetaModel):
         spect_fw_version: bytes = b"spect_fw_version",
         activate_encryption: bool = True,
         debug_random_value: Optional[bytes] = None,
+        rng_seed: Optional[int] = None,
+        rng_backend: str = "shake256",
         init_byte: bytes = b"\x00",
         busy_iter: Optional[Sequence[bool]] = None,
+        latencies: Optional[LatencyTable] = None,
+        key_pool: Optional[EphemeralKeyPool] = None,
         split_data_fn: Callable[[bytes], Iterator[bytes]] = partial(
             split_data, chunk_size=CHUNK_SIZE
         ),
@@ -113,11 +218,21 @@ class BaseModel(MetaModel):
                 Defaults to True.
             debug_random_value (bytes, optional): TRNG2 initial random value.
                 Defaults to None.
+            rng_seed (int, optional): seed of the TRNG2 and of the default
+                busy sequence, for reproducible runs. Defaults to None.
+            rng_backend (str, optional): deterministic random bit generator
+                used when `rng_seed` is set. Defaults to "shake256".
             init_byte (bytes): byte sent behind the chip status byte upon
                 reception of a request. Defaults to b"\x00".
             busy_iter (Sequence[bool], optional): sequence managing the
                 frequency model returns the BUSY status code.
                 Defaults to None.
+            latencies (LatencyTable, optional): processing latencies charged
+                to the virtual clock of the model, deciding when it returns
+                the BUSY status code instead of `busy_iter`. Defaults to None.
+            key_pool (EphemeralKeyPool, optional): pool of ephemeral keys
+                generated in advance for the handshakes, unused if the TRNG2
+                is deterministic. Defaults to None.
         """
 
         def __factory(value: Optional[T], default: Callable[[], T]) -> T:
@@ -162,21 +277,43 @@ class BaseModel(MetaModel):
         if debug_random_value is not None and len(debug_random_value) != 4:
             raise ValueError("debug_random_value has to be 4 byte long.")
 
-        self.trng2 = RandomNumberGenerator(debug_random_value)
+        self.trng2 = RandomNumberGenerator(
+            debug_random_value, seed=rng_seed, backend=rng_backend
+        )
         """Random number generator"""
 
         # Actual configuration object update
         self._config: Optional[ConfigurationObjectImpl] = None
+        # Configuration computed last, reused after power on as long as the
+        # configuration objects are not modified
+        self._config_cache: Optional[Tuple[Tuple[Any, ...], Any]] = None
+        # Access privileges compiled from the actual configuration object
+        self._access_table: Optional[AccessTable] = None
         # Create an empty encrypted session state.
-        self.session = TropicEncryptedSession(random_source=self.trng2)
+        self.session = TropicEncryptedSession(
+            random_source=self.trng2, key_pool=key_pool
+        )
         # pairing key currently used by the session
         self.pairing_key_slot: int = -1
 
         # command buffer
         self.command_buffer = CommandBuffer()
 
+        self.instrumentation = Instrumentation()
+        """Hooks around the processing stages of the model"""
+
+        self.clock = VirtualClock(latencies)
+        """Simulated time of the model, advanced by `wait`"""
+
         # L1 layer finite-state machine
-        self.spi_fsm = SpiFsm(init_byte, busy_iter, self.process_input)
+        self.spi_fsm = SpiFsm(
+            init_byte,
+            busy_iter,
+            self.process_input,
+            seed=rng_seed,
+            instrumentation=self.instrumentation,
+            clock=self.clock,
+        )
 
         self.split_data_fn = split_data_fn
 
@@ -191,6 +328,26 @@ class BaseModel(MetaModel):
         self.spi_fsm.set_logger(Labeller(logger, "spi"))
         return self
 
+    def profile_command(
+        self, command_id: int, *, trace_memory: bool = False
+    ) -> CommandProfiler:
+        """Profile the processing of the L3 commands with the given ID.
+
+        The profiling lasts until the profiler is detached with
+        `profiler.detach(model.instrumentation)`.
+
+        Args:
+            command_id (int): ID of the L3 command to profile
+            trace_memory (bool, optional): also capture the memory allocations
+                with tracemalloc. Defaults to False.
+
+        Returns:
+            the profiler, holding the captured statistics
+        """
+        profiler = CommandProfiler(command_id, trace_memory=trace_memory)
+        profiler.attach(self.instrumentation)
+        return profiler
+
     def __enter__(self) -> Self:
         """Instance can be used as a context manager"""
         return self
@@ -199,19 +356,29 @@ class BaseModel(MetaModel):
         """Instance can be used as a context manager"""
         pass
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Dump the configuration of the model to a dict.
+    def partitions(self) -> Dict[str, Partition]:
+        """Get the R-Memory and I-Memory partitions of the model.
+
+        Returns:
+            the partitions, by configuration name
+        """
+        return {
+            "r_config": self.r_config,
+            "r_ecc_keys": self.r_ecc_keys,
+            "r_user_data": self.r_user_data,
+            "r_mcounters": self.r_mcounters,
+            "r_macandd_data": self.r_macandd_data,
+            "i_config": self.i_config,
+            "i_pairing_keys": self.i_pairing_keys,
+        }
+
+    def settings_to_dict(self) -> Dict[str, Any]:
+        """Dump the configuration of the model not held by its partitions.
 
         Returns:
             the configuration dumped as a dict
         """
         return {
-            "r_config": self.r_config.to_dict(),
-            "r_ecc_keys": self.r_ecc_keys.to_dict(),
-            "r_user_data": self.r_user_data.to_dict(),
-            "r_mcounters": self.r_mcounters.to_dict(),
-            "i_config": self.i_config.to_dict(),
-            "i_pairing_keys": self.i_pairing_keys.to_dict(),
             "s_t_priv": self.s_t_priv,
             "s_t_pub": self.s_t_pub,
             "x509_certificate": self.x509_certificate,
@@ -220,8 +387,22 @@ class BaseModel(MetaModel):
             "spect_fw_version": self.spect_fw_version,
             "activate_encryption": self.activate_encryption,
             "debug_random_value": self.trng2.debug_random_value,
+            "rng_seed": self.trng2.seed,
+            "rng_backend": self.trng2.backend,
             "init_byte": self.spi_fsm.init_byte,
             "busy_iter": self.spi_fsm.busy_iter,
+            "latencies": (None if (t := self.clock.latencies) is None else t.to_dict()),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dump the configuration of the model to a dict.
+
+        Returns:
+            the configuration dumped as a dict
+        """
+        return {
+            **{name: p.to_dict() for name, p in self.partitions().items()},
+            **self.settings_to_dict(),
         }
 
     @classmethod
@@ -261,17 +442,105 @@ class BaseModel(MetaModel):
             **__s("spect_fw_version"),
             **__s("activate_encryption"),
             **__s("debug_random_value"),
+            **__s("rng_seed"),
+            **__s("rng_backend"),
             **__s("init_byte"),
             **__s("busy_iter"),
+            **__d("latencies", LatencyTable),
+        )
+
+    def save_snapshot(self, path: Path) -> None:
+        """Save the state of the model to a binary snapshot file.
+
+        Args:
+            path (Path): the snapshot file
+        """
+        write_snapshot(
+            path,
+            {
+                **{name: p.to_dict() for name, p in self.partitions().items()},
+                SNAPSHOT_SETTINGS_ENTRY: self.settings_to_dict(),
+            },
+        )
+
+    @classmethod
+    def load_snapshot(cls, path: Path) -> Self:
+        """Create a new model from a binary snapshot file.
+
+        The partitions are decoded from the memory-mapped file the first time
+        they are accessed.
+
+        Args:
+            path (Path): the snapshot file
+
+        Returns:
+            a new model
+        """
+        reader = SnapshotReader(path)
+
+        def __loader(n: str, t: Type[D]) -> Callable[[], D]:
+            return lambda: t.from_dict(reader.read(n))
+
+        model = cls.from_dict(reader.read(SNAPSHOT_SETTINGS_ENTRY))
+        for name in PARTITION_TYPES:
+            delattr(model, name)
+        model._lazy_partitions = {
+            name: __loader(name, type_) for name, type_ in PARTITION_TYPES.items()
+        }
+        return model
+
+    def __getattr__(self, name: str) -> Any:
+        # Partitions of a model loaded from a snapshot are decoded on first access
+        try:
+            load = self.__dict__["_lazy_partitions"].pop(name)
+        except KeyError:
+            raise AttributeError(
+                f"{self.__class__.__name__!r} object has no attribute {name!r}"
+            ) from None
+        setattr(self, name, partition := load())
+        return partition
+
+    def _stateful_objects(self) -> Iterator[Tuple[str, Any]]:
+        for path in RUNTIME_STATE:
+            yield path, attrgetter(path)(self) if path else self
+
+    def checkpoint(self) -> ModelCheckpoint:
+        """Save the state of the model in memory.
+
+        Returns:
+            the checkpoint, to be passed to `restore`
+        """
+        return ModelCheckpoint(
+            {name: _PartitionCheckpoint(p) for name, p in self.partitions().items()},
+            {
+                path: {
+                    attr: _copy_state(getattr(obj, attr))
+                    for attr in RUNTIME_STATE[path]
+                }
+                for path, obj in self._stateful_objects()
+            },
         )
 
+    def restore(self, checkpoint: ModelCheckpoint) -> None:
+        """Restore the state of the model saved in a checkpoint.
+
+        Args:
+            checkpoint (ModelCheckpoint): the checkpoint, taken on a model of
+                the same class
+        """
+        for name, partition_checkpoint in checkpoint.partitions.items():
+            setattr(self, name, partition_checkpoint.restore(getattr(self, name)))
+        for path, obj in self._stateful_objects():
+            for attr, value in checkpoint.runtime_state[path].items():
+                setattr(obj, attr, _copy_state(value))
+
     def wait(self, usecs: int) -> None:
-        """Wait for the model
+        """Wait for the model, advancing its virtual clock
 
         Args:
             usecs (int): waiting time in microseconds
         """
-        pass
+        self.clock.advance(usecs)
 
     def spi_drive_csn_low(self) -> None:
         """Drive the Chip Select signal to LOW"""
@@ -281,6 +550,22 @@ class BaseModel(MetaModel):
         """Drive the Chip Select signal to HIGH"""
         self.spi_fsm.spi_drive_csn_high()
 
+    def irq_state(self) -> bool:
+        """Get the state of the IRQ pin
+
+        Returns:
+            True if a new L2 response is ready, False otherwise
+        """
+        return self.spi_fsm.irq_state()
+
+    def busy_time(self) -> float:
+        """Get the time left until the next response is ready
+
+        Returns:
+            the time in microseconds, 0 if the model is not busy
+        """
+        return self.spi_fsm.busy_time()
+
     @overload
     def spi_send(self, data: List[int]) -> List[int]:
         ...
@@ -321,7 +606,9 @@ class BaseModel(MetaModel):
         Returns:
             the response computed from the request
         """
-        responses = self._process_input(data)
+        responses = self.instrumentation.call(
+            Stage.PROCESS_INPUT, "process_input", self._process_input, data
+        )
 
         if not isinstance(responses, list):
             self.logger.info("Returning L2 response: %s", responses)
@@ -414,9 +701,32 @@ class BaseModel(MetaModel):
             self.logger.debug(
                 "Updating configuration for the first time after power on."
             )
-            self._config = self.i_config & self.r_config
+            key = (
+                self.i_config,
+                self.i_config.modifications,
+                self.r_config,
+                self.r_config.modifications,
+            )
+            if self._config_cache is None or self._config_cache[0] != key:
+                self._config_cache = key, self.i_config & self.r_config
+            else:
+                self.logger.debug("Configuration objects unchanged, reusing it.")
+            self._config = self._config_cache[1]
         return self._config
 
+    @property
+    def access_table(self) -> AccessTable:
+        """Access privileges of the L3 commands, compiled from the actual
+          configuration object.
+
+        Returns:
+            the access table of the actual configuration object
+        """
+        config = self.config
+        if self._access_table is None or self._access_table.config is not config:
+            self._access_table = AccessTable(config)
+        return self._access_table
+
     def check_access_privileges(self, name: str, value: int) -> None:
         """Check the current pairing key access privileges
 
@@ -464,7 +774,9 @@ class BaseModel(MetaModel):
             the encrypted raw result
         """
         if self.activate_encryption:
-            return self.session.encrypt_response(result)
+            return self.instrumentation.call(
+                Stage.ENCRYPT, "encrypt_result", self.session.encrypt_response, result
+            )
         return result + b"\x00" * ENCRYPTION_TAG_LEN
 
     def decrypt_command(self, command: bytes) -> Optional[bytes]:
@@ -477,5 +789,7 @@ class BaseModel(MetaModel):
             the decrypted raw command
         """
         if self.activate_encryption:
-            return self.session.decrypt_command(command)
+            return self.instrumentation.call(
+                Stage.DECRYPT, "decrypt_command", self.session.decrypt_command, command
+            )
         return command[:-ENCRYPTION_TAG_LEN]
@@ -1,5 +1,5 @@
-# GENERATED ON 2025-02-20 15:25:12.100946
-# BY internal.py VERSION 0.4
+# GENERATED ON 2026-10-19 09:56:41.220388
+# BY CO_GENERATOR VERSION 0.5
 # INPUT FILE: 8e0b7d81d7ac0252fdbff9726bbb6ae084d7d9bab49f27cdbda22da3832091d8
 #
 from typing import Optional
@@ -342,6 +342,57 @@ class ConfigObjectRegisterAddressEnum(HexReprIntEnum):
 
 
 class ConfigurationObjectImpl(ConfigurationObject):
+    __slots__ = (
+        "cfg_sleep_mode",
+        "cfg_uap_pairing_key_write",
+        "cfg_uap_pairing_key_read",
+        "cfg_uap_pairing_key_invalidate",
+        "cfg_uap_r_config_write_erase",
+        "cfg_uap_r_config_read",
+        "cfg_uap_i_config_write",
+        "cfg_uap_i_config_read",
+        "cfg_uap_ping",
+        "cfg_uap_r_mem_data_write",
+        "cfg_uap_r_mem_data_read",
+        "cfg_uap_r_mem_data_erase",
+        "cfg_uap_random_value_get",
+        "cfg_uap_ecc_key_generate",
+        "cfg_uap_ecc_key_store",
+        "cfg_uap_ecc_key_read",
+        "cfg_uap_ecc_key_erase",
+        "cfg_uap_ecdsa_sign",
+        "cfg_uap_eddsa_sign",
+        "cfg_uap_mcounter_init",
+        "cfg_uap_mcounter_get",
+        "cfg_uap_mcounter_update",
+        "cfg_uap_mac_and_destroy",
+    )
+    REGISTERS = {
+        "cfg_sleep_mode": ConfigObjectRegisterAddressEnum.CFG_SLEEP_MODE,
+        "cfg_uap_pairing_key_write": ConfigObjectRegisterAddressEnum.CFG_UAP_PAIRING_KEY_WRITE,
+        "cfg_uap_pairing_key_read": ConfigObjectRegisterAddressEnum.CFG_UAP_PAIRING_KEY_READ,
+        "cfg_uap_pairing_key_invalidate": ConfigObjectRegisterAddressEnum.CFG_UAP_PAIRING_KEY_INVALIDATE,
+        "cfg_uap_r_config_write_erase": ConfigObjectRegisterAddressEnum.CFG_UAP_R_CONFIG_WRITE_ERASE,
+        "cfg_uap_r_config_read": ConfigObjectRegisterAddressEnum.CFG_UAP_R_CONFIG_READ,
+        "cfg_uap_i_config_write": ConfigObjectRegisterAddressEnum.CFG_UAP_I_CONFIG_WRITE,
+        "cfg_uap_i_config_read": ConfigObjectRegisterAddressEnum.CFG_UAP_I_CONFIG_READ,
+        "cfg_uap_ping": ConfigObjectRegisterAddressEnum.CFG_UAP_PING,
+        "cfg_uap_r_mem_data_write": ConfigObjectRegisterAddressEnum.CFG_UAP_R_MEM_DATA_WRITE,
+        "cfg_uap_r_mem_data_read": ConfigObjectRegisterAddressEnum.CFG_UAP_R_MEM_DATA_READ,
+        "cfg_uap_r_mem_data_erase": ConfigObjectRegisterAddressEnum.CFG_UAP_R_MEM_DATA_ERASE,
+        "cfg_uap_random_value_get": ConfigObjectRegisterAddressEnum.CFG_UAP_RANDOM_VALUE_GET,
+        "cfg_uap_ecc_key_generate": ConfigObjectRegisterAddressEnum.CFG_UAP_ECC_KEY_GENERATE,
+        "cfg_uap_ecc_key_store": ConfigObjectRegisterAddressEnum.CFG_UAP_ECC_KEY_STORE,
+        "cfg_uap_ecc_key_read": ConfigObjectRegisterAddressEnum.CFG_UAP_ECC_KEY_READ,
+        "cfg_uap_ecc_key_erase": ConfigObjectRegisterAddressEnum.CFG_UAP_ECC_KEY_ERASE,
+        "cfg_uap_ecdsa_sign": ConfigObjectRegisterAddressEnum.CFG_UAP_ECDSA_SIGN,
+        "cfg_uap_eddsa_sign": ConfigObjectRegisterAddressEnum.CFG_UAP_EDDSA_SIGN,
+        "cfg_uap_mcounter_init": ConfigObjectRegisterAddressEnum.CFG_UAP_MCOUNTER_INIT,
+        "cfg_uap_mcounter_get": ConfigObjectRegisterAddressEnum.CFG_UAP_MCOUNTER_GET,
+        "cfg_uap_mcounter_update": ConfigObjectRegisterAddressEnum.CFG_UAP_MCOUNTER_UPDATE,
+        "cfg_uap_mac_and_destroy": ConfigObjectRegisterAddressEnum.CFG_UAP_MAC_AND_DESTROY,
+    }
+
     def __init__(self, **kwargs: int) -> None:
         self.cfg_sleep_mode = CfgSleepMode(self, ConfigObjectRegisterAddressEnum.CFG_SLEEP_MODE)
         self.cfg_uap_pairing_key_write = CfgUapPairingKeyWrite(self, ConfigObjectRegisterAddressEnum.CFG_UAP_PAIRING_KEY_WRITE)
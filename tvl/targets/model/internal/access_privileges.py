@@ -0,0 +1,187 @@
+"""User access privileges of the L3 commands.
+
+The access privileges of a command are held by the fields of a configuration
+register, each field guarding a range of slots, a pairing key slot or a range
+of configuration addresses. The access table resolves, once per configuration
+object, which field guards each (command, index) pair so that checking the
+access privileges of a command costs a single lookup.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+from .configuration_object import (
+    CONFIGURATION_ACCESS_PRIVILEGES,
+    FUNCTIONALITY_ACCESS_PRIVILEGES,
+    ConfigurationObject,
+)
+
+AccessPrivileges = Tuple[str, int]
+"""Name and value of the configuration field guarding an access"""
+
+UAP_FIELDS: Dict[str, Sequence[str]] = {
+    "cfg_uap_pairing_key_write": [
+        "write_pkey_slot_0",
+        "write_pkey_slot_1",
+        "write_pkey_slot_2",
+        "write_pkey_slot_3",
+    ],
+    "cfg_uap_pairing_key_read": [
+        "read_pkey_slot_0",
+        "read_pkey_slot_1",
+        "read_pkey_slot_2",
+        "read_pkey_slot_3",
+    ],
+    "cfg_uap_pairing_key_invalidate": [
+        "invalidate_pkey_slot_0",
+        "invalidate_pkey_slot_1",
+        "invalidate_pkey_slot_2",
+        "invalidate_pkey_slot_3",
+    ],
+    "cfg_uap_r_config_write_erase": ["r_config_write_erase"],
+    "cfg_uap_r_config_read": ["r_config_read_func", "r_config_read_cfg"],
+    "cfg_uap_i_config_write": ["i_config_write_func", "i_config_write_cfg"],
+    "cfg_uap_i_config_read": ["i_config_read_func", "i_config_read_cfg"],
+    "cfg_uap_ping": ["ping"],
+    "cfg_uap_r_mem_data_write": [
+        "write_udata_slot_0_127",
+        "write_udata_slot_128_255",
+        "write_udata_slot_256_383",
+        "write_udata_slot_384_511",
+    ],
+    "cfg_uap_r_mem_data_read": [
+        "read_udata_slot_0_127",
+        "read_udata_slot_128_255",
+        "read_udata_slot_256_383",
+        "read_udata_slot_384_511",
+    ],
+    "cfg_uap_r_mem_data_erase": [
+        "erase_udata_slot_0_127",
+        "erase_udata_slot_128_255",
+        "erase_udata_slot_256_383",
+        "erase_udata_slot_384_511",
+    ],
+    "cfg_uap_random_value_get": ["random_value_get"],
+    "cfg_uap_ecc_key_generate": [
+        "gen_ecckey_slot_0_7",
+        "gen_ecckey_slot_8_15",
+        "gen_ecckey_slot_16_23",
+        "gen_ecckey_slot_24_31",
+    ],
+    "cfg_uap_ecc_key_store": [
+        "store_ecckey_slot_0_7",
+        "store_ecckey_slot_8_15",
+        "store_ecckey_slot_16_23",
+        "store_ecckey_slot_24_31",
+    ],
+    "cfg_uap_ecc_key_read": [
+        "read_ecckey_slot_0_7",
+        "read_ecckey_slot_8_15",
+        "read_ecckey_slot_16_23",
+        "read_ecckey_slot_24_31",
+    ],
+    "cfg_uap_ecc_key_erase": [
+        "erase_ecckey_slot_0_7",
+        "erase_ecckey_slot_8_15",
+        "erase_ecckey_slot_16_23",
+        "erase_ecckey_slot_24_31",
+    ],
+    "cfg_uap_ecdsa_sign": [
+        "ecdsa_ecckey_slot_0_7",
+        "ecdsa_ecckey_slot_8_15",
+        "ecdsa_ecckey_slot_16_23",
+        "ecdsa_ecckey_slot_24_31",
+    ],
+    "cfg_uap_eddsa_sign": [
+        "eddsa_ecckey_slot_0_7",
+        "eddsa_ecckey_slot_8_15",
+        "eddsa_ecckey_slot_16_23",
+        "eddsa_ecckey_slot_24_31",
+    ],
+    "cfg_uap_mcounter_init": [
+        "mcounter_init_0_3",
+        "mcounter_init_4_7",
+        "mcounter_init_8_11",
+        "mcounter_init_12_15",
+    ],
+    "cfg_uap_mcounter_get": [
+        "mcounter_get_0_3",
+        "mcounter_get_4_7",
+        "mcounter_get_8_11",
+        "mcounter_get_12_15",
+    ],
+    "cfg_uap_mcounter_update": [
+        "mcounter_update_0_3",
+        "mcounter_update_4_7",
+        "mcounter_update_8_11",
+        "mcounter_update_12_15",
+    ],
+    "cfg_uap_mac_and_destroy": [
+        "macandd_0_31",
+        "macandd_32_63",
+        "macandd_64_95",
+        "macandd_96_127",
+    ],
+}
+"""Access privileges fields of the L3 commands, by configuration register"""
+
+_RANGE_PATTERN = re.compile(r"_(\d+)_(\d+)$")
+_INDEX_PATTERN = re.compile(r"_(\d+)$")
+
+
+def guarded_indexes(field_name: str) -> Iterable[Optional[int]]:
+    """Get the indexes guarded by a field, based on its name.
+
+    Args:
+        field_name (str): name of the configuration field
+
+    Returns:
+        the slots, pairing key slots or configuration addresses guarded by
+            the field; None if the field guards the whole command.
+    """
+    if field_name.endswith("_func"):
+        return FUNCTIONALITY_ACCESS_PRIVILEGES
+    if field_name.endswith("_cfg"):
+        return CONFIGURATION_ACCESS_PRIVILEGES
+    if (match := _RANGE_PATTERN.search(field_name)) is not None:
+        return range(int(match[1]), int(match[2]) + 1)
+    if (match := _INDEX_PATTERN.search(field_name)) is not None:
+        return [int(match[1])]
+    return [None]
+
+
+class AccessTable:
+    """Access privileges of the L3 commands compiled from a configuration."""
+
+    def __init__(self, config: ConfigurationObject) -> None:
+        self.config = config
+        self.privileges: Dict[str, Dict[Optional[int], AccessPrivileges]] = {
+            regname: dict(self._compile(getattr(config, regname), fields))
+            for regname, fields in UAP_FIELDS.items()
+        }
+
+    @staticmethod
+    def _compile(
+        register: object, fields: Sequence[str]
+    ) -> Iterator[Tuple[Optional[int], AccessPrivileges]]:
+        for field_name in fields:
+            value = getattr(register, field_name)
+            for index in guarded_indexes(field_name):
+                yield index, (field_name, value)
+
+    def get(
+        self, regname: str, index: Optional[int] = None
+    ) -> Optional[AccessPrivileges]:
+        """Get the field guarding the access to a command.
+
+        Args:
+            regname (str): name of the register holding the access privileges
+                of the command
+            index (int, optional): slot, pairing key slot or configuration
+                address accessed by the command. Defaults to None.
+
+        Returns:
+            the name and value of the field, None if no field guards the
+                access to this index.
+        """
+        return self.privileges[regname].get(index)
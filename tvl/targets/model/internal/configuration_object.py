@@ -1,5 +1,7 @@
 import contextlib
-from typing import Any, Dict, Iterator, Mapping, Tuple
+import sys
+from array import array
+from typing import Any, ClassVar, Dict, Iterator, Mapping, Tuple
 
 from pydantic import BaseModel, root_validator  # type: ignore
 from typing_extensions import Self
@@ -12,6 +14,10 @@ REGISTER_RESET_VALUE = b"\xff" * REGISTER_SIZE_BYTES
 REGISTER_MASK = 2**REGISTER_SIZE_BITS - 1
 REGISTER_STR_NB_CHARS = REGISTER_SIZE_BITS // 4 + 2
 ENDIANESS = "big"
+WORD_TYPECODE = next(t for t in "IL" if array(t).itemsize == REGISTER_SIZE_BYTES)
+"""Type code of the arrays storing the registers"""
+
+_NATIVE = sys.byteorder
 
 # Whole Configuration Object address space could be accessed (no register need to be defined at given address)
 CONFIGURATION_ACCESS_PRIVILEGES = range(0x000, 0x100, 0x4)
@@ -41,13 +47,16 @@ class BitIndexOutOfBoundError(ConfigObjectError):
 class ConfigObjectRegister:
     """Register contained in a configuration object"""
 
+    __slots__ = ("co", "address", "index")
+
     def __init__(self, co: "ConfigurationObject", address: int) -> None:
         self.co = co
         self.address = address
+        self.index = address // REGISTER_SIZE_BYTES
 
     @property
     def value(self) -> int:
-        return self.co.read(self.address)
+        return self.co.words[self.index]
 
 
 class ConfigObjectField:
@@ -62,34 +71,44 @@ class ConfigObjectField:
 
 
 class ConfigurationObject:
-    """Chip configuration abstraction"""
+    """Chip configuration abstraction
+
+    The registers are stored as an array of words, the addresses of the
+    defined registers being given by the class attribute `REGISTERS`.
+    """
+
+    __slots__ = ("words", "modifications")
+
+    REGISTERS: ClassVar[Mapping[str, int]] = {}
+    """Addresses of the registers, by name"""
 
     def __init__(self, **kwargs: int) -> None:
-        self.data: bytearray
+        self.words: "array[int]"
+        self.modifications = 0
+        """Number of modifications of the object since its creation"""
         self.erase()
 
-        for regname, register in self.registers():
+        for regname, address in self.REGISTERS.items():
             with contextlib.suppress(KeyError):
                 value = kwargs[regname]
-                self.write(register.address, value, check=False)
+                self.write(address, value, check=False)
+        self.modifications = 0
 
     def registers(self) -> Iterator[Tuple[str, ConfigObjectRegister]]:
         """Go over the registers of the configuration object."""
-        for key, value in self.__dict__.items():
-            if isinstance(value, ConfigObjectRegister):
-                yield key, value
+        for regname in self.REGISTERS:
+            yield regname, getattr(self, regname)
 
     def __and__(self, __other: Any) -> Self:
         if not isinstance(__other, self.__class__):
             return NotImplemented
 
-        new_instance = self.__class__()
-
-        for address in (register.address for _, register in self.registers()):
-            and_ = self.read(address) & __other.read(address)
-            new_instance.write(address, and_)
-
-        return new_instance
+        and_ = int.from_bytes(self.words, _NATIVE) & int.from_bytes(
+            __other.words, _NATIVE
+        )
+        return self._from_words(
+            array(WORD_TYPECODE, and_.to_bytes(CONFIG_OBJECT_SIZE_BYTES, _NATIVE))
+        )
 
     def __eq__(self, __other: Any) -> bool:
         if __other is self:
@@ -98,26 +117,29 @@ class ConfigurationObject:
         if not isinstance(__other, self.__class__):
             return NotImplemented
 
-        return self.to_bytes() == __other.to_bytes()
+        return self.words == __other.words
 
     def __str__(self) -> str:
         registers = "; ".join(
-            f"{regname}={register.value:#0{REGISTER_STR_NB_CHARS}x}"
-            for regname, register in self.registers()
+            f"{regname}={value:#0{REGISTER_STR_NB_CHARS}x}"
+            for regname, value in self.to_dict().items()
         )
         return f"{self.__class__.__name__}({registers})"
 
     @staticmethod
-    def _check_address(address: int) -> None:
+    def _check_address(address: int) -> int:
         if not 0 <= address < CONFIG_OBJECT_SIZE_BYTES:
             raise AddressOutOfRangeError("Address out of range")
 
         if address % REGISTER_SIZE_BYTES != 0:
             raise AddressNotAlignedError("Address should be word-aligned")
 
+        return address // REGISTER_SIZE_BYTES
+
     def erase(self) -> None:
         """Erase the memory content."""
-        self.data = bytearray(REGISTER_RESET_VALUE * NB_REGISTERS)
+        self.words = array(WORD_TYPECODE, [REGISTER_MASK]) * NB_REGISTERS
+        self.modifications += 1
 
     def write(self, address: int, value: int, *, check: bool = True) -> None:
         """Write to the memory.
@@ -130,16 +152,13 @@ class ConfigurationObject:
         Raises:
             NoFreeSpaceError: (if check is enabled) register cannot be written
         """
-        self._check_address(address)
+        index = self._check_address(address)
 
-        if check:
-            current_value = bytes(self.data[address : address + REGISTER_SIZE_BYTES])
-            if current_value != REGISTER_RESET_VALUE:
-                raise NoFreeSpaceError("Register already written")
+        if check and self.words[index] != REGISTER_MASK:
+            raise NoFreeSpaceError("Register already written")
 
-        self.data[address : address + REGISTER_SIZE_BYTES] = value.to_bytes(
-            REGISTER_SIZE_BYTES, ENDIANESS
-        )
+        self.words[index] = value
+        self.modifications += 1
 
     def write_bit(self, address: int, bit_index: int) -> None:
         """Write a bit from one to zero.
@@ -169,10 +188,7 @@ class ConfigurationObject:
         Returns:
             the word stored at the address
         """
-        self._check_address(address)
-        return int.from_bytes(
-            self.data[address : address + REGISTER_SIZE_BYTES], ENDIANESS
-        )
+        return self.words[self._check_address(address)]
 
     def to_dict(self) -> Dict[str, int]:
         """Save the configuration object content.
@@ -180,7 +196,10 @@ class ConfigurationObject:
         Returns:
             the content of the configuration object
         """
-        return {regname: register.value for regname, register in self.registers()}
+        return {
+            regname: self.words[address // REGISTER_SIZE_BYTES]
+            for regname, address in self.REGISTERS.items()
+        }
 
     @classmethod
     def from_dict(cls, __mapping: Mapping[str, int], /) -> Self:
@@ -194,13 +213,25 @@ class ConfigurationObject:
         """
         return cls(**__mapping)
 
+    def clone(self) -> Self:
+        """Copy the configuration object.
+
+        Returns:
+            a new, unmodified configuration object
+        """
+        return self._from_words(array(WORD_TYPECODE, self.words))
+
     def to_bytes(self) -> bytes:
         """Serialize the configuration object as bytes
 
         Returns:
             the content of the configuration object as bytes
         """
-        return bytes(self.data)
+        if _NATIVE == ENDIANESS:
+            return self.words.tobytes()
+        words = array(WORD_TYPECODE, self.words)
+        words.byteswap()
+        return words.tobytes()
 
     @classmethod
     def from_bytes(cls, __data: bytes, /) -> Self:
@@ -212,8 +243,15 @@ class ConfigurationObject:
         Returns:
             a new instance
         """
+        words = array(WORD_TYPECODE, __data)
+        if _NATIVE != ENDIANESS:
+            words.byteswap()
+        return cls._from_words(words)
+
+    @classmethod
+    def _from_words(cls, __words: "array[int]", /) -> Self:
         new_instance = cls()
-        new_instance.data = bytearray(__data)
+        new_instance.words = __words
         return new_instance
 
 
@@ -207,6 +207,8 @@ class EccKeys:
         self.slots: DefaultDict[int, Optional[ECCKeySubClass]] = defaultdict(
             lambda: None
         )
+        self.modifications = 0
+        """Number of modifications of the partition since its creation"""
 
     def _get_key(self, slot: int) -> EccKey:
         """Read the slot.
@@ -244,6 +246,7 @@ class EccKeys:
         self.slots[slot] = EccKey.find_subclass_from_curve(curve).from_random_source(
             rng, Origins.ECC_KEY_GENERATE
         )
+        self.modifications += 1
 
     def store(self, slot: int, curve: int, k: bytes) -> None:
         """Generate a new key from the given private key.
@@ -263,6 +266,7 @@ class EccKeys:
         self.slots[slot] = EccKey.find_subclass_from_curve(curve).from_key(
             k, Origins.ECC_KEY_STORE
         )
+        self.modifications += 1
 
     def read(self, slot: int) -> Tuple[int, bytes, int]:
         """Read the given slot.
@@ -282,6 +286,17 @@ class EccKeys:
             slot (int): the slot to erase the key
         """
         self.slots[slot] = None
+        self.modifications += 1
+
+    def clone(self) -> Self:
+        """Copy the Ecc object, keys are shared as they are never modified.
+
+        Returns:
+            a new, unmodified Ecc object
+        """
+        instance = self.__class__()
+        instance.slots.update(self.slots)
+        return instance
 
     def to_dict(self) -> Dict[int, Any]:
         """dump a dict configuration of the Ecc object
@@ -1,12 +1,49 @@
-from dataclasses import asdict, dataclass
-from typing import Any, DefaultDict, Dict, Mapping, Type, TypeVar
+from copy import copy
+from dataclasses import asdict, dataclass, fields, replace
+from typing import Any, DefaultDict, Dict, Mapping, Optional, Type, TypeVar
+from weakref import WeakValueDictionary
 
 from pydantic import BaseModel
 from typing_extensions import Self
 
+C = TypeVar("C", bound=type)
+
+
+def slotted_dataclass(cls: C) -> C:
+    """Create a dataclass with `__slots__`.
+
+    Same as `dataclass(slots=True)`, which is only available from Python 3.10:
+    the class is created again, with the fields as slots.
+    """
+    cls = dataclass(cls)
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = {k: v for k, v in cls.__dict__.items() if k not in field_names}
+    namespace["__slots__"] = field_names
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+
+    # Methods calling `super()` refer to the class through a closure cell
+    for value in namespace.values():
+        value = getattr(value, "__func__", value)
+        for cell in getattr(value, "__closure__", None) or ():
+            if cell.cell_contents is cls:
+                cell.cell_contents = new_cls
+    return new_cls
+
 
 @dataclass
 class BaseSlot:
+    __slots__ = ("_partition", "_key", "__weakref__")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if (partition := getattr(self, "_partition", None)) is not None:
+            partition.slot_modified(self._key, self)
+
+    def __copy__(self) -> Self:
+        return replace(self)
+
     def to_dict(self) -> Dict[str, Any]:
         """Save the content of the slot in a dict.
 
@@ -31,7 +68,21 @@ class BaseSlot:
 T = TypeVar("T", bound=BaseSlot)
 
 
+def _bind(
+    slot: BaseSlot, partition: Optional["GenericPartition[Any]"], key: int
+) -> None:
+    object.__setattr__(slot, "_partition", partition)
+    object.__setattr__(slot, "_key", key)
+
+
 class GenericPartition(DefaultDict[int, T]):
+    """Partition of slots, indexed by an integer.
+
+    Only the slots that have been written are stored in the partition. Reading
+    a missing slot returns a default slot which is only stored in the
+    partition once modified.
+    """
+
     SLOT_TYPE: Type[T]
 
     def __init_subclass__(cls) -> None:
@@ -40,6 +91,58 @@ class GenericPartition(DefaultDict[int, T]):
 
     def __init__(self) -> None:
         super().__init__(self.SLOT_TYPE)
+        self.modifications = 0
+        """Number of modifications of the partition since its creation"""
+        self.pending: "WeakValueDictionary[int, T]" = WeakValueDictionary()
+        """Default slots returned for missing keys and not modified yet"""
+
+    def __missing__(self, key: int) -> T:
+        # A default slot has the same content as a missing one:
+        # it is only stored in the partition once modified.
+        if (slot := self.pending.get(key)) is None:
+            _bind(slot := self.SLOT_TYPE(), self, key)
+            self.pending[key] = slot
+        return slot
+
+    def slot_modified(self, key: int, slot: T) -> None:
+        """Take into account the modification of a slot of the partition.
+
+        Args:
+            key (int): the index of the slot
+            slot (T): the modified slot
+        """
+        if self.pending.pop(key, None) is slot:
+            dict.__setitem__(self, key, slot)
+        self.modifications += 1
+
+    def _unbind(self, key: int) -> None:
+        if (slot := self.get(key, self.pending.pop(key, None))) is not None:
+            _bind(slot, None, key)
+
+    def __setitem__(self, key: int, slot: T) -> None:
+        self._unbind(key)
+        _bind(slot, self, key)
+        super().__setitem__(key, slot)
+        self.modifications += 1
+
+    def __delitem__(self, key: int) -> None:
+        # Deleting a missing slot is a no-op: it already has its default value.
+        self._unbind(key)
+        if key in self:
+            super().__delitem__(key)
+            self.modifications += 1
+
+    def clone(self) -> Self:
+        """Copy the partition, its slots being copied as well.
+
+        Returns:
+            a new, unmodified partition
+        """
+        instance = self.__class__()
+        for k, v in self.items():
+            _bind(slot := copy(v), instance, k)
+            dict.__setitem__(instance, k, slot)
+        return instance
 
     def to_dict(self) -> Dict[int, Any]:
         """Save the content of the partition in a dict.
@@ -62,6 +165,7 @@ class GenericPartition(DefaultDict[int, T]):
         instance = cls()
         for k, v in __mapping.items():
             instance[k] = cls.SLOT_TYPE.from_dict(v)
+        instance.modifications = 0
         return instance
 
 
@@ -0,0 +1,231 @@
+"""Timing instrumentation of the processing stages of the model.
+
+Hooks registered on an `Instrumentation` are called before and after each
+instrumented stage, with the name of the stage and of the processed item
+(type of the L2 request or L3 command, name of the SPI state...). Without
+hooks, the instrumented functions are called directly.
+"""
+
+import cProfile
+import tracemalloc
+from bisect import bisect_left
+from collections import defaultdict
+from enum import Enum
+from pstats import Stats
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from ....messages.l3_messages import L3Command
+
+T = TypeVar("T")
+
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+"""Upper bounds of the latency histogram buckets, in seconds"""
+
+
+class Stage(str, Enum):
+    PROCESS_INPUT = "process_input"
+    """Raw L2 request to raw L2 response(s)"""
+    L2_REQUEST = "l2_api"
+    """L2 request handler"""
+    L3_COMMAND = "l3_api"
+    """L3 command handler"""
+    DECRYPT = "decrypt"
+    """Decryption of an L3 command"""
+    ENCRYPT = "encrypt"
+    """Encryption of an L3 result"""
+    SPI = "spi"
+    """SPI transfer processed by a state of the SPI finite-state machine"""
+
+    __str__ = str.__str__
+
+
+PreHook = Callable[[str, str], None]
+"""Called with the stage and the name of the processed item"""
+
+PostHook = Callable[[str, str, float], None]
+"""Called with the stage, the name of the processed item and the duration
+of the stage in seconds"""
+
+
+class Instrumentation:
+    """Pre and post hooks around the processing stages of a model"""
+
+    def __init__(self) -> None:
+        self.pre_hooks: List[PreHook] = []
+        self.post_hooks: List[PostHook] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.pre_hooks or self.post_hooks)
+
+    def add_hooks(
+        self, pre: Optional[PreHook] = None, post: Optional[PostHook] = None
+    ) -> None:
+        if pre is not None:
+            self.pre_hooks.append(pre)
+        if post is not None:
+            self.post_hooks.append(post)
+
+    def remove_hooks(
+        self, pre: Optional[PreHook] = None, post: Optional[PostHook] = None
+    ) -> None:
+        if pre is not None:
+            self.pre_hooks.remove(pre)
+        if post is not None:
+            self.post_hooks.remove(post)
+
+    def call(self, stage: str, name: str, fn: Callable[..., T], *args: Any) -> T:
+        """Call a function, surrounded by the hooks.
+
+        Args:
+            stage (str): the processing stage
+            name (str): name of the processed item
+            fn (Callable[..., T]): the function
+            *args: arguments of the function
+
+        Returns:
+            the value returned by the function
+        """
+        if not (self.pre_hooks or self.post_hooks):
+            return fn(*args)
+        for pre_hook in self.pre_hooks:
+            pre_hook(stage, name)
+        start = perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            duration = perf_counter() - start
+            for post_hook in self.post_hooks:
+                post_hook(stage, name, duration)
+
+
+class Histogram:
+    """Latency histogram with fixed buckets"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        # one more counter for the values above the last bucket
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> Iterator[Tuple[str, int]]:
+        """Yield the Prometheus-like cumulative count for each bucket."""
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield repr(bound), total
+        yield "+Inf", self.count
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "buckets": dict(self.cumulative_counts()),
+            "count": self.count,
+            "sum": self.sum,
+        }
+
+
+class Timings:
+    """Post hook aggregating the durations in a histogram per stage and item"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.histograms: DefaultDict[str, Dict[str, Histogram]] = defaultdict(dict)
+        self.buckets = buckets
+
+    def __call__(self, stage: str, name: str, duration: float) -> None:
+        if (histogram := self.histograms[stage].get(name)) is None:
+            histogram = self.histograms[stage][name] = Histogram(self.buckets)
+        histogram.observe(duration)
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        return {
+            str(stage): {name: h.to_dict() for name, h in histograms.items()}
+            for stage, histograms in self.histograms.items()
+        }
+
+
+class CommandProfiler:
+    """Hooks profiling the processing of the L3 commands with a given ID.
+
+    The CPU time is captured with cProfile, accumulated over the commands.
+    If `trace_memory` is set, the allocations made while processing each
+    command are captured with tracemalloc.
+    """
+
+    def __init__(self, command_id: int, *, trace_memory: bool = False) -> None:
+        self.names: Set[str] = {
+            cls.__name__ for cls in L3Command.find_subclasses(command_id)
+        }
+        if not self.names:
+            raise ValueError(f"No L3 command with id {command_id:#x}.")
+        self.trace_memory = trace_memory
+        self.profile = cProfile.Profile()
+        self.memory_diffs: List[List[tracemalloc.StatisticDiff]] = []
+        """Allocation differences during each command, by line"""
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._started_tracing = False
+
+    def pre(self, stage: str, name: str) -> None:
+        if stage != Stage.L3_COMMAND or name not in self.names:
+            return
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            self._snapshot = tracemalloc.take_snapshot()
+        self.profile.enable()
+
+    def post(self, stage: str, name: str, duration: float) -> None:
+        if stage != Stage.L3_COMMAND or name not in self.names:
+            return
+        self.profile.disable()
+        if self._snapshot is not None:
+            snapshot = tracemalloc.take_snapshot()
+            self.memory_diffs.append(snapshot.compare_to(self._snapshot, "lineno"))
+            self._snapshot = None
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+    def attach(self, instrumentation: Instrumentation) -> None:
+        instrumentation.add_hooks(self.pre, self.post)
+
+    def detach(self, instrumentation: Instrumentation) -> None:
+        instrumentation.remove_hooks(self.pre, self.post)
+
+    def stats(self) -> Stats:
+        """Statistics of the CPU profile, see `pstats.Stats`."""
+        return Stats(self.profile)
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Any, Dict, Mapping, Optional
 
 from pydantic import BaseModel
@@ -10,6 +10,7 @@ from tvl.targets.model.internal.generic_partition import (
     BaseSlot,
     GenericModel,
     GenericPartition,
+    slotted_dataclass,
 )
 from tvl.typing_utils import FixedSizeBytes
 
@@ -25,7 +26,7 @@ class MacAndDestroyError(Exception):
     pass
 
 
-@dataclass
+@slotted_dataclass
 class MacAndDestroySlot(BaseSlot):
     value: bytes = field(default=MACANDD_SLOT_DEFAULT_VALUE)
 
@@ -34,7 +35,7 @@ class MacAndDestroySlots(GenericPartition[MacAndDestroySlot]):
     pass
 
 
-@dataclass
+@slotted_dataclass
 class MacAndDestroyKey(BaseSlot):
     value: bytes = field(default=MACANDD_KEY_DEFAULT_VALUE)
 
@@ -52,6 +53,11 @@ class MacAndDestroyData:
         self.slots = MacAndDestroySlots() if slots is None else slots
         self.keys = MacAndDestroyKeys() if keys is None else keys
 
+    @property
+    def modifications(self) -> int:
+        """Number of modifications of the partition since its creation"""
+        return self.slots.modifications + self.keys.modifications
+
     def read_slot(self, idx: int, *, erase: bool = False) -> bytes:
         slot = self.slots[idx]
         if erase:
@@ -67,6 +73,9 @@ class MacAndDestroyData:
     def write_key(self, idx: int, value: bytes) -> None:
         self.keys[idx].value = value
 
+    def clone(self) -> Self:
+        return self.__class__(slots=self.slots.clone(), keys=self.keys.clone())
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "slots": self.slots.to_dict(),
@@ -1,10 +1,14 @@
-from dataclasses import dataclass
 from typing import Dict
 
 from pydantic import BaseModel
 
 from ....typing_utils import RangedInt
-from .generic_partition import BaseSlot, GenericModel, GenericPartition
+from .generic_partition import (
+    BaseSlot,
+    GenericModel,
+    GenericPartition,
+    slotted_dataclass,
+)
 
 MCOUNTER_SIZE = 32
 MCOUNTER_DEFAULT_VALUE = 2**MCOUNTER_SIZE - 1
@@ -28,7 +32,7 @@ class MCounterUpdateError(MCounterError):
     pass
 
 
-@dataclass
+@slotted_dataclass
 class MCounter(BaseSlot):
     """Monotonic counter"""
 
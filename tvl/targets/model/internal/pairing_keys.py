@@ -1,4 +1,3 @@
-from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, Mapping
 
@@ -6,7 +5,12 @@ from pydantic import BaseModel
 from typing_extensions import Self
 
 from ....typing_utils import FixedSizeBytes
-from .generic_partition import BaseSlot, GenericModel, GenericPartition
+from .generic_partition import (
+    BaseSlot,
+    GenericModel,
+    GenericPartition,
+    slotted_dataclass,
+)
 
 KEY_SIZE = 32
 
@@ -35,7 +39,7 @@ class SlotState(str, Enum):
     __str__ = str.__str__
 
 
-@dataclass
+@slotted_dataclass
 class PairingKeySlot(BaseSlot):
     """Pairing key"""
 
@@ -0,0 +1,152 @@
+"""Binary snapshot of the state of the model.
+
+A snapshot file is made of a header, a table of contents and the entries,
+each of them being the content of a partition or the settings of the model
+serialized with `marshal`:
+
+    header            magic, format version, marshal version,
+                      number of entries, CRC32 of the table of contents
+    table of contents for each entry: name, offset, size and CRC32
+    entries           serialized contents, one after the other
+
+The file is memory-mapped when read: an entry is only checked and decoded
+when it is read.
+"""
+
+import marshal
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Set, Tuple
+
+SNAPSHOT_MAGIC = b"TVLSNAP\x00"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".snap"
+MARSHAL_VERSION = 4
+ENTRY_NAME_SIZE = 16
+
+_HEADER = struct.Struct(f"<{len(SNAPSHOT_MAGIC)}sHHII")
+_TOC_ENTRY = struct.Struct(f"<{ENTRY_NAME_SIZE}sQQI")
+
+
+class SnapshotError(Exception):
+    pass
+
+
+class SnapshotFormatError(SnapshotError):
+    pass
+
+
+class SnapshotVersionError(SnapshotError):
+    pass
+
+
+class SnapshotChecksumError(SnapshotError):
+    pass
+
+
+def write_snapshot(path: Path, entries: Mapping[str, Any]) -> None:
+    """Write a snapshot file.
+
+    The file is replaced atomically: readers see either the former snapshot
+    or the new one.
+
+    Args:
+        path (Path): the snapshot file
+        entries (Mapping[str, Any]): the content of the entries, by name
+    """
+    blobs = [marshal.dumps(value, MARSHAL_VERSION) for value in entries.values()]
+
+    toc = bytearray()
+    offset = _HEADER.size + _TOC_ENTRY.size * len(blobs)
+    for name, blob in zip(entries, blobs):
+        if len(encoded_name := name.encode()) > ENTRY_NAME_SIZE:
+            raise SnapshotFormatError(f"Entry name too long: {name!r}.")
+        toc += _TOC_ENTRY.pack(encoded_name, offset, len(blob), zlib.crc32(blob))
+        offset += len(blob)
+
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_VERSION,
+        MARSHAL_VERSION,
+        len(blobs),
+        zlib.crc32(toc),
+    )
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "wb") as fd:
+        fd.write(header)
+        fd.write(toc)
+        for blob in blobs:
+            fd.write(blob)
+    os.replace(tmp_path, path)
+
+
+class SnapshotReader:
+    """Read the entries of a memory-mapped snapshot file.
+
+    The file is unmapped once all the entries have been read.
+    """
+
+    def __init__(self, path: Path) -> None:
+        with open(path, "rb") as fd:
+            try:
+                self.mmap = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise SnapshotFormatError(f"{path}: empty file.") from None
+        try:
+            self.toc = dict(self._read_toc(path))
+        except Exception:
+            self.mmap.close()
+            raise
+        self.unread: Set[str] = set(self.toc)
+
+    def _read_toc(self, path: Path) -> Iterator[Tuple[str, Tuple[int, int, int]]]:
+        if len(self.mmap) < _HEADER.size:
+            raise SnapshotFormatError(f"{path}: truncated header.")
+        magic, version, marshal_version, nb_entries, toc_crc = _HEADER.unpack_from(
+            self.mmap
+        )
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotFormatError(f"{path}: not a snapshot file.")
+        if version != SNAPSHOT_VERSION or marshal_version > marshal.version:
+            raise SnapshotVersionError(
+                f"{path}: unsupported snapshot version {version}.{marshal_version}."
+            )
+
+        toc = self.mmap[_HEADER.size : _HEADER.size + _TOC_ENTRY.size * nb_entries]
+        if zlib.crc32(toc) != toc_crc:
+            raise SnapshotChecksumError(f"{path}: corrupted table of contents.")
+
+        for name, offset, size, crc in _TOC_ENTRY.iter_unpack(toc):
+            if offset + size > len(self.mmap):
+                raise SnapshotFormatError(f"{path}: truncated file.")
+            yield name.rstrip(b"\x00").decode(), (offset, size, crc)
+
+    def read(self, name: str) -> Any:
+        """Check and decode an entry.
+
+        Args:
+            name (str): the name of the entry
+
+        Raises:
+            SnapshotChecksumError: the content of the entry is corrupted
+
+        Returns:
+            the content of the entry
+        """
+        offset, size, crc = self.toc[name]
+        with memoryview(self.mmap) as view:
+            with view[offset : offset + size] as blob:
+                if zlib.crc32(blob) != crc:
+                    raise SnapshotChecksumError(f"Corrupted snapshot entry {name!r}.")
+                content = marshal.loads(blob)
+
+        self.unread.discard(name)
+        if not self.unread:
+            self.close()
+        return content
+
+    def close(self) -> None:
+        self.mmap.close()
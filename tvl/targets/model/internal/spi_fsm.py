@@ -1,11 +1,12 @@
 import logging
-from itertools import cycle
-from random import sample
+from random import Random
 from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Union
 
 from ....constants import PADDING_BYTE, L1ChipStatusFlag, L2IdFieldEnum, L2StatusEnum
 from ..exceptions import ResendLastResponse
+from .instrumentation import Instrumentation, Stage
 from .response_buffer import ResponseBuffer
+from .timing import VirtualClock
 
 if TYPE_CHECKING:
     _LoggerAdapter = logging.LoggerAdapter[logging.Logger]
@@ -28,6 +29,10 @@ class SpiFsm:
         busy_iter: Optional[Sequence[bool]],
         process_input_fn: Callable[[bytes], Union[bytes, List[bytes]]],
         logger: Optional[Union[logging.Logger, _LoggerAdapter]] = None,
+        *,
+        seed: Optional[int] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        clock: Optional[VirtualClock] = None,
     ) -> None:
         if logger is None:
             logger = logging.getLogger(self.__class__.__name__.lower())
@@ -36,12 +41,24 @@ class SpiFsm:
         self.init_byte = init_byte
 
         if busy_iter is None:
-            busy_iter = sample((lst := [True] * 5 + [False] * 5), k=len(lst))
+            lst = [True] * 5 + [False] * 5
+            busy_iter = Random(seed).sample(lst, k=len(lst))
         self.busy_iter = busy_iter
-        self.busy_iter_cyc = cycle(self.busy_iter)
+        self.busy_index = 0
+        """Position of the next value in `busy_iter`"""
 
         self.process_input_fn = process_input_fn
 
+        if instrumentation is None:
+            instrumentation = Instrumentation()
+        self.instrumentation = instrumentation
+
+        if clock is None:
+            clock = VirtualClock()
+        self.clock = clock
+        if clock.latencies is not None:
+            instrumentation.add_hooks(pre=clock.charge)
+
         self.csn_is_low = False
 
         self.response_buffer = ResponseBuffer()
@@ -57,6 +74,22 @@ class SpiFsm:
     def set_logger(self, logger: Union[logging.Logger, _LoggerAdapter]) -> None:
         self.logger = logger
 
+    def next_busy(self) -> bool:
+        """Get the next value of the busy sequence, cycling over it."""
+        busy = self.busy_iter[self.busy_index]
+        self.busy_index = (self.busy_index + 1) % len(self.busy_iter)
+        return busy
+
+    def is_busy(self) -> bool:
+        """The chip is still processing the latest request.
+
+        Emulated with the busy sequence if the clock has no latency table.
+        Once the first response is read, the next ones carry the L3 result.
+        """
+        if self.clock.latencies is None:
+            return self.next_busy()
+        return self.clock.is_busy(result=not self.odata)
+
     def spi_drive_csn_low(self) -> None:
         self.logger.info("Chip Select driven to LOW.")
         if not self.csn_is_low:
@@ -81,10 +114,36 @@ class SpiFsm:
     def process_spi_data(self, rx_data: bytes) -> bytes:
         self.logger.debug("Received %s", rx_data)
         self.logger.debug("State: %s", self.current_state.__name__)
-        tx_data = self.current_state(self, rx_data)
+        self.clock.transfer(len(rx_data))
+        tx_data = self.instrumentation.call(
+            Stage.SPI, self.current_state.__name__, self.current_state, self, rx_data
+        )
         self.logger.debug("Returning %s", tx_data)
         return tx_data
 
+    def has_response(self) -> bool:
+        """Some response is waiting to be read."""
+        return bool(self.odata) or not self.response_buffer.is_empty()
+
+    def irq_state(self) -> bool:
+        """State of the IRQ pin.
+
+        The pin is asserted when a response is ready, the chip is done
+        processing the request and no SPI transaction is in progress. Reading
+        the pin does not change the state of the chip: without a latency
+        table, the busy sequence still applies to the next GET_RESP.
+
+        Returns:
+            True if a response is ready, False otherwise
+        """
+        if self.csn_is_low or not self.has_response():
+            return False
+        return not self.busy_time()
+
+    def busy_time(self) -> float:
+        """Time left until the next response is ready, in microseconds."""
+        return self.clock.remaining(result=not self.odata)
+
     def set_next_state(self, state: State) -> None:
         self.current_state = state
 
@@ -103,8 +162,8 @@ def csn_falling_edge_state(fsm: SpiFsm, data: bytes) -> bytes:
 
     # The first byte is GET_RESP, the chip should return a response
     if data[0] == L2IdFieldEnum.GET_RESP:
-        # Sporadically set READY bit to 0 to emulate a busy chip
-        if next(fsm.busy_iter_cyc):
+        # Set READY bit to 0 while the chip is busy
+        if fsm.is_busy():
             fsm.set_next_state(send_no_resp_state)
             return pad(
                 bytes([not L1ChipStatusFlag.READY]),
@@ -145,6 +204,7 @@ def csn_falling_edge_state(fsm: SpiFsm, data: bytes) -> bytes:
         raise RuntimeError("Response buffer not empty.")
 
     # Process the request that was just received
+    fsm.clock.start_processing()
     try:
         responses_ = fsm.process_input_fn(data)
     except ResendLastResponse as exc:
@@ -155,6 +215,7 @@ def csn_falling_edge_state(fsm: SpiFsm, data: bytes) -> bytes:
     else:
         fsm.response_buffer.add(responses_)
         fsm.odata = fsm.response_buffer.next()
+    fsm.clock.end_processing()
 
     fsm.set_next_state(send_init_byte_state)
     return pad(bytes([not L1ChipStatusFlag.READY]), fsm.init_byte, len(data))
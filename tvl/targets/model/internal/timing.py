@@ -0,0 +1,145 @@
+"""Virtual clock emulating the processing latencies of the chip.
+
+The clock of the model is advanced by the waits of the host and, if a
+latency table is set, by the SPI transfers. Each request processed by the
+model is charged the latency of its L2 request: the chip reports itself busy
+until the clock reaches the end of the processing. The result of an L3
+command is only ready once the latency of the command elapsed as well. Runs
+are thus deterministic and do not actually sleep.
+"""
+
+from typing import Any, Dict, Mapping, Optional
+
+from pydantic import BaseModel, Extra, confloat
+
+from .instrumentation import Stage
+
+Latency = confloat(ge=0)  # type: ignore
+
+
+class LatencyTableModel(BaseModel):
+    class Config:
+        extra = Extra.forbid
+
+    l2: Optional[Dict[str, Latency]]  # type: ignore
+    l3: Optional[Dict[str, Latency]]  # type: ignore
+    default_l2: Optional[Latency]  # type: ignore
+    default_l3: Optional[Latency]  # type: ignore
+    spi_byte: Optional[Latency]  # type: ignore
+
+
+class LatencyTable:
+    """Processing latencies of the chip, in microseconds.
+
+    The latencies of the L2 requests and L3 commands are indexed by the name
+    of their class, e.g. `TsL2GetInfoRequest` or `TsL3PingCommand`.
+    """
+
+    def __init__(
+        self,
+        l2: Optional[Mapping[str, float]] = None,
+        l3: Optional[Mapping[str, float]] = None,
+        *,
+        default_l2: float = 0,
+        default_l3: float = 0,
+        spi_byte: float = 0,
+    ) -> None:
+        self.l2 = dict(l2 or {})
+        """Latency of the L2 requests, by name"""
+        self.l3 = dict(l3 or {})
+        """Latency of the L3 commands, by name"""
+        self.default_l2 = default_l2
+        """Latency of the L2 requests missing from `l2`"""
+        self.default_l3 = default_l3
+        """Latency of the L3 commands missing from `l3`"""
+        self.spi_byte = spi_byte
+        """Duration of the transfer of one byte through SPI"""
+
+    def latency(self, stage: str, name: str) -> float:
+        """Latency of a processing stage.
+
+        Args:
+            stage (str): the processing stage
+            name (str): name of the processed item
+
+        Returns:
+            the latency of the L2 request or L3 command, 0 for other stages
+        """
+        if stage == Stage.L2_REQUEST:
+            return self.l2.get(name, self.default_l2)
+        if stage == Stage.L3_COMMAND:
+            return self.l3.get(name, self.default_l3)
+        return 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "l2": self.l2,
+            "l3": self.l3,
+            "default_l2": self.default_l2,
+            "default_l3": self.default_l3,
+            "spi_byte": self.spi_byte,
+        }
+
+    @classmethod
+    def from_dict(cls, __mapping: Mapping[str, Any], /) -> "LatencyTable":
+        return cls(**LatencyTableModel.parse_obj(__mapping).dict(exclude_none=True))
+
+
+class VirtualClock:
+    """Simulated time of the chip, in microseconds"""
+
+    def __init__(self, latencies: Optional[LatencyTable] = None) -> None:
+        self.latencies = latencies
+        """Latencies charged to the clock, busy sequence used if None"""
+        self.now = 0.0
+        """Current time"""
+        self.ready_at = 0.0
+        """End of the processing of the latest request"""
+        self.result_ready_at = 0.0
+        """End of the processing of the L3 command of the latest request"""
+        self._pending_l2 = 0.0
+        self._pending_l3 = 0.0
+
+    def advance(self, usecs: float) -> None:
+        self.now += usecs
+
+    def transfer(self, nb_bytes: int) -> None:
+        """Advance the clock by the duration of an SPI transfer."""
+        if self.latencies is not None:
+            self.now += nb_bytes * self.latencies.spi_byte
+
+    def charge(self, stage: str, name: str) -> None:
+        """Pre hook accumulating the latencies of the stages of a request."""
+        if self.latencies is None:
+            return
+        if stage == Stage.L3_COMMAND:
+            self._pending_l3 += self.latencies.latency(stage, name)
+        else:
+            self._pending_l2 += self.latencies.latency(stage, name)
+
+    def start_processing(self) -> None:
+        self._pending_l2 = self._pending_l3 = 0.0
+
+    def end_processing(self) -> None:
+        """The chip is busy for the latencies charged since the start."""
+        self.ready_at = self.now + self._pending_l2
+        self.result_ready_at = self.ready_at + self._pending_l3
+        self._pending_l2 = self._pending_l3 = 0.0
+
+    def remaining(self, result: bool = False) -> float:
+        """Time left until the end of the processing of the latest request.
+
+        Args:
+            result (bool, optional): time left until the L3 result is ready
+                rather than the first response to the request. Defaults to False.
+        """
+        return max(0.0, (self.result_ready_at if result else self.ready_at) - self.now)
+
+    def is_busy(self, result: bool = False) -> bool:
+        """The chip is still processing the latest request.
+
+        Args:
+            result (bool, optional): check the L3 result is ready rather than
+                the first response to the request. Defaults to False.
+        """
+        return self.remaining(result) > 0
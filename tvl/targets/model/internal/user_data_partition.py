@@ -1,10 +1,14 @@
-from dataclasses import dataclass
 from typing import Dict
 
 from pydantic import BaseModel, StrictBool
 
 from ....typing_utils import SizedBytes
-from .generic_partition import BaseSlot, GenericModel, GenericPartition
+from .generic_partition import (
+    BaseSlot,
+    GenericModel,
+    GenericPartition,
+    slotted_dataclass,
+)
 
 SLOT_SIZE_BYTES = 444
 INIT_VALUE = b"\xFF" * SLOT_SIZE_BYTES
@@ -18,7 +22,7 @@ class SlotAlreadyWrittenError(UserDataError):
     pass
 
 
-@dataclass
+@slotted_dataclass
 class UserDataSlot(BaseSlot):
     """User-data slot"""
 
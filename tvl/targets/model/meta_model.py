@@ -15,8 +15,14 @@ from typing import (
 )
 
 
+class _Instrumentation(Protocol):
+    def call(self, stage: str, name: str, fn: Callable[..., Any], *args: Any) -> Any:
+        ...
+
+
 class HasLogger(Protocol):
     logger: logging.Logger
+    instrumentation: _Instrumentation
 
 
 F = TypeVar("F", bound=Callable[..., Any])
@@ -55,7 +61,7 @@ class MetaModel:
                 setattr(
                     cls,
                     over_name,
-                    _log(_register(base_fn, getattr(cls, over_name), types)),
+                    _log(_register(base_fn, getattr(cls, over_name), types), id_),
                 )
 
 
@@ -109,14 +115,16 @@ def _register(
     return reduce(lambda o, ty: base.register(ty)(o), types, over)
 
 
-def _log(method: F) -> F:
-    """Log the call to the method."""
+def _log(method: F, stage: str) -> F:
+    """Log the call to the method and pass it through the instrumentation."""
 
     @wraps(method)
     def __log_processing(self: HasLogger, request: Any) -> Any:
         self.logger.debug("Executing %s", method.__qualname__)
         try:
-            return method(self, request)
+            return self.instrumentation.call(
+                stage, type(request).__name__, method, self, request
+            )
         except Exception as exc:
             self.logger.info(exc)
             raise
@@ -1,4 +1,4 @@
-from typing import List, Tuple, Type
+from typing import Type
 
 from ...api.l3_api import (
     L3API,
@@ -56,8 +56,6 @@ from .exceptions import (
     L3ProcessingErrorUnauthorized,
 )
 from .internal.configuration_object import (
-    CONFIGURATION_ACCESS_PRIVILEGES,
-    FUNCTIONALITY_ACCESS_PRIVILEGES,
     AddressNotAlignedError,
     AddressOutOfRangeError,
     BitIndexOutOfBoundError,
@@ -85,8 +83,11 @@ from .internal.user_data_partition import SlotAlreadyWrittenError
 
 
 class L3APIImplementation(L3API):
+    def _check_command_access_privileges(self, regname: str) -> None:
+        self.check_access_privileges(*self.access_table.privileges[regname][None])
+
     def ts_l3_ping(self, command: TsL3PingCommand) -> TsL3PingResult:
-        self.check_access_privileges("ping", self.config.cfg_uap_ping.ping)
+        self._check_command_access_privileges("cfg_uap_ping")
         self.logger.debug("ping: %s", command)
 
         result = TsL3PingResult(
@@ -96,13 +97,13 @@ class L3APIImplementation(L3API):
         return result
 
     def _check_pairing_key_slot_access_privileges(
-        self, address: int, access_privileges_list: List[Tuple[str, int]]
+        self, regname: str, address: int
     ) -> None:
-        for name, value in access_privileges_list:
-            if address == int(name.rsplit("_", maxsplit=1)[-1]):
-                self.check_access_privileges(name, value)
-                return
-        raise L3ProcessingErrorUnauthorized(f"Slot index {address=:#06x} out of range.")
+        if (access_privileges := self.access_table.get(regname, address)) is None:
+            raise L3ProcessingErrorUnauthorized(
+                f"Slot index {address=:#06x} out of range."
+            )
+        self.check_access_privileges(*access_privileges)
 
     def ts_l3_pairing_key_write(
         self, command: TsL3PairingKeyWriteCommand
@@ -114,15 +115,9 @@ class L3APIImplementation(L3API):
             raise L3ProcessingErrorUnauthorized(f"Invalid {pkey_slot = }") from None
         self.logger.debug("pkey_slot = %s", pkey_slot)
 
-        config = self.config.cfg_uap_pairing_key_write
         self._check_pairing_key_slot_access_privileges(
+            "cfg_uap_pairing_key_write",
             pkey_slot,
-            [
-                ("write_pkey_slot_0", config.write_pkey_slot_0),
-                ("write_pkey_slot_1", config.write_pkey_slot_1),
-                ("write_pkey_slot_2", config.write_pkey_slot_2),
-                ("write_pkey_slot_3", config.write_pkey_slot_3),
-            ],
         )
 
         s_hipub_bytes = command.s_hipub.to_bytes()
@@ -147,15 +142,9 @@ class L3APIImplementation(L3API):
             raise L3ProcessingErrorUnauthorized(f"Invalid {pkey_slot = }") from None
         self.logger.debug("pkey_slot = %s", pkey_slot)
 
-        config = self.config.cfg_uap_pairing_key_read
         self._check_pairing_key_slot_access_privileges(
+            "cfg_uap_pairing_key_read",
             pkey_slot,
-            [
-                ("read_pkey_slot_0", config.read_pkey_slot_0),
-                ("read_pkey_slot_1", config.read_pkey_slot_1),
-                ("read_pkey_slot_2", config.read_pkey_slot_2),
-                ("read_pkey_slot_3", config.read_pkey_slot_3),
-            ],
         )
 
         try:
@@ -186,15 +175,9 @@ class L3APIImplementation(L3API):
             raise L3ProcessingErrorUnauthorized(f"Invalid {pkey_slot = }") from None
         self.logger.debug("pkey_slot = %s", pkey_slot)
 
-        config = self.config.cfg_uap_pairing_key_invalidate
         self._check_pairing_key_slot_access_privileges(
+            "cfg_uap_pairing_key_invalidate",
             pkey_slot,
-            [
-                ("invalidate_pkey_slot_0", config.invalidate_pkey_slot_0),
-                ("invalidate_pkey_slot_1", config.invalidate_pkey_slot_1),
-                ("invalidate_pkey_slot_2", config.invalidate_pkey_slot_2),
-                ("invalidate_pkey_slot_3", config.invalidate_pkey_slot_3),
-            ],
         )
 
         try:
@@ -206,28 +189,16 @@ class L3APIImplementation(L3API):
         self.logger.debug("Invalidated pairing key in slot #%d.", pkey_slot)
         return TsL3PairingKeyInvalidateResult(result=L3ResultFieldEnum.OK)
 
-    def _check_config_access_privileges(
-        self,
-        address: int,
-        functionality_access_privileges: Tuple[str, int],
-        configuration_access_privileges: Tuple[str, int],
-    ) -> None:
-        if address in FUNCTIONALITY_ACCESS_PRIVILEGES:
-            self.uap_logger.debug("'Functionality' register.")
-            self.check_access_privileges(*functionality_access_privileges)
-        elif address in CONFIGURATION_ACCESS_PRIVILEGES:
-            self.uap_logger.debug("'Configuration' register.")
-            self.check_access_privileges(*configuration_access_privileges)
-        else:
+    def _check_config_access_privileges(self, regname: str, address: int) -> None:
+        if (access_privileges := self.access_table.get(regname, address)) is None:
             self.uap_logger.debug("Not 'functionality' nor 'configuration'.")
+            return
+        self.check_access_privileges(*access_privileges)
 
     def ts_l3_r_config_write(
         self, command: TsL3RConfigWriteCommand
     ) -> TsL3RConfigWriteResult:
-        self.check_access_privileges(
-            "r_config_write_erase",
-            self.config.cfg_uap_r_config_write_erase.r_config_write_erase,
-        )
+        self._check_command_access_privileges("cfg_uap_r_config_write_erase")
 
         address = command.address.value
         self.logger.debug("Register address: %#04x.", address)
@@ -248,11 +219,9 @@ class L3APIImplementation(L3API):
     def ts_l3_r_config_read(
         self, command: TsL3RConfigReadCommand
     ) -> TsL3RConfigReadResult:
-        config = self.config.cfg_uap_r_config_read
         self._check_config_access_privileges(
+            "cfg_uap_r_config_read",
             (address := command.address.value),
-            ("r_config_read_func", config.r_config_read_func),
-            ("r_config_read_cfg", config.r_config_read_cfg),
         )
 
         self.logger.debug("Register address: %#04x.", address)
@@ -270,10 +239,7 @@ class L3APIImplementation(L3API):
     def ts_l3_r_config_erase(
         self, command: TsL3RConfigEraseCommand
     ) -> TsL3RConfigEraseResult:
-        self.check_access_privileges(
-            "r_config_write_erase",
-            self.config.cfg_uap_r_config_write_erase.r_config_write_erase,
-        )
+        self._check_command_access_privileges("cfg_uap_r_config_write_erase")
 
         self.r_config.erase()
 
@@ -283,11 +249,9 @@ class L3APIImplementation(L3API):
     def ts_l3_i_config_write(
         self, command: TsL3IConfigWriteCommand
     ) -> TsL3IConfigWriteResult:
-        config = self.config.cfg_uap_i_config_write
         self._check_config_access_privileges(
+            "cfg_uap_i_config_write",
             (address := command.address.value),
-            ("i_config_write_func", config.i_config_write_func),
-            ("i_config_write_cfg", config.i_config_write_cfg),
         )
 
         self.logger.debug("Register address: %#04x.", address)
@@ -307,11 +271,9 @@ class L3APIImplementation(L3API):
     def ts_l3_i_config_read(
         self, command: TsL3IConfigReadCommand
     ) -> TsL3IConfigReadResult:
-        config = self.config.cfg_uap_i_config_read
         self._check_config_access_privileges(
+            "cfg_uap_i_config_read",
             (address := command.address.value),
-            ("i_config_read_func", config.i_config_read_func),
-            ("i_config_read_cfg", config.i_config_read_cfg),
         )
 
         self.logger.debug("Register address: %#04x.", address)
@@ -328,30 +290,21 @@ class L3APIImplementation(L3API):
 
     def _check_ranged_access_privileges(
         self,
+        regname: str,
         address: int,
-        access_privileges_list: List[Tuple[str, int]],
         *,
         raise_on_failure: Type[Exception] = L3ProcessingErrorFail,
     ) -> None:
-        for name, value in access_privileges_list:
-            lower, upper = map(int, name.rsplit("_", maxsplit=2)[-2:])
-            if lower <= address <= upper:
-                self.check_access_privileges(name, value)
-                return
-        raise raise_on_failure(f"Slot index {address=:#06x} out of range.")
+        if (access_privileges := self.access_table.get(regname, address)) is None:
+            raise raise_on_failure(f"Slot index {address=:#06x} out of range.")
+        self.check_access_privileges(*access_privileges)
 
     def ts_l3_r_mem_data_write(
         self, command: TsL3RMemDataWriteCommand
     ) -> TsL3RMemDataWriteResult:
-        config = self.config.cfg_uap_r_mem_data_write
         self._check_ranged_access_privileges(
+            "cfg_uap_r_mem_data_write",
             (address := command.udata_slot.value),
-            [
-                ("write_udata_slot_0_127", config.write_udata_slot_0_127),
-                ("write_udata_slot_128_255", config.write_udata_slot_128_255),
-                ("write_udata_slot_256_383", config.write_udata_slot_256_383),
-                ("write_udata_slot_384_511", config.write_udata_slot_384_511),
-            ],
             raise_on_failure=L3ProcessingErrorUnauthorized,
         )
 
@@ -372,15 +325,9 @@ class L3APIImplementation(L3API):
     def ts_l3_r_mem_data_read(
         self, command: TsL3RMemDataReadCommand
     ) -> TsL3RMemDataReadResult:
-        config = self.config.cfg_uap_r_mem_data_read
         self._check_ranged_access_privileges(
+            "cfg_uap_r_mem_data_read",
             (address := command.udata_slot.value),
-            [
-                ("read_udata_slot_0_127", config.read_udata_slot_0_127),
-                ("read_udata_slot_128_255", config.read_udata_slot_128_255),
-                ("read_udata_slot_256_383", config.read_udata_slot_256_383),
-                ("read_udata_slot_384_511", config.read_udata_slot_384_511),
-            ],
             raise_on_failure=L3ProcessingErrorUnauthorized,
         )
 
@@ -393,15 +340,9 @@ class L3APIImplementation(L3API):
     def ts_l3_r_mem_data_erase(
         self, command: TsL3RMemDataEraseCommand
     ) -> TsL3RMemDataEraseResult:
-        config = self.config.cfg_uap_r_mem_data_erase
         self._check_ranged_access_privileges(
+            "cfg_uap_r_mem_data_erase",
             (address := command.udata_slot.value),
-            [
-                ("erase_udata_slot_0_127", config.erase_udata_slot_0_127),
-                ("erase_udata_slot_128_255", config.erase_udata_slot_128_255),
-                ("erase_udata_slot_256_383", config.erase_udata_slot_256_383),
-                ("erase_udata_slot_384_511", config.erase_udata_slot_384_511),
-            ],
             raise_on_failure=L3ProcessingErrorUnauthorized,
         )
 
@@ -414,10 +355,7 @@ class L3APIImplementation(L3API):
     def ts_l3_random_value_get(
         self, command: TsL3RandomValueGetCommand
     ) -> TsL3RandomValueGetResult:
-        self.check_access_privileges(
-            "random_value_get",
-            self.config.cfg_uap_random_value_get.random_value_get,
-        )
+        self._check_command_access_privileges("cfg_uap_random_value_get")
 
         n_bytes = command.n_bytes.value
         self.logger.debug("Number of random bytes: %d.", n_bytes)
@@ -431,15 +369,9 @@ class L3APIImplementation(L3API):
     def ts_l3_mcounter_init(
         self, command: TsL3McounterInitCommand
     ) -> TsL3McounterInitResult:
-        config = self.config.cfg_uap_mcounter_init
         self._check_ranged_access_privileges(
+            "cfg_uap_mcounter_init",
             (index := command.mcounter_index.value),
-            [
-                ("mcounter_init_0_3", config.mcounter_init_0_3),
-                ("mcounter_init_4_7", config.mcounter_init_4_7),
-                ("mcounter_init_8_11", config.mcounter_init_8_11),
-                ("mcounter_init_12_15", config.mcounter_init_12_15),
-            ],
             raise_on_failure=L3ProcessingErrorUnauthorized,
         )
 
@@ -456,15 +388,9 @@ class L3APIImplementation(L3API):
     def ts_l3_mcounter_update(
         self, command: TsL3McounterUpdateCommand
     ) -> TsL3McounterUpdateResult:
-        config = self.config.cfg_uap_mcounter_update
         self._check_ranged_access_privileges(
+            "cfg_uap_mcounter_update",
             (index := command.mcounter_index.value),
-            [
-                ("mcounter_update_0_3", config.mcounter_update_0_3),
-                ("mcounter_update_4_7", config.mcounter_update_4_7),
-                ("mcounter_update_8_11", config.mcounter_update_8_11),
-                ("mcounter_update_12_15", config.mcounter_update_12_15),
-            ],
             raise_on_failure=L3ProcessingErrorUnauthorized,
         )
 
@@ -488,15 +414,9 @@ class L3APIImplementation(L3API):
     def ts_l3_mcounter_get(
         self, command: TsL3McounterGetCommand
     ) -> TsL3McounterGetResult:
-        config = self.config.cfg_uap_mcounter_get
         self._check_ranged_access_privileges(
+            "cfg_uap_mcounter_get",
             (index := command.mcounter_index.value),
-            [
-                ("mcounter_get_0_3", config.mcounter_get_0_3),
-                ("mcounter_get_4_7", config.mcounter_get_4_7),
-                ("mcounter_get_8_11", config.mcounter_get_8_11),
-                ("mcounter_get_12_15", config.mcounter_get_12_15),
-            ],
             raise_on_failure=L3ProcessingErrorUnauthorized,
         )
 
@@ -516,15 +436,9 @@ class L3APIImplementation(L3API):
     def ts_l3_ecc_key_generate(
         self, command: TsL3EccKeyGenerateCommand
     ) -> TsL3EccKeyGenerateResult:
-        config = self.config.cfg_uap_ecc_key_generate
         self._check_ranged_access_privileges(
+            "cfg_uap_ecc_key_generate",
             (slot := command.slot.value),
-            [
-                ("gen_ecckey_slot_0_7", config.gen_ecckey_slot_0_7),
-                ("gen_ecckey_slot_8_15", config.gen_ecckey_slot_8_15),
-                ("gen_ecckey_slot_16_23", config.gen_ecckey_slot_16_23),
-                ("gen_ecckey_slot_24_31", config.gen_ecckey_slot_24_31),
-            ],
             raise_on_failure=L3ProcessingErrorUnauthorized,
         )
 
@@ -545,15 +459,9 @@ class L3APIImplementation(L3API):
     def ts_l3_ecc_key_store(
         self, command: TsL3EccKeyStoreCommand
     ) -> TsL3EccKeyStoreResult:
-        config = self.config.cfg_uap_ecc_key_store
         self._check_ranged_access_privileges(
+            "cfg_uap_ecc_key_store",
             (slot := command.slot.value),
-            [
-                ("store_ecckey_slot_0_7", config.store_ecckey_slot_0_7),
-                ("store_ecckey_slot_8_15", config.store_ecckey_slot_8_15),
-                ("store_ecckey_slot_16_23", config.store_ecckey_slot_16_23),
-                ("store_ecckey_slot_24_31", config.store_ecckey_slot_24_31),
-            ],
             raise_on_failure=L3ProcessingErrorUnauthorized,
         )
 
@@ -563,7 +471,6 @@ class L3APIImplementation(L3API):
         except ValueError as exc:
             raise L3ProcessingErrorFail(exc) from None
 
-
         try:
             self.r_ecc_keys.store(slot, curve, command.k.to_bytes())
         except (ECCKeyExistsInSlotError, ECCKeySetupError) as exc:
@@ -575,15 +482,9 @@ class L3APIImplementation(L3API):
     def ts_l3_ecc_key_read(
         self, command: TsL3EccKeyReadCommand
     ) -> TsL3EccKeyReadResult:
-        config = self.config.cfg_uap_ecc_key_read
         self._check_ranged_access_privileges(
+            "cfg_uap_ecc_key_read",
             (slot := command.slot.value),
-            [
-                ("read_ecckey_slot_0_7", config.read_ecckey_slot_0_7),
-                ("read_ecckey_slot_8_15", config.read_ecckey_slot_8_15),
-                ("read_ecckey_slot_16_23", config.read_ecckey_slot_16_23),
-                ("read_ecckey_slot_24_31", config.read_ecckey_slot_24_31),
-            ],
             raise_on_failure=L3ProcessingErrorUnauthorized,
         )
 
@@ -612,15 +513,9 @@ class L3APIImplementation(L3API):
     def ts_l3_ecc_key_erase(
         self, command: TsL3EccKeyEraseCommand
     ) -> TsL3EccKeyEraseResult:
-        config = self.config.cfg_uap_ecc_key_erase
         self._check_ranged_access_privileges(
+            "cfg_uap_ecc_key_erase",
             (slot := command.slot.value),
-            [
-                ("erase_ecckey_slot_0_7", config.erase_ecckey_slot_0_7),
-                ("erase_ecckey_slot_8_15", config.erase_ecckey_slot_8_15),
-                ("erase_ecckey_slot_16_23", config.erase_ecckey_slot_16_23),
-                ("erase_ecckey_slot_24_31", config.erase_ecckey_slot_24_31),
-            ],
             raise_on_failure=L3ProcessingErrorUnauthorized,
         )
 
@@ -631,15 +526,9 @@ class L3APIImplementation(L3API):
         return TsL3EccKeyEraseResult(result=L3ResultFieldEnum.OK)
 
     def ts_l3_ecdsa_sign(self, command: TsL3EcdsaSignCommand) -> TsL3EcdsaSignResult:
-        config = self.config.cfg_uap_ecdsa_sign
         self._check_ranged_access_privileges(
+            "cfg_uap_ecdsa_sign",
             (slot := command.slot.value),
-            [
-                ("ecdsa_ecckey_slot_0_7", config.ecdsa_ecckey_slot_0_7),
-                ("ecdsa_ecckey_slot_8_15", config.ecdsa_ecckey_slot_8_15),
-                ("ecdsa_ecckey_slot_16_23", config.ecdsa_ecckey_slot_16_23),
-                ("ecdsa_ecckey_slot_24_31", config.ecdsa_ecckey_slot_24_31),
-            ],
             raise_on_failure=L3ProcessingErrorUnauthorized,
         )
 
@@ -671,15 +560,9 @@ class L3APIImplementation(L3API):
         return TsL3EcdsaSignResult(result=L3ResultFieldEnum.OK, r=r, s=s)
 
     def ts_l3_eddsa_sign(self, command: TsL3EddsaSignCommand) -> TsL3EddsaSignResult:
-        config = self.config.cfg_uap_eddsa_sign
         self._check_ranged_access_privileges(
+            "cfg_uap_eddsa_sign",
             (slot := command.slot.value),
-            [
-                ("eddsa_ecckey_slot_0_7", config.eddsa_ecckey_slot_0_7),
-                ("eddsa_ecckey_slot_8_15", config.eddsa_ecckey_slot_8_15),
-                ("eddsa_ecckey_slot_16_23", config.eddsa_ecckey_slot_16_23),
-                ("eddsa_ecckey_slot_24_31", config.eddsa_ecckey_slot_24_31),
-            ],
             raise_on_failure=L3ProcessingErrorUnauthorized,
         )
 
@@ -711,15 +594,9 @@ class L3APIImplementation(L3API):
     def ts_l3_mac_and_destroy(
         self, command: TsL3MacAndDestroyCommand
     ) -> TsL3MacAndDestroyResult:
-        config = self.config.cfg_uap_mac_and_destroy
         self._check_ranged_access_privileges(
+            "cfg_uap_mac_and_destroy",
             (slot := command.slot.value),
-            [
-                ("macandd_0_31", config.macandd_0_31),
-                ("macandd_32_63", config.macandd_32_63),
-                ("macandd_64_95", config.macandd_64_95),
-                ("macandd_96_127", config.macandd_96_127),
-            ],
             raise_on_failure=L3ProcessingErrorUnauthorized,
         )
         self.logger.info("Executing Mac-and-Destroy sequence.")
@@ -742,6 +619,4 @@ class L3APIImplementation(L3API):
 
         data_out = f2.compute()
         self.logger.debug("Data_out: %s", data_out)
-        return TsL3MacAndDestroyResult(
-            result=L3ResultFieldEnum.OK, data_out=data_out
-        )
+        return TsL3MacAndDestroyResult(result=L3ResultFieldEnum.OK, data_out=data_out)